@@ -3,23 +3,58 @@ from tkinter import ttk, messagebox, scrolledtext, filedialog, simpledialog
 import requests
 import json
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
-from datetime import datetime
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 import base64
 import os
-from PIL import Image, ImageTk
 import io
-import webbrowser
 import re
 import time
+import sqlite3
 import keyring
+import types
 import logging
+import mimetypes
+from bisect import bisect_right
+from functools import lru_cache, partial
 from license_validator import LicenseValidator
 from reminder_manager import ReminderManager
 from ai_summary_dialog import show_ai_summary
 from ai_settings_dialog import show_ai_settings
 from comment_monitor import CommentMonitor
 
+# Optional faster JSON library - falls back to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional streaming multipart encoder - without it requests builds each upload body in memory
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    MULTIPART_STREAMING = True
+except ImportError:
+    MULTIPART_STREAMING = False
+
+
+def json_loads(data):
+    """Decode JSON from bytes/str, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Encode an object to JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 # Setup logging for enhanced version
 log_dir = os.path.dirname(os.path.abspath(__file__))
 log_file = os.path.join(log_dir, 'jira_debug.log')
@@ -36,37 +71,202 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Per-user data directory, so settings and caches persist across different app locations
+APP_DATA_DIR = os.path.expanduser("~/.jira_ticket_viewer")
+os.makedirs(APP_DATA_DIR, exist_ok=True)
+SETTINGS_FILE = os.path.join(APP_DATA_DIR, 'jira_basic_settings.json')
+# Where older versions kept settings (next to the script); migrated on first load
+LEGACY_SETTINGS_FILE = os.path.join(log_dir, 'jira_basic_settings.json')
+
+# Dark mode colour palette shared by ttk styles and plain Tk widgets
+PALETTE = types.SimpleNamespace(
+    bg_primary='#1a1a1a',
+    bg_input='#2d2d2d',
+    accent='#0078d4',
+    accent_hover='#106ebe',
+    text='#ffffff',
+    text_secondary='#cccccc',
+    text_hint='#888888',
+    sla_bg='#4a2828', sla_fg='#ff9999',
+    critical_bg='#3d1a1a', critical_fg='#ff6b6b',
+    high_bg='#3d2a1a', high_fg='#ffa726',
+)
+
+# Response cache TTLs in seconds, matched by endpoint prefix (GET only)
+CACHE_POLICY = {'search': 10, 'issue/': 30, 'user': 300}
+# How long an expired response is kept around as a fallback when Jira is unreachable
+CACHE_STALE_SECONDS = 24 * 3600
+
+# Ticket list paging - page size asked for per search request (Jira may cap it lower) and overall cap
+SEARCH_PAGE_SIZE = 500
+MAX_TICKETS = 1000
+
+# Read buffer for attachment uploads - big reads keep syscalls per MB low
+UPLOAD_READ_BUFFER = 1024 * 1024
+
+# Screenshots up to this many pixels are pasted as uncompressed PNG (fastest encode); bigger ones get level 1
+SCREENSHOT_RAW_PNG_PIXELS = 1_000_000
+
+# Rows inserted into the ticket tree at a time; more are added as the user scrolls down
+TREE_RENDER_BATCH = 200
+
+# Delay before a filter change is applied, so rapid toggles only filter once (ms)
+FILTER_DEBOUNCE_MS = 150
+# Pause in typing before the search box filters the list (ms)
+SEARCH_DEBOUNCE_MS = 150
+
+# Jira timestamp format, e.g. 2024-01-15T10:30:00.000+0000
+JIRA_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+
+# Statuses that count as finished work (no SLA highlighting)
+COMPLETED_STATUSES = frozenset({'done', 'closed', 'resolved', 'complete', 'completed', 'finished'})
+_STATUS_WORD_RE = re.compile(r'\W+')
+
+# Email addresses mentioned anywhere in a ticket (used when creating reminders)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Transition names used by the resolve/close/reopen buttons
+_RESOLVE_TRANSITION_RE = re.compile(r'resolve|done', re.IGNORECASE)
+_CLOSE_TRANSITION_RE = re.compile(r'close|done|complete', re.IGNORECASE)
+_OPEN_TRANSITION_RE = re.compile(r'open|start', re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def is_completed_status(status_name):
+    """Check a lowercase status name against COMPLETED_STATUSES (e.g. "closed - won't do")"""
+    return status_name in COMPLETED_STATUSES or not COMPLETED_STATUSES.isdisjoint(_STATUS_WORD_RE.split(status_name))
+
+
+def _dig(data, path, default):
+    """Walk nested dicts along path, returning default on any missing/None step"""
+    for part in path:
+        data = data.get(part) if isinstance(data, dict) else None
+        if data is None:
+            return default
+    return data
+
+
+# (column, path into the issue, default) for each treeview row value
+_FIELD_SPECS = (
+    ('key', ('key',), 'Unknown'),
+    ('priority', ('fields', 'priority', 'name'), 'Unknown'),
+    ('summary', ('fields', 'summary'), 'No summary'),
+    ('status', ('fields', 'status', 'name'), 'Unknown'),
+    ('assignee', ('fields', 'assignee', 'displayName'), 'Unassigned'),
+    ('reporter', ('fields', 'reporter', 'displayName'), 'Unknown'),
+    ('created', ('fields', 'created'), ''),
+)
+
+_PRIORITY_SYMBOLS = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🔵'}
+_PRIORITY_SORT_ORDER = {'🔴': 0, '🟠': 1, '🟡': 2, '🔵': 3, '⚪': 4}
+# Treeview tags per highlight style (see style_tag_for) - one shared tuple per style, not one per row
+_ROW_TAGS = {None: (), 'sla_missed': ('sla_missed',), 'critical': ('critical',), 'high': ('high',)}
+
+# Treeview column order (matches the values tuple from build_ticket_row)
+TREE_COLUMNS = ("Key", "Priority", "Summary", "Status", "Assignee", "Reporter", "Age")
+
+
+def char_mask(text):
+    """Bitmask of the characters in text (bucketed by ord & 255) for quick can't-match checks"""
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 255)
+    return mask
+
+
+def find_rows_containing(joined, starts, needle):
+    """Row positions whose text contains needle, given the rows joined by '\\x1e' and each row's start offset"""
+    # One str.find sweep in C over all rows; after a hit, skip straight to the next row
+    rows = []
+    pos = joined.find(needle)
+    while pos >= 0:
+        row = bisect_right(starts, pos) - 1
+        rows.append(row)
+        if row + 1 >= len(starts):
+            break
+        pos = joined.find(needle, starts[row + 1])
+    return rows
+
+
+# Start/leave date phrases looked for in onboarding/offboarding tickets (text is lowercased first)
+_TICKET_DATE_PATTERNS = tuple(re.compile(p) for p in (
+    r'starts?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',  # "starts on 15/09/2024"
+    r'start\s+date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',      # "start date: 15/09/2024"
+    r'begin[s]?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', # "begins on 15/09/2024"
+    r'leaves?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',   # "leaves on 20/09/2024"
+    r'last\s+day:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',        # "last day: 20/09/2024"
+    r'finish[es]?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', # "finishes on 20/09/2024"
+    r'end[s]?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',   # "ends on 20/09/2024"
+))
+
+
+# Load the MIME tables once up front instead of on the first upload
+mimetypes.init()
+
+
+@lru_cache(maxsize=256)
+def mime_type_for_ext(ext):
+    """Content type for a lowercase file extension like '.png'"""
+    return mimetypes.types_map.get(ext) or 'application/octet-stream'
+
+
+@lru_cache(maxsize=1024)
+def age_to_hours(age_str):
+    """Convert an age label like 5h/3d/2w to hours for sorting"""
+    try:
+        if age_str.endswith('h'):
+            return int(age_str[:-1])
+        elif age_str.endswith('d'):
+            return int(age_str[:-1]) * 24
+        elif age_str.endswith('w'):
+            return int(age_str[:-1]) * 168
+    except ValueError:
+        pass
+    return 999999
+
+
+@lru_cache(maxsize=2048)
+def format_age(age_hours):
+    """Turn a whole number of hours into the Age column label"""
+    if age_hours < 24:
+        return f"{age_hours}h"
+    elif age_hours < 168:
+        return f"{age_hours // 24}d"
+    return f"{age_hours // 168}w"
+
+
+def format_jira_timestamp(value):
+    """Show a Jira timestamp as YYYY-MM-DD HH:MM by slicing the ISO string"""
+    if len(value) >= 16 and value[4] == '-' and value[10] == 'T':
+        return f"{value[:10]} {value[11:16]}"
+    return value
+
+
+def created_timestamp(value):
+    """Epoch seconds for a Jira timestamp, or None if missing/unparseable"""
+    if not value:
+        return None
+    try:
+        return parse_jira_datetime(value).timestamp()
+    except ValueError:
+        return None
+
+
+def parse_jira_datetime(value):
+    """Parse a Jira timestamp, falling back to ISO parsing for odd formats"""
+    try:
+        return datetime.strptime(value, JIRA_DATETIME_FORMAT)
+    except ValueError:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# SLA window in hours - 4 days for all priorities
+SLA_HOURS = 96
+
 class JiraTicketViewer:
     def __init__(self, root):
         self.root = root
         self.root.title("Jira Ticket Viewer - Enhanced Edition")
-        
-        # Maximize window to full screen
-        self.root.state('zoomed')  # Windows maximization
-        
-        # Alternative for other platforms
-        try:
-            self.root.attributes('-zoomed', True)  # Linux
-        except:
-            try:
-                self.root.attributes('-fullscreen', False)  # macOS
-            except:
-                self.root.geometry("1920x1080")  # Fallback
-        
-        # Set minimum size
-        self.root.minsize(1200, 800)
-
-        # Maximize window on startup
-        try:
-            # For Windows
-            self.root.state('zoomed')
-        except:
-            try:
-                # For Linux
-                self.root.attributes('-zoomed', True)
-            except:
-                # Fallback - set to large size
-                self.root.geometry("1600x900")
+        self._configure_window_state()
         
         # Initialize state variables
         self.selected_ticket = None
@@ -78,6 +278,8 @@ class JiraTicketViewer:
         self.api_token = ""
         self.project_key = ""
         self.user_email = ""
+        # (email, token) last read from / written to the credential store - keyring calls are slow on Windows
+        self._keyring_credentials = None
         
         # Issue types
         self.issue_types = {
@@ -85,6 +287,40 @@ class JiraTicketViewer:
             "[System] Service request": "11396"
         }
         
+        # Shared HTTP session (keeps connections alive between API calls)
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        # Enough pooled connections for the worker pool; timeouts and 5xx retries stay in make_jira_request,
+        # the adapter only redials failed connects (nothing has been sent yet, so this is safe for POST too)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Worker pool for independent API calls that can run side by side
+        self.http_pool = ThreadPoolExecutor(max_workers=8)
+        
+        # Single long-lived worker for ticket list loads; the token marks the newest request
+        self._jobs = queue.Queue()
+        self._load_token = None
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        
+        # On-disk response cache (see CACHE_POLICY)
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
+        
+        # Pending debounced filter pass (see schedule_filter)
+        self._filter_after_id = None
+        # Pending search-as-you-type pass and the search text it was scheduled for
+        self._search_after_id = None
+        self._search_text_seen = ''
+        
+        # Ticket key -> SLA missed, worked out once per load (see update_ticket_list)
+        self._sla_cache = {}
+        
+        # Account lookups for assignment: user email / name -> (accountId, displayName)
+        self._account_by_user = {}
+        
         # Initialize license validator (customer version - cannot generate licenses)
         self.license_manager = LicenseValidator()
         
@@ -106,14 +342,29 @@ class JiraTicketViewer:
         # Check license status after UI is ready
         self.root.after(100, self.check_license_on_startup)
 
-        # Auto-load tickets on startup
+        # Show the last known ticket list right away, then auto-load fresh tickets
+        self.root.after_idle(self.show_cached_tickets)
         self.root.after(1000, self.load_all_tickets_threaded)
 
         # Start comment monitoring after tickets are loaded (disabled)
         # self.root.after(5000, self.comment_monitor.start_monitoring)
     
+    def _configure_window_state(self):
+        """Maximize the main window with whatever the platform supports"""
+        try:
+            self.root.state('zoomed')  # Windows / X11
+        except tk.TclError:
+            try:
+                self.root.attributes('-zoomed', True)  # Older Linux Tk
+            except tk.TclError:
+                self.root.geometry("1600x900")  # Fallback - set to large size
+        self.root.minsize(1200, 800)
+
     def show_copyable_error(self, title, message):
-        """Show error dialog with copyable text"""
+        """Show error dialog with copyable text (safe to call from worker threads)"""
+        if threading.current_thread() is not threading.main_thread():
+            self.root.after(0, self.show_copyable_error, title, message)
+            return
         error_window = tk.Toplevel(self.root)
         error_window.title(title)
         error_window.geometry("600x400")
@@ -161,12 +412,14 @@ class JiraTicketViewer:
             self.project_key = basic_settings.get('project_key', self.project_key)
             self.user_email = basic_settings.get('user_email', self.user_email)
             
-            # Load sensitive API token from Windows Credential Manager
-            if self.user_email:
+            # Load sensitive API token from Windows Credential Manager (once per email)
+            known = self._keyring_credentials
+            if self.user_email and (known is None or known[0] != self.user_email):
                 try:
                     stored_token = keyring.get_password("JiraTicketViewer", self.user_email)
                     if stored_token:
                         self.api_token = stored_token
+                    self._keyring_credentials = (self.user_email, stored_token)
                 except Exception as e:
                     print(f"Could not load stored token: {e}")
                     
@@ -175,37 +428,32 @@ class JiraTicketViewer:
 
     def _load_basic_settings(self):
         """Load non-sensitive settings from file"""
-        import json
-        import os
-        
-        # Use user's AppData directory so settings persist across different app locations
-        app_data = os.path.expanduser("~/.jira_ticket_viewer")
-        if not os.path.exists(app_data):
-            os.makedirs(app_data, exist_ok=True)
-        
-        settings_file = os.path.join(app_data, 'jira_basic_settings.json')
-        
-        # Try new location first, then fallback to old location for migration
-        if not os.path.exists(settings_file):
-            old_settings_file = os.path.join(os.path.dirname(__file__), 'jira_basic_settings.json')
-            if os.path.exists(old_settings_file):
-                # Migrate old settings to new location
-                try:
-                    with open(old_settings_file, 'r') as f:
-                        data = json.load(f)
-                    with open(settings_file, 'w') as f:
-                        json.dump(data, f, indent=2)
-                    print(f"Migrated settings to: {settings_file}")
-                except Exception as e:
-                    print(f"Error migrating settings: {e}")
-        
         try:
-            if os.path.exists(settings_file):
-                with open(settings_file, 'r') as f:
-                    return json.load(f)
+            with open(SETTINGS_FILE, 'rb') as f:
+                return json_loads(f.read())
+        except FileNotFoundError:
+            return self._migrate_legacy_settings()
         except Exception as e:
             print(f"Error loading basic settings: {e}")
         return {}
+
+    def _migrate_legacy_settings(self):
+        """Copy settings from the old next-to-the-script location, if there are any"""
+        try:
+            with open(LEGACY_SETTINGS_FILE, 'rb') as f:
+                data = json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error migrating settings: {e}")
+            return {}
+        try:
+            with open(SETTINGS_FILE, 'w') as f:
+                json.dump(data, f, indent=2)
+            print(f"Migrated settings to: {SETTINGS_FILE}")
+        except Exception as e:
+            print(f"Error migrating settings: {e}")
+        return data
             
     def save_user_settings(self):
         """Save user settings securely"""
@@ -217,20 +465,16 @@ class JiraTicketViewer:
                 'user_email': self.user_email
             }
             
-            # Use user's AppData directory so settings persist across different app locations
-            app_data = os.path.expanduser("~/.jira_ticket_viewer")
-            if not os.path.exists(app_data):
-                os.makedirs(app_data, exist_ok=True)
-            
-            settings_file = os.path.join(app_data, 'jira_basic_settings.json')
-            with open(settings_file, 'w') as f:
+            with open(SETTINGS_FILE, 'w') as f:
                 json.dump(basic_settings, f, indent=2)
                 
-            print(f"Settings saved to: {settings_file}")
+            print(f"Settings saved to: {SETTINGS_FILE}")
             
-            # Save sensitive API token to Windows Credential Manager
-            if self.user_email and self.api_token:
+            # Save sensitive API token to Windows Credential Manager (skipped when it already holds it)
+            credentials = (self.user_email, self.api_token)
+            if self.user_email and self.api_token and credentials != self._keyring_credentials:
                 keyring.set_password("JiraTicketViewer", self.user_email, self.api_token)
+                self._keyring_credentials = credentials
                 
             return True
         except Exception as e:
@@ -242,19 +486,13 @@ class JiraTicketViewer:
         style = ttk.Style()
         style.theme_use('clam')
         
-        # Modern colors
-        bg_primary = '#1a1a1a'
-        bg_button = '#0078d4'
-        bg_button_hover = '#106ebe'
-        text_primary = '#ffffff'
-        
-        style.configure('TFrame', background=bg_primary)
-        style.configure('TLabel', background=bg_primary, foreground=text_primary)
-        style.configure('TButton', background=bg_button, foreground=text_primary, borderwidth=0, 
+        style.configure('TFrame', background=PALETTE.bg_primary)
+        style.configure('TLabel', background=PALETTE.bg_primary, foreground=PALETTE.text)
+        style.configure('TButton', background=PALETTE.accent, foreground=PALETTE.text, borderwidth=0, 
                        focuscolor='none', relief='flat', padding=(12, 8))
-        style.map('TButton', background=[('active', bg_button_hover)])
+        style.map('TButton', background=[('active', PALETTE.accent_hover)])
         
-        self.root.configure(bg=bg_primary)
+        self.root.configure(bg=PALETTE.bg_primary)
 
     def setup_ui(self):
         """Setup enhanced UI with all features"""
@@ -281,6 +519,7 @@ class JiraTicketViewer:
         self.search_entry = ttk.Entry(search_container, width=40, font=('Segoe UI', 11))
         self.search_entry.pack(side=tk.LEFT, padx=(0, 10))
         self.search_entry.bind('<Return>', self.search_tickets)
+        self.search_entry.bind('<KeyRelease>', self.schedule_search)
         self.search_entry.insert(0, "🔍 Search tickets...")
         self.search_entry.bind('<FocusIn>', self.on_search_focus)
         self.search_entry.bind('<FocusOut>', self.on_search_unfocus)
@@ -325,11 +564,11 @@ class JiraTicketViewer:
         self.ticket_filter_combo = ttk.Combobox(filter_frame, textvariable=self.ticket_filter_var, width=15,
                                                values=["My Tickets", "All Open", "Unassigned", "All Tickets"])
         self.ticket_filter_combo.pack(side=tk.LEFT, padx=(0, 15))
-        self.ticket_filter_combo.bind("<<ComboboxSelected>>", self.filter_tickets)
+        self.ticket_filter_combo.bind("<<ComboboxSelected>>", self.schedule_filter)
         
         self.hide_completed_var = tk.BooleanVar(value=True)
         self.hide_completed_cb = ttk.Checkbutton(filter_frame, text="Hide Completed", 
-                                               variable=self.hide_completed_var, command=self.filter_tickets)
+                                               variable=self.hide_completed_var, command=self.schedule_filter)
         self.hide_completed_cb.pack(side=tk.LEFT, padx=(15, 0))
         
         # User info
@@ -345,7 +584,7 @@ class JiraTicketViewer:
         self.status_label = ttk.Label(status_frame, text="Ready to load tickets...", font=('Segoe UI', 9))
         self.status_label.pack(side=tk.LEFT)
         
-        self.refresh_btn = ttk.Button(status_frame, text="🔄", width=3, command=self.load_all_tickets_threaded)
+        self.refresh_btn = ttk.Button(status_frame, text="🔄", width=3, command=self.refresh_tickets)
         self.refresh_btn.pack(side=tk.RIGHT)
         
         # Main content
@@ -362,7 +601,7 @@ class JiraTicketViewer:
         tickets_frame.columnconfigure(0, weight=1)
         
         # Ticket tree - remove fixed height to allow full expansion
-        columns = ("Key", "Priority", "Summary", "Status", "Assignee", "Reporter", "Age")
+        columns = TREE_COLUMNS
         self.tree = ttk.Treeview(tickets_frame, columns=columns, show="headings")
         
         # Column configuration
@@ -389,19 +628,20 @@ class JiraTicketViewer:
         
         # Add sorting functionality to all columns
         for col in columns:
-            self.tree.heading(col, command=lambda c=col: self.sort_treeview(c))
+            self.tree.heading(col, command=partial(self.sort_treeview, col))
         
         # Scrollbar
         tree_scrollbar = ttk.Scrollbar(tickets_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=tree_scrollbar.set)
+        self.tree_scrollbar = tree_scrollbar
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
         
         self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         tree_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
         # Visual tags
-        self.tree.tag_configure('sla_missed', background='#4a2828', foreground='#ff9999')
-        self.tree.tag_configure('critical', background='#3d1a1a', foreground='#ff6b6b')
-        self.tree.tag_configure('high', background='#3d2a1a', foreground='#ffa726')
+        self.tree.tag_configure('sla_missed', background=PALETTE.sla_bg, foreground=PALETTE.sla_fg)
+        self.tree.tag_configure('critical', background=PALETTE.critical_bg, foreground=PALETTE.critical_fg)
+        self.tree.tag_configure('high', background=PALETTE.high_bg, foreground=PALETTE.high_fg)
         
         # Right panel
         right_panel = ttk.Frame(content_frame)
@@ -436,7 +676,7 @@ class JiraTicketViewer:
         details_frame.columnconfigure(0, weight=1)
         
         self.details_text = scrolledtext.ScrolledText(details_frame, width=40, height=15, wrap=tk.WORD,
-                                                    bg='#2d2d2d', fg='#ffffff', font=('Segoe UI', 10), state='disabled')
+                                                    bg=PALETTE.bg_input, fg=PALETTE.text, font=('Segoe UI', 10), state='disabled')
         self.details_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Comment area
@@ -445,7 +685,7 @@ class JiraTicketViewer:
         comment_frame.columnconfigure(0, weight=1)
         
         self.comment_entry = scrolledtext.ScrolledText(comment_frame, height=4, wrap=tk.WORD,
-                                                     bg='#2d2d2d', fg='#ffffff', font=('Segoe UI', 10))
+                                                     bg=PALETTE.bg_input, fg=PALETTE.text, font=('Segoe UI', 10))
         self.comment_entry.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
         
         comment_buttons = ttk.Frame(comment_frame)
@@ -499,26 +739,6 @@ class JiraTicketViewer:
         if self.current_ticket:
             self.load_ticket_details(load_comments=True)
 
-    def setup_events(self):
-        """Setup events"""
-        self.tree.bind('<<TreeviewSelect>>', self.on_ticket_select)
-        self.tree.bind('<Double-1>', self.on_ticket_double_click)
-        self.tree.bind('<Button-3>', self.on_ticket_right_click)
-        
-        # Setup context menu
-        self.setup_context_menu()
-        
-        # Grid weights
-        main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(3, weight=1)
-        
-        # Keyboard shortcuts
-        self.setup_keyboard_shortcuts()
-        
-        # Aliases for compatibility
-        self.comment_text = self.comment_entry
-        self.comments_text = self.details_text
-
     def setup_context_menu(self):
         """Setup right-click context menu"""
         self.context_menu = tk.Menu(self.root, tearoff=0)
@@ -542,8 +762,8 @@ class JiraTicketViewer:
 
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
-        self.root.bind('<Control-r>', lambda e: self.load_all_tickets_threaded())
-        self.root.bind('<F5>', lambda e: self.load_all_tickets_threaded())
+        self.root.bind('<Control-r>', lambda e: self.refresh_tickets())
+        self.root.bind('<F5>', lambda e: self.refresh_tickets())
         self.root.bind('<Control-f>', lambda e: self.search_entry.focus_set())
 
     def on_search_focus(self, event):
@@ -576,42 +796,180 @@ class JiraTicketViewer:
 
     def is_sla_missed(self, issue):
         """Check if ticket missed SLA"""
+        key = issue.get('key')
+        if key in self._sla_cache:
+            return self._sla_cache[key]
+        return self._compute_sla(issue)
+
+    def _compute_sla(self, issue, now_utc=None):
+        """Work out SLA state for a single ticket (cached per load); pass now_utc when checking many"""
         fields = issue.get('fields', {})
         created = fields.get('created', '')
         status = fields.get('status', {})
         status_name = status.get('name', '').lower() if status else ''
-        priority = fields.get('priority', {})
-        priority_name = priority.get('name', '').lower() if priority else ''
         
         # Don't highlight completed tickets
-        completed_statuses = ['done', 'closed', 'resolved', 'complete', 'completed', 'finished']
-        if any(comp_status in status_name for comp_status in completed_statuses):
+        if is_completed_status(status_name):
             return False
         
         if not created:
             return False
             
         try:
-            created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-            now = datetime.now(created_dt.tzinfo)
+            created_dt = parse_jira_datetime(created)
+            if created_dt.tzinfo is None:
+                now = datetime.now()
+            else:
+                now = now_utc or datetime.now(timezone.utc)
             hours_since_created = (now - created_dt).total_seconds() / 3600
-            
-            # 4 days = 96 hours for all priorities
-            sla_window = 96
-            
-            return hours_since_created > sla_window
+            return hours_since_created > SLA_HOURS
         except:
             return False
 
+    def get_auth(self):
+        """Return cached Basic auth, rebuilt only when the saved credentials change"""
+        credentials = (self.user_email, self.api_token)
+        if getattr(self, '_auth_credentials', None) != credentials:
+            self._auth = HTTPBasicAuth(*credentials)
+            self._auth_credentials = credentials
+            self.session.auth = self._auth
+        return self._auth
+
+    # Response cache
+    def _cache_connection(self):
+        """Open the response cache database on first use"""
+        if self._cache_db is None:
+            self._cache_db = sqlite3.connect(os.path.join(APP_DATA_DIR, 'jira_cache.sqlite'), check_same_thread=False)
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, endpoint TEXT, timestamp REAL, fresh_until REAL, stale_at REAL, body TEXT, etag TEXT)"
+            )
+            try:
+                # Caches written before ETags were stored lack the column
+                self._cache_db.execute("ALTER TABLE responses ADD COLUMN etag TEXT")
+            except sqlite3.OperationalError:
+                pass
+            # Last full ticket list per user, Jira instance and project, painted at startup before Jira answers
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS ticket_list_snapshots (user_email TEXT, jira_url TEXT, project TEXT, "
+                "saved_at REAL, body BLOB, PRIMARY KEY (user_email, jira_url, project))"
+            )
+        return self._cache_db
+
+    def _cache_ttl(self, endpoint):
+        """Return cache TTL for an endpoint, or None if it should not be cached"""
+        for prefix, ttl in CACHE_POLICY.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return None
+
+    def _cache_get(self, key):
+        """Return (fresh_until, stale_at, body, etag) for a cached response or None"""
+        try:
+            with self._cache_lock:
+                return self._cache_connection().execute(
+                    "SELECT fresh_until, stale_at, body, etag FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[DEBUG] Cache read failed: {e}")
+            return None
+
+    def _cache_put(self, key, endpoint, body, fresh_until, etag=None):
+        """Store a response body (and its ETag, if Jira sent one) in the cache"""
+        now = time.time()
+        try:
+            with self._cache_lock:
+                db = self._cache_connection()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, endpoint, timestamp, fresh_until, stale_at, body, etag) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, endpoint, now, fresh_until, now + CACHE_STALE_SECONDS, body, etag)
+                )
+                db.commit()
+        except sqlite3.Error as e:
+            print(f"[DEBUG] Cache write failed: {e}")
+
+    def _cache_invalidate(self):
+        """Drop cached tickets/issues after a change so the next load is fresh"""
+        try:
+            with self._cache_lock:
+                db = self._cache_connection()
+                db.execute("DELETE FROM responses WHERE endpoint NOT LIKE 'user%' OR stale_at < ?", (time.time(),))
+                db.commit()
+        except sqlite3.Error as e:
+            print(f"[DEBUG] Cache invalidation failed: {e}")
+
+    def _snapshot_scope(self):
+        """(user, Jira URL, project) a ticket list snapshot belongs to"""
+        return (self.user_email, self.jira_url, self.project_key)
+
+    def _save_ticket_snapshot(self, scope, body):
+        """Remember the serialised ticket list so the next startup can show it immediately"""
+        try:
+            with self._cache_lock:
+                db = self._cache_connection()
+                db.execute("INSERT OR REPLACE INTO ticket_list_snapshots VALUES (?, ?, ?, ?, ?)",
+                           (*scope, time.time(), body))
+                db.commit()
+        except sqlite3.Error as e:
+            print(f"[DEBUG] Ticket snapshot write failed: {e}")
+
+    def show_cached_tickets(self):
+        """Paint the last saved ticket list while the startup load is still waiting on Jira"""
+        if getattr(self, 'all_tickets', None):
+            return  # fresh data got here first
+        try:
+            with self._cache_lock:
+                row = self._cache_connection().execute(
+                    "SELECT body FROM ticket_list_snapshots WHERE user_email = ? AND jira_url = ? AND project = ?",
+                    self._snapshot_scope()
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[DEBUG] Ticket snapshot read failed: {e}")
+            return
+        if not row:
+            return
+        issues = json_loads(row[0])
+        self.update_ticket_list(issues)
+        self.filter_tickets()
+        self.status_label.config(text=f"Showing {len(issues)} cached tickets - refreshing...")
+
+    def _cache_stale_fallback(self, cache_key):
+        """Return an expired cached body when Jira can't be reached"""
+        if not cache_key:
+            return None
+        row = self._cache_get(cache_key)
+        if not row or row[1] < time.time():
+            return None
+        print("[DEBUG] Jira unreachable - using stale cached response")
+        self.root.after(0, lambda: self.status_label.config(text="Using cached (stale) data"))
+        return json_loads(row[2])
+
     # API Methods
-    def make_jira_request(self, endpoint, method="GET", params=None, data=None, files=None):
+    def make_jira_request(self, endpoint, method="GET", params=None, data=None, files=None, force=False,
+                          show_errors=True):
         """Make authenticated request to Jira API with timeout and retry logic"""
         url = f"{self.jira_url}/rest/api/3/{endpoint}"
-        auth = HTTPBasicAuth(self.user_email, self.api_token)
-        headers = {"Accept": "application/json"}
+        # Callers with a fallback of their own pass show_errors=False and just check for None
+        report_error = self.show_copyable_error if show_errors else (lambda title, message: None)
+        self.get_auth()  # keeps session.auth in step with the saved credentials
+        
+        if method not in ["GET", "POST", "PUT"]:
+            return None
         
-        if method in ["POST", "PUT"] and not files:
-            headers["Content-Type"] = "application/json"
+        # Serve cacheable GETs from the response cache while still fresh
+        cache_key = None
+        cached = None
+        cache_ttl = self._cache_ttl(endpoint) if method == "GET" else None
+        if cache_ttl:
+            cache_key = json.dumps([self.user_email, url, sorted((params or {}).items())], default=str)
+            cached = self._cache_get(cache_key)
+            if not force and cached and cached[0] > time.time():
+                print(f"[DEBUG] Cache hit for: {url}")
+                return json_loads(cached[2])
+        # An expired (or forced) entry is revalidated - a 304 skips the body download and re-parse
+        conditional_headers = {"If-None-Match": cached[3]} if cached and cached[3] else None
+        started = time.time()
         
         # Debug logging
         print(f"[DEBUG] Making {method} request to: {url}")
@@ -625,42 +983,54 @@ class JiraTicketViewer:
         for attempt in range(max_retries):
             try:
                 if method == "GET":
-                    response = requests.get(url, auth=auth, headers=headers, params=params, timeout=timeout)
-                elif method == "POST":
-                    if files:
-                        response = requests.post(url, auth=auth, files=files, data=data, timeout=timeout)
-                    else:
-                        response = requests.post(url, auth=auth, headers=headers, json=data, timeout=timeout)
-                elif method == "PUT":
-                    response = requests.put(url, auth=auth, headers=headers, json=data, timeout=timeout)
+                    response = self.session.get(url, params=params, headers=conditional_headers, timeout=timeout)
+                elif files:
+                    response = self.post_files(url, files, data, timeout)
                 else:
-                    return None
+                    response = self.session.request(method, url, data=json_dumps(data) if data is not None else None,
+                                                    headers={"Content-Type": "application/json"}, timeout=timeout)
                 
                 # Debug response
                 print(f"[DEBUG] Response status: {response.status_code}")
+                if response.status_code == 304 and conditional_headers:
+                    fresh_until = time.time() + cache_ttl
+                    self._cache_put(cache_key, endpoint, cached[2], fresh_until, cached[3])
+                    return json_loads(cached[2])
                 try:
-                    print(f"[DEBUG] Response text length: {len(response.text)} characters")
-                    # Only print first 500 chars to avoid encoding issues
-                    if len(response.text) > 500:
-                        print(f"[DEBUG] Response text (truncated): {response.text[:500]}...")
+                    # Work on the raw bytes - decoding a large body to str just to log it is wasted CPU
+                    body = response.content
+                    print(f"[DEBUG] Response length: {len(body)} bytes")
+                    preview = body[:500].decode(response.encoding or 'utf-8', errors='replace')
+                    if len(body) > 500:
+                        print(f"[DEBUG] Response text (truncated): {preview}...")
                     else:
-                        print(f"[DEBUG] Response text: {response.text}")
+                        print(f"[DEBUG] Response text: {preview}")
                 except UnicodeEncodeError:
                     print("[DEBUG] Response contains characters that cannot be displayed")
                 
                 response.raise_for_status()
                 
-                if response.text.strip():
-                    return response.json()
+                if method != "GET":
+                    self._cache_invalidate()
+                
+                if response.content.strip():
+                    if cache_key:
+                        elapsed = time.time() - started
+                        fresh_until = time.time() + cache_ttl + min(1 + elapsed, 5)
+                        self._cache_put(cache_key, endpoint, response.content, fresh_until, response.headers.get('ETag'))
+                    return json_loads(response.content)
                 else:
                     return {"success": True}
                     
             except requests.exceptions.Timeout:
                 print(f"[DEBUG] Timeout on attempt {attempt + 1}/{max_retries}")
                 if attempt == max_retries - 1:
+                    stale = self._cache_stale_fallback(cache_key)
+                    if stale is not None:
+                        return stale
                     error_msg = f"Request timed out after {max_retries} attempts (timeout: {timeout}s)"
                     print(f"[DEBUG] {error_msg}")
-                    self.show_copyable_error("Timeout Error", error_msg)
+                    report_error("Timeout Error", error_msg)
                     return None
                 time.sleep(2)  # Wait before retry
                 continue
@@ -671,6 +1041,10 @@ class JiraTicketViewer:
                     time.sleep(2)  # Wait before retry
                     continue
                 else:
+                    if e.response.status_code >= 500:
+                        stale = self._cache_stale_fallback(cache_key)
+                        if stale is not None:
+                            return stale
                     error_msg = f"API Error: {str(e)}"
                     if hasattr(e, 'response') and e.response is not None:
                         error_msg += f"\nStatus Code: {e.response.status_code}"
@@ -680,10 +1054,13 @@ class JiraTicketViewer:
                         if data:
                             error_msg += f"\nRequest Data: {json.dumps(data, indent=2)}"
                     print(f"[DEBUG] {error_msg}")
-                    self.show_copyable_error("API Error", error_msg)
+                    report_error("API Error", error_msg)
                     return None
                     
             except requests.exceptions.RequestException as e:
+                stale = self._cache_stale_fallback(cache_key)
+                if stale is not None:
+                    return stale
                 error_msg = f"API Error: {str(e)}"
                 if hasattr(e, 'response') and e.response is not None:
                     error_msg += f"\nStatus Code: {e.response.status_code}"
@@ -693,161 +1070,389 @@ class JiraTicketViewer:
                     if data:
                         error_msg += f"\nRequest Data: {json.dumps(data, indent=2)}"
                 print(f"[DEBUG] {error_msg}")
-                self.show_copyable_error("API Error", error_msg)
+                report_error("API Error", error_msg)
                 return None
                 
             except Exception as e:
                 error_msg = f"Unexpected error: {str(e)}"
                 print(f"[DEBUG] {error_msg}")
-                self.show_copyable_error("Error", error_msg)
+                report_error("Error", error_msg)
                 return None
 
-    def load_all_tickets_threaded(self):
+    def post_files(self, url, files, data, timeout):
+        """POST a multipart upload, streaming file contents from disk when requests_toolbelt is installed"""
+        # Jira rejects attachment uploads without this XSRF opt-out header
+        headers = {"X-Atlassian-Token": "no-check"}
+        if not MULTIPART_STREAMING:
+            return self.session.post(url, files=files, data=data, headers=headers, timeout=timeout)
+        
+        fields = dict(data or {})
+        for name, value in files.items():
+            if hasattr(value, 'read'):
+                value.seek(0)  # a retry has to send the file from the start again
+                filename = os.path.basename(getattr(value, 'name', name))
+                value = (filename, value, mime_type_for_ext(os.path.splitext(filename)[1].lower()))
+            fields[name] = value
+        encoder = MultipartEncoder(fields=fields)
+        headers["Content-Type"] = encoder.content_type
+        return self.session.post(url, data=encoder, headers=headers, timeout=timeout)
+
+    def make_jira_requests_concurrently(self, calls):
+        """Run several independent API calls at once, results in call order"""
+        futures = [self.http_pool.submit(self.make_jira_request, endpoint, **kwargs)
+                   for endpoint, kwargs in calls]
+        return [future.result() for future in futures]
+
+    def _worker_loop(self):
+        """Run queued background jobs one at a time"""
+        while True:
+            func, args = self._jobs.get()
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"[DEBUG] Background job failed: {e}")
+            finally:
+                self._jobs.task_done()
+
+    def load_all_tickets_threaded(self, force=False):
         """Load tickets in background thread"""
         self.refresh_btn.config(state="disabled")
         self.status_label.config(text="Loading tickets...")
-        threading.Thread(target=self.load_all_tickets, daemon=True).start()
+        # A newer request supersedes any load still queued or in flight
+        token = object()
+        self._load_token = token
+        self._jobs.put((self.load_all_tickets, (force, token)))
         
-    def load_all_tickets(self):
+    def load_all_tickets(self, force=False, token=None):
         """Load all tickets from Jira"""
+        if token is not None and token is not self._load_token:
+            print("[DEBUG] Skipping superseded ticket load")
+            return
         try:
-            issue_type_ids = list(self.issue_types.values())
-            jql = f'project = {self.project_key} AND issuetype in ({",".join(issue_type_ids)})'
-            
-            # API v3 requires explicit field specification
-            fields = "summary,status,priority,assignee,reporter,created,description"
-            params = {
-                'jql': jql, 
-                'maxResults': 100, 
-                'startAt': 0,
-                'fields': fields
-            }
-            data = self.make_jira_request("search/jql", params=params)
+            params = {**self.get_base_search_params(), 'startAt': 0}
+            data = self.make_jira_request("search/jql", params=params, force=force)
             
             if data and 'issues' in data:
-                self.root.after(0, self.update_ticket_list, data['issues'])
-                self.root.after(0, lambda: self.status_label.config(text=f"Loaded {len(data['issues'])} tickets"))
+                issues = list(data['issues'])
+                more_pages = len(issues) < MAX_TICKETS and (
+                    data.get('total', 0) > len(issues) or (data.get('nextPageToken') and not data.get('isLast')))
+                if more_pages:
+                    if not getattr(self, 'all_tickets', None):
+                        # Show the first page straight away instead of waiting for every page
+                        # (skipped when a list is already on screen, so it doesn't shrink to one page)
+                        self.root.after(0, self.apply_loaded_tickets, list(issues), token, True)
+                    issues.extend(self.load_remaining_pages(data, params, force))
+                    # Pages fetched at different moments can repeat an issue when the results shift;
+                    # tree rows are keyed by ticket key, so keep one copy (first position, latest data)
+                    issues = list({issue.get('key'): issue for issue in issues}.values())
+                self.root.after(0, self.apply_loaded_tickets, issues, token)
             else:
                 self.root.after(0, lambda: self.status_label.config(text="Failed to load tickets"))
         except Exception as e:
             self.root.after(0, lambda: self.status_label.config(text=f"Error: {str(e)}"))
         finally:
-            self.root.after(0, lambda: self.refresh_btn.config(state="normal"))
-            self.root.after(100, self.filter_tickets)
+            if token is None or token is self._load_token:
+                self.root.after(0, lambda: self.refresh_btn.config(state="normal"))
+                self.root.after(100, self.filter_tickets)
+
+    def apply_loaded_tickets(self, issues, token=None, loading_more=False):
+        """Show freshly loaded tickets unless a newer load has been requested"""
+        if token is not None and token is not self._load_token:
+            print("[DEBUG] Dropping results from superseded ticket load")
+            return
+        self.update_ticket_list(issues)
+        if loading_more:
+            # Partial list - apply the current filters now, the final pass re-filters the full list
+            self.filter_tickets()
+            self.status_label.config(text=f"Loaded {len(issues)} tickets, loading more...")
+        else:
+            self.status_label.config(text=f"Loaded {len(issues)} tickets")
+            # Serialise here on the Tk thread - apply_single_ticket edits these dicts in place
+            self.http_pool.submit(self._save_ticket_snapshot, self._snapshot_scope(), json_dumps(issues))
+
+    def refresh_single_ticket(self, ticket_key):
+        """Re-fetch one ticket after an edit and update its row in place (no full reload)"""
+        params = {'fields': self.get_base_search_params()['fields']}
+
+        def fetch():
+            issue = self.make_jira_request(f"issue/{ticket_key}", params=params, force=True)
+            if issue:
+                self.root.after(0, self.apply_single_ticket, issue)
+
+        self.http_pool.submit(fetch)
+
+    def apply_single_ticket(self, updated):
+        """Merge a re-fetched ticket into the loaded list and its treeview row"""
+        ticket_key = updated.get('key')
+        issue = self._ticket_by_key.get(ticket_key)
+        if issue is None:
+            return
+        # Update the shared dict in place so all_tickets and any filtered list see the change
+        issue.setdefault('fields', {}).update(updated.get('fields', {}))
+
+        self._sla_cache[ticket_key] = self._compute_sla(issue)
+        filter_fields_changed = self.reindex_ticket(issue)
+        priority_lower = _dig(issue, ('fields', 'priority', 'name'), '').lower()
+        self._style_tags[ticket_key] = self.style_tag_for(ticket_key, priority_lower)
+
+        # A ticket that was closed, reopened or reassigned may no longer belong in the current filter
+        if filter_fields_changed:
+            self.filter_tickets()
+            return
+
+        row_values = getattr(self, '_row_values', [])
+        for i, values in enumerate(row_values):
+            if values[0] == ticket_key:
+                values, tags = self.build_ticket_row(issue, time.time())
+                row_values[i] = values
+                self._rows_sorted_by = None  # the changed row may now be out of order
+                self._row_tags[i] = tags
+                if self.tree.exists(ticket_key):
+                    self.tree.item(ticket_key, values=values, tags=tags)
+                break
+
+    def get_base_search_params(self):
+        """Search params for the ticket list, rebuilt only when the project changes"""
+        if getattr(self, '_base_params_project', None) != self.project_key:
+            issue_type_ids = list(self.issue_types.values())
+            self._base_jql = f'project = {self.project_key} AND issuetype in ({",".join(issue_type_ids)})'
+            # API v3 requires explicit field specification - only what the list/details panel use
+            self._base_params = {
+                'jql': self._base_jql,
+                'maxResults': SEARCH_PAGE_SIZE,
+                'fields': "summary,status,priority,assignee,reporter,created,description"
+            }
+            self._base_params_project = self.project_key
+        return self._base_params
+
+    def load_remaining_pages(self, first_page, params, force=False):
+        """Fetch search pages after the first one (up to MAX_TICKETS)"""
+        issues = []
+        # Jira silently caps maxResults; page with whatever size it actually used
+        page_size = first_page.get('maxResults') or len(first_page.get('issues', [])) or SEARCH_PAGE_SIZE
+        if page_size < SEARCH_PAGE_SIZE:
+            print(f"[DEBUG] Jira capped search page size at {page_size} (asked for {SEARCH_PAGE_SIZE})")
+        total = first_page.get('total')
+        if total is not None:
+            # Offset paging: total is known, so fetch every other page at once
+            offsets = range(page_size, min(total, MAX_TICKETS), page_size)
+            pages = self.make_jira_requests_concurrently([
+                ("search/jql", {'params': {**params, 'startAt': offset, 'maxResults': page_size}, 'force': force})
+                for offset in offsets
+            ])
+            for page in pages:
+                if page and 'issues' in page:
+                    issues.extend(page['issues'])
+            return issues
+        
+        # Token paging (search/jql): each page points at the next, so walk them in order
+        page = first_page
+        loaded = len(first_page.get('issues', []))
+        while page.get('nextPageToken') and not page.get('isLast') and loaded < MAX_TICKETS:
+            page = self.make_jira_request("search/jql", params={**params, 'nextPageToken': page['nextPageToken']}, force=force)
+            if not page or 'issues' not in page:
+                break
+            issues.extend(page['issues'])
+            loaded += len(page['issues'])
+        return issues
 
     def refresh_tickets(self):
         """Refresh ticket list by reloading from Jira"""
-        self.load_all_tickets_threaded()
+        self.load_all_tickets_threaded(force=True)
 
     def update_ticket_list(self, issues):
         """Update treeview with tickets"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         self.all_tickets = issues
+        self._ticket_by_key = {issue.get('key'): issue for issue in issues}
+        now_utc = datetime.now(timezone.utc)
+        self._sla_cache = {issue.get('key'): self._compute_sla(issue, now_utc) for issue in issues}
+        self.index_ticket_columns(issues)
+        self._style_tags = {key: self.style_tag_for(key, priority)
+                            for key, priority in zip(self._keys, self._priorities)}
+        
+        self.populate_tree(issues)
+
+    def index_ticket_columns(self, issues):
+        """Build per-field column lists parallel to all_tickets for filtering"""
+        self._keys = [_dig(issue, ('key',), '') for issue in issues]
+        self._statuses = [_dig(issue, ('fields', 'status', 'name'), '').lower() for issue in issues]
+        self._priorities = [_dig(issue, ('fields', 'priority', 'name'), '').lower() for issue in issues]
+        self._reporter_emails = [_dig(issue, ('fields', 'reporter', 'emailAddress'), '') for issue in issues]
+        self._assignee_emails = [_dig(issue, ('fields', 'assignee', 'emailAddress'), '') for issue in issues]
+        self._has_assignee = [_dig(issue, ('fields', 'assignee'), None) is not None for issue in issues]
+        self._completed = [is_completed_status(status) for status in self._statuses]
+        # Lowercased "key<US>summary" per ticket so text search is one substring test per row
+        self._search_blobs = [f"{key}\x1f{_dig(issue, ('fields', 'summary'), '')}".lower()
+                              for key, issue in zip(self._keys, issues)]
+        # Which characters each row contains - a row missing any query character can't match
+        self._search_masks = [char_mask(blob) for blob in self._search_blobs]
+        self._join_search_blobs()
+        # Parse each created timestamp once per load; age labels are derived from these
+        self._created_ts = {key: created_timestamp(_dig(issue, ('fields', 'created'), ''))
+                            for key, issue in zip(self._keys, issues)}
+        # Ticket key -> row position in the column lists, for single-ticket updates
+        self._pos_by_key = {key: i for i, key in enumerate(self._keys)}
+        
+        # Inverted indexes (value -> set of row positions) so filters become set operations
+        self._by_email = {}
+        for i, (reporter_email, assignee_email) in enumerate(zip(self._reporter_emails, self._assignee_emails)):
+            for email in (reporter_email, assignee_email):
+                if email:
+                    self._by_email.setdefault(email, set()).add(i)
+        self._completed_idx = {i for i, done in enumerate(self._completed) if done}
+        self._unassigned_idx = {i for i, assigned in enumerate(self._has_assignee) if not assigned}
+
+    def _join_search_blobs(self):
+        """Join all search blobs into one string for full-list searches, noting where each row starts"""
+        self._search_joined = '\x1e'.join(self._search_blobs)
+        self._search_starts = []
+        offset = 0
+        for blob in self._search_blobs:
+            self._search_starts.append(offset)
+            offset += len(blob) + 1
+        # Rows changed - forget the previous search's matches
+        self._last_search_query = ''
+        self._last_search_idx = []
+
+    def reindex_ticket(self, issue):
+        """Update one ticket's slots in the column indexes; returns True if a filtered-on field changed"""
+        i = self._pos_by_key.get(issue.get('key'))
+        if i is None:
+            return False
+        before = (self._reporter_emails[i], self._assignee_emails[i], self._has_assignee[i], self._completed[i])
+        
+        status = _dig(issue, ('fields', 'status', 'name'), '').lower()
+        self._statuses[i] = status
+        self._priorities[i] = _dig(issue, ('fields', 'priority', 'name'), '').lower()
+        self._reporter_emails[i] = _dig(issue, ('fields', 'reporter', 'emailAddress'), '')
+        self._assignee_emails[i] = _dig(issue, ('fields', 'assignee', 'emailAddress'), '')
+        self._has_assignee[i] = _dig(issue, ('fields', 'assignee'), None) is not None
+        self._completed[i] = is_completed_status(status)
+        self._created_ts[self._keys[i]] = created_timestamp(_dig(issue, ('fields', 'created'), ''))
+        
+        blob = f"{self._keys[i]}\x1f{_dig(issue, ('fields', 'summary'), '')}".lower()
+        if blob != self._search_blobs[i]:
+            self._search_blobs[i] = blob
+            self._search_masks[i] = char_mask(blob)
+            self._join_search_blobs()
+        
+        after = (self._reporter_emails[i], self._assignee_emails[i], self._has_assignee[i], self._completed[i])
+        if after == before:
+            return False
+        for email in before[:2]:
+            if email:
+                self._by_email.get(email, set()).discard(i)
+        for email in after[:2]:
+            if email:
+                self._by_email.setdefault(email, set()).add(i)
+        (self._completed_idx.add if self._completed[i] else self._completed_idx.discard)(i)
+        (self._unassigned_idx.discard if self._has_assignee[i] else self._unassigned_idx.add)(i)
+        return True
+
+    def style_tag_for(self, key, priority_lower):
+        """Pick the highlight tag for a row (configured once in setup_ui)"""
+        if self._sla_cache.get(key):
+            return 'sla_missed'
+        if priority_lower in ('critical', 'high'):
+            return priority_lower
+        return None
+
+    def build_ticket_row(self, issue, now):
+        """Build (values, tags) for one treeview row"""
+        key, priority_name, summary, status_name, assignee_name, reporter_name, created = (
+            _dig(issue, path, default) for _, path, default in _FIELD_SPECS
+        )
+        priority_lower = priority_name.lower()
+        priority_symbol = _PRIORITY_SYMBOLS.get(priority_lower, '⚪')
         
-        for issue in issues:
-            fields = issue.get('fields', {})
-            
-            key = issue.get('key', 'Unknown')
-            
-            priority = fields.get('priority', {})
-            priority_name = priority.get('name', 'Unknown') if priority else 'Unknown'
-            priority_symbol = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🔵'}.get(priority_name.lower(), '⚪')
-            
-            summary = fields.get('summary', 'No summary')
-            
-            status = fields.get('status', {})
-            status_name = status.get('name', 'Unknown') if status else 'Unknown'
-            
-            assignee = fields.get('assignee')
-            assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-            
-            reporter = fields.get('reporter')
-            reporter_name = reporter.get('displayName', 'Unknown') if reporter else 'Unknown'
-            
-            # Calculate age
-            created = fields.get('created', '')
-            if created:
-                try:
-                    created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                    now = datetime.now(created_dt.tzinfo)
-                    age_hours = (now - created_dt).total_seconds() / 3600
-                    if age_hours < 24:
-                        age_str = f"{int(age_hours)}h"
-                    elif age_hours < 168:
-                        age_str = f"{int(age_hours/24)}d"
-                    else:
-                        age_str = f"{int(age_hours/168)}w"
-                except:
-                    age_str = "?"
-            else:
-                age_str = "?"
-            
-            values = (key, priority_symbol, summary, status_name, assignee_name, reporter_name, age_str)
-            
-            # Tags
-            tags = [key]
-            if self.is_sla_missed(issue):
-                tags.append('sla_missed')
-            elif priority_name.lower() == 'critical':
-                tags.append('critical')
-            elif priority_name.lower() == 'high':
-                tags.append('high')
-            
-            self.tree.insert("", "end", values=values, tags=tags)
+        # Calculate age from the timestamp parsed at load time
+        created_ts_cache = getattr(self, '_created_ts', {})
+        created_ts = created_ts_cache[key] if key in created_ts_cache else created_timestamp(created)
+        age_str = format_age(max(int((now - created_ts) // 3600), 0)) if created_ts is not None else "?"
+        
+        values = (key, priority_symbol, summary, status_name, assignee_name, reporter_name, age_str)
+        
+        # Tags for visual styling - highlight tag is worked out once per load.
+        # Rows are identified by their item id (the key), so only the shared style tag is set.
+        style_tags = getattr(self, '_style_tags', {})
+        if key in style_tags:
+            style_tag = style_tags[key]
+        else:
+            style_tag = 'sla_missed' if self.is_sla_missed(issue) else self.style_tag_for(key, priority_lower)
+        
+        return values, _ROW_TAGS[style_tag]
+
+    def populate_tree(self, issues):
+        """Replace the treeview rows; only the first TREE_RENDER_BATCH are inserted up front"""
+        now = time.time()
+        rows = [self.build_ticket_row(issue, now) for issue in issues]
+        # Every filtered row lives here; the tree holds a rendered prefix (item id = ticket key)
+        self._row_values = [values for values, _ in rows]
+        self._row_tags = [tags for _, tags in rows]
+        self._rendered_rows = 0
+        # Fresh rows are in load order, not sorted by any column
+        self._rows_sorted_by = None
+        
+        # Hide the tree while rebuilding so Tk only lays it out once
+        self.tree.grid_remove()
+        try:
+            self.tree.delete(*self.tree.get_children())
+            self.render_more_rows()
+        finally:
+            self.tree.grid()
+
+    def render_more_rows(self):
+        """Insert the next batch of not-yet-rendered rows at the end of the tree"""
+        start = self._rendered_rows
+        end = min(start + TREE_RENDER_BATCH, len(self._row_values))
+        insert = self.tree.insert
+        for values, tags in zip(self._row_values[start:end], self._row_tags[start:end]):
+            insert("", "end", iid=values[0], values=values, tags=tags)
+        self._rendered_rows = end
+
+    def on_tree_scroll(self, first, last):
+        """Tree yscrollcommand: update the scrollbar and render more rows near the bottom"""
+        self.tree_scrollbar.set(first, last)
+        if float(last) > 0.9 and getattr(self, '_rendered_rows', 0) < len(getattr(self, '_row_values', ())):
+            self.root.after_idle(self.render_more_rows)
+
+    def schedule_filter(self, event=None):
+        """Run filter_tickets once the filter widgets settle (coalesces rapid changes)"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(FILTER_DEBOUNCE_MS, self._run_scheduled_filter)
+
+    def _run_scheduled_filter(self):
+        """Debounce timer callback for schedule_filter"""
+        self._filter_after_id = None
+        self.filter_tickets()
 
     def filter_tickets(self, event=None):
         """Filter tickets based on criteria"""
         if not hasattr(self, 'all_tickets') or not self.all_tickets:
             return
             
-        # Clear current display
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         ticket_filter = self.ticket_filter_var.get()
         hide_completed = self.hide_completed_var.get()
         user_email = self.user_email
         
-        completed_statuses = ['done', 'closed', 'resolved', 'complete', 'completed', 'finished']
+        # Apply main filter first - candidates are row positions from the indexes
+        if ticket_filter == "My Tickets":
+            candidates = set(self._by_email.get(user_email, ()))
+        elif ticket_filter == "All Open":
+            candidates = set(range(len(self.all_tickets))) - self._completed_idx
+        elif ticket_filter == "Unassigned":
+            # Keep only tickets without an assignee
+            candidates = set(self._unassigned_idx)
+        else:
+            candidates = set(range(len(self.all_tickets)))
         
-        tickets_to_show = []
-        for issue in self.all_tickets:
-            fields = issue.get('fields', {})
-            
-            # Apply main filter first
-            if ticket_filter == "My Tickets":
-                reporter = fields.get('reporter')
-                reporter_email = reporter.get('emailAddress', '') if reporter else ''
-                assignee = fields.get('assignee')
-                assignee_email = assignee.get('emailAddress', '') if assignee else ''
-                
-                if user_email not in [reporter_email, assignee_email]:
-                    continue
-                    
-            elif ticket_filter == "All Open":
-                status = fields.get('status', {})
-                status_name = status.get('name', '').lower() if status else ''
-                is_completed = any(completed_status in status_name for completed_status in completed_statuses)
-                if is_completed:
-                    continue
-                    
-            elif ticket_filter == "Unassigned":
-                assignee = fields.get('assignee')
-                # Skip tickets that HAVE an assignee (we want unassigned ones)
-                if assignee is not None:
-                    continue
-            
-            # Apply completed filter (unless we're already filtering for open tickets)
-            if hide_completed and ticket_filter != "All Open":
-                status = fields.get('status', {})
-                status_name = status.get('name', '').lower() if status else ''
-                is_completed = any(completed_status in status_name for completed_status in completed_statuses)
-                if is_completed:
-                    continue
-            
-            tickets_to_show.append(issue)
+        # Apply completed filter (unless we're already filtering for open tickets)
+        if hide_completed and ticket_filter != "All Open":
+            candidates -= self._completed_idx
+        
+        all_tickets = self.all_tickets
+        tickets_to_show = [all_tickets[i] for i in sorted(candidates)]
         
         # Store filtered tickets for reference
         self.filtered_tickets = tickets_to_show
@@ -862,87 +1467,53 @@ class JiraTicketViewer:
     
     def display_filtered_tickets(self, tickets_to_show):
         """Display the filtered tickets in the tree"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add filtered tickets to treeview
-        for issue in tickets_to_show:
-            fields = issue.get('fields', {})
-            
-            key = issue.get('key', 'Unknown')
-            
-            priority = fields.get('priority', {})
-            priority_name = priority.get('name', 'Unknown') if priority else 'Unknown'
-            priority_symbol = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🔵'}.get(priority_name.lower(), '⚪')
-            
-            summary = fields.get('summary', 'No summary')
-            
-            status = fields.get('status', {})
-            status_name = status.get('name', 'Unknown') if status else 'Unknown'
-            
-            assignee = fields.get('assignee')
-            assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-            
-            reporter = fields.get('reporter')
-            reporter_name = reporter.get('displayName', 'Unknown') if reporter else 'Unknown'
-            
-            # Calculate age
-            created = fields.get('created', '')
-            if created:
-                try:
-                    created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                    now = datetime.now(created_dt.tzinfo)
-                    age_hours = (now - created_dt).total_seconds() / 3600
-                    if age_hours < 24:
-                        age_str = f"{int(age_hours)}h"
-                    elif age_hours < 168:
-                        age_str = f"{int(age_hours/24)}d"
-                    else:
-                        age_str = f"{int(age_hours/168)}w"
-                except:
-                    age_str = "?"
-            else:
-                age_str = "?"
-            
-            values = (key, priority_symbol, summary, status_name, assignee_name, reporter_name, age_str)
-            
-            # Tags for visual styling
-            tags = [key]
-            if self.is_sla_missed(issue):
-                tags.append('sla_missed')
-            elif priority_name.lower() == 'critical':
-                tags.append('critical')
-            elif priority_name.lower() == 'high':
-                tags.append('high')
-            
-            self.tree.insert("", "end", values=values, tags=tags)
+        self.populate_tree(tickets_to_show)
+
+    def schedule_search(self, event=None):
+        """Search once typing pauses, so a burst of keystrokes filters the list only once"""
+        text = self.search_entry.get()
+        if text == self._search_text_seen:
+            return  # arrows, modifiers etc. - nothing to search again
+        self._search_text_seen = text
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.search_tickets)
 
     def search_tickets(self, event=None):
         """Enhanced search functionality"""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._search_text_seen = self.search_entry.get()
         search_term = self.search_entry.get().strip()
         if search_term == "🔍 Search tickets..." or not search_term:
+            self._last_search_query = ''
             self.filter_tickets()
             return
             
         if not hasattr(self, 'all_tickets') or not self.all_tickets:
             return
             
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        matching_tickets = []
         search_lower = search_term.lower()
+        # A query that extends the previous one can only match a subset of its rows
+        last_query = self._last_search_query
+        if last_query and search_lower.startswith(last_query):
+            blobs = self._search_blobs
+            masks = self._search_masks
+            query_mask = char_mask(search_lower)
+            match_idx = [i for i in self._last_search_idx
+                         if masks[i] & query_mask == query_mask and search_lower in blobs[i]]
+        else:
+            match_idx = find_rows_containing(self._search_joined, self._search_starts, search_lower)
+        self._last_search_query = search_lower
+        self._last_search_idx = match_idx
         
-        for issue in self.all_tickets:
-            fields = issue.get('fields', {})
-            key = issue.get('key', '').lower()
-            summary = fields.get('summary', '').lower()
-            
-            if search_lower in key or search_lower in summary:
-                matching_tickets.append(issue)
-                
-        self.update_ticket_list(matching_tickets)
+        all_tickets = self.all_tickets
+        matching_tickets = [all_tickets[i] for i in match_idx]
+        
+        # Only change what's shown - all_tickets and its indexes stay intact for the next search
+        self.filtered_tickets = matching_tickets
+        self.display_filtered_tickets(matching_tickets)
         self.status_label.config(text=f"Found {len(matching_tickets)} tickets matching '{search_term}'")
 
     # Event Handlers
@@ -957,30 +1528,21 @@ class JiraTicketViewer:
             self.disable_all_actions()
             return
 
-        item = selection[0]
-        ticket_key = self.tree.item(item)['values'][0]
+        # Row ids are the ticket keys, so no need to read the row back from Tk
+        ticket_key = selection[0]
         print(f"[DEBUG] Selected ticket: {ticket_key}")
         
-        # Find the ticket in all_tickets OR in the currently filtered list
-        self.current_ticket = None
-        if hasattr(self, 'all_tickets'):
-            for issue in self.all_tickets:
-                if issue.get('key') == ticket_key:
-                    self.current_ticket = issue
-                    break
-        
-        # If not found in all_tickets, try the currently displayed filtered list
-        if not self.current_ticket and hasattr(self, 'filtered_tickets'):
-            for issue in self.filtered_tickets:
-                if issue.get('key') == ticket_key:
-                    self.current_ticket = issue
-                    break
+        # Find the ticket by key (filtered_tickets is always a subset of all_tickets)
+        self.current_ticket = getattr(self, '_ticket_by_key', {}).get(ticket_key)
                     
         # If still not found, try to fetch from API
         if not self.current_ticket:
             self.current_ticket = self.fetch_ticket_details(ticket_key)
         
         if self.current_ticket:
+            # Warm the response cache with the ticket's transitions so the resolve/close/status
+            # buttons (which read it) don't wait on Jira; failures are left to the button's own request
+            self.http_pool.submit(self.make_jira_request, f"issue/{ticket_key}/transitions", show_errors=False)
             self.show_context_toolbar()
             self.enable_all_actions()
             self.load_ticket_details(load_comments=False)  # Don't auto-load comments for speed
@@ -1009,71 +1571,70 @@ class JiraTicketViewer:
         print(f"[DEBUG] Loading details for: {ticket_key}")
 
         # Optionally refresh from API to get latest comments
+        prefetched_comments = None
         if refresh_from_api:
-            self.current_ticket = self.fetch_ticket_details(ticket_key)
+            # Issue and comments are independent - fetch both in one round trip
+            self.current_ticket, prefetched_comments = self.make_jira_requests_concurrently([
+                (f"issue/{ticket_key}", {'force': True}),
+                (f"issue/{ticket_key}/comment", {'force': True}),
+            ])
             if not self.current_ticket:
                 return
 
         fields = self.current_ticket.get('fields', {})
         print(f"[DEBUG] Got fields, building details text...")
 
-        details = f"**{ticket_key}**: {fields.get('summary', 'No summary')}\n\n"
-
         status = fields.get('status', {})
         priority = fields.get('priority', {})
-        details += f"Status: {status.get('name', 'Unknown')}\n"
-        details += f"Priority: {priority.get('name', 'Unknown')}\n\n"
-
         reporter = fields.get('reporter', {})
         assignee = fields.get('assignee')
-        details += f"Reporter: {reporter.get('displayName', 'Unknown') if reporter else 'Unknown'}\n"
-        details += f"Assignee: {assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'}\n\n"
+
+        parts = [
+            f"**{ticket_key}**: {fields.get('summary', 'No summary')}\n\n",
+            f"Status: {status.get('name', 'Unknown')}\n",
+            f"Priority: {priority.get('name', 'Unknown')}\n\n",
+            f"Reporter: {reporter.get('displayName', 'Unknown') if reporter else 'Unknown'}\n",
+            f"Assignee: {assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'}\n\n",
+        ]
 
         description = fields.get('description', '')
         if description:
             if isinstance(description, dict):
-                details += "Description:\n" + self.extract_text_from_adf(description) + "\n\n"
-            else:
-                details += f"Description:\n{description}\n\n"
+                description = self.extract_text_from_adf(description)
+            parts.append(f"Description:\n{description}\n\n")
+
+        details = ''.join(parts)
+        separator = "=" * 50
 
         # Only fetch comments if explicitly requested or when refreshing
         if load_comments or refresh_from_api:
-            details += "=" * 50 + "\n"
-            details += "Loading comments...\n"
-            details += "=" * 50 + "\n"
-
             self.details_text.config(state='normal')
             self.details_text.delete(1.0, tk.END)
-            self.details_text.insert(1.0, details)
+            self.details_text.insert(1.0, f"{details}{separator}\nLoading comments...\n{separator}\n")
             self.details_text.config(state='disabled')
 
             # Load comments in background thread
             def load_comments_async():
-                comments_data = self.make_jira_request(f"issue/{ticket_key}/comment")
+                comments_data = prefetched_comments or self.make_jira_request(f"issue/{ticket_key}/comment")
                 if comments_data and 'comments' in comments_data:
                     comments = comments_data['comments']
                     if comments:
-                        comment_text = "\n" + "=" * 50 + "\n"
-                        comment_text += f"COMMENTS ({len(comments)}):\n"
-                        comment_text += "=" * 50 + "\n\n"
+                        comment_parts = [details, f"\n{separator}\nCOMMENTS ({len(comments)}):\n{separator}\n\n"]
+                        divider = "-" * 50
 
                         for comment in comments:
                             author = comment.get('author', {}).get('displayName', 'Unknown')
                             created = comment.get('created', '')
                             if created:
-                                try:
-                                    created_date = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                                    created = created_date.strftime('%Y-%m-%d %H:%M')
-                                except:
-                                    pass
+                                created = format_jira_timestamp(created)
 
                             body = comment.get('body', '')
                             if isinstance(body, dict):
                                 body = self.extract_text_from_adf(body)
 
-                            comment_text += f"[{created}] {author}:\n"
-                            comment_text += f"{body}\n"
-                            comment_text += "-" * 50 + "\n\n"
+                            comment_parts.append(f"[{created}] {author}:\n{body}\n{divider}\n\n")
+
+                        new_details = ''.join(comment_parts)
 
                         # Update UI in main thread
                         def update_ui():
@@ -1082,22 +1643,17 @@ class JiraTicketViewer:
                             if "Loading comments..." in current_details:
                                 self.details_text.config(state='normal')
                                 self.details_text.delete(1.0, tk.END)
-                                new_details = details + comment_text
                                 self.details_text.insert(1.0, new_details)
                                 self.details_text.config(state='disabled')
 
                         self.root.after(0, update_ui)
 
-            threading.Thread(target=load_comments_async, daemon=True).start()
+            self.http_pool.submit(load_comments_async)
         else:
             # Show button to load comments on demand
-            details += "\n" + "=" * 50 + "\n"
-            details += "Click 'View Comments' button to load comments\n"
-            details += "=" * 50 + "\n"
-
             self.details_text.config(state='normal')
             self.details_text.delete(1.0, tk.END)
-            self.details_text.insert(1.0, details)
+            self.details_text.insert(1.0, f"{details}\n{separator}\nClick 'View Comments' button to load comments\n{separator}\n")
             self.details_text.config(state='disabled')
 
     def extract_text_from_adf(self, adf_content):
@@ -1123,39 +1679,26 @@ class JiraTicketViewer:
 
     def sort_treeview(self, col):
         """Sort treeview by column"""
-        # Get all data from tree
-        data = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
+        # Sort the row values we inserted rather than reading each cell back from Tk
+        row_values = getattr(self, '_row_values', [])
+        row_tags = getattr(self, '_row_tags', [])
+        col_index = TREE_COLUMNS.index(col)
+        
+        # Toggling the column the rows are already sorted by only flips the order - no need to sort again
+        if getattr(self, '_rows_sorted_by', None) == col and getattr(self, '_last_sort_col', None) == col:
+            self._sort_reverse = not getattr(self, '_sort_reverse', False)
+            self.apply_row_order(range(len(row_values) - 1, -1, -1))
+            return
         
-        # Sort data
-        try:
-            # Try numeric sort for priority and age columns
-            if col in ['Priority', 'Age']:
-                # For Priority, sort by symbol but maintain original order
-                if col == 'Priority':
-                    priority_order = {'🔴': 0, '🟠': 1, '🟡': 2, '🔵': 3, '⚪': 4}
-                    data.sort(key=lambda x: priority_order.get(x[0], 5))
-                elif col == 'Age':
-                    # Sort by age - convert to hours for proper numeric sort
-                    def age_to_hours(age_str):
-                        if age_str == '?':
-                            return 999999
-                        try:
-                            if age_str.endswith('h'):
-                                return int(age_str[:-1])
-                            elif age_str.endswith('d'):
-                                return int(age_str[:-1]) * 24
-                            elif age_str.endswith('w'):
-                                return int(age_str[:-1]) * 168
-                        except:
-                            return 999999
-                        return 999999
-                    data.sort(key=lambda x: age_to_hours(x[0]))
-            else:
-                # Text sort for other columns
-                data.sort(key=lambda x: x[0].lower())
-        except:
-            # Fallback to text sort
-            data.sort(key=lambda x: str(x[0]).lower())
+        if col == 'Priority':
+            sort_key = lambda i: _PRIORITY_SORT_ORDER.get(row_values[i][col_index], 5)
+        elif col == 'Age':
+            # Sort by age - convert to hours for proper numeric sort
+            sort_key = lambda i: age_to_hours(row_values[i][col_index])
+        else:
+            # Text sort for other columns
+            sort_key = lambda i: str(row_values[i][col_index]).lower()
+        order = sorted(range(len(row_values)), key=sort_key)
         
         # Check if we need to reverse (toggle sort direction)
         if hasattr(self, '_last_sort_col') and self._last_sort_col == col:
@@ -1167,13 +1710,31 @@ class JiraTicketViewer:
             self._sort_reverse = False
             
         if self._sort_reverse:
-            data.reverse()
+            order.reverse()
             
         self._last_sort_col = col
-        
-        # Rearrange items in sorted order
-        for index, (val, child) in enumerate(data):
-            self.tree.move(child, '', index)
+        self._rows_sorted_by = col
+        self.apply_row_order(order)
+
+    def apply_row_order(self, order):
+        """Reorder the row lists by position, then make the rendered prefix match the new order"""
+        row_values = self._row_values
+        row_tags = self._row_tags
+        self._row_values = [row_values[i] for i in order]
+        self._row_tags = [row_tags[i] for i in order]
+        rendered = getattr(self, '_rendered_rows', 0)
+        prefix = list(zip(self._row_values[:rendered], self._row_tags[:rendered]))
+        prefix_keys = {values[0] for values, _ in prefix}
+        # One get_children round trip tells us which rows exist, instead of tree.exists() per row
+        present = set(self.tree.get_children())
+        stale = present - prefix_keys
+        if stale:
+            self.tree.delete(*stale)
+        for values, tags in prefix:
+            if values[0] not in present:
+                self.tree.insert('', 'end', iid=values[0], values=values, tags=tags)
+        # Reorder every rendered row in one Tk call instead of one move() per row
+        self.tree.set_children('', *(values[0] for values, _ in prefix))
 
     def on_ticket_double_click(self, event):
         """Handle double-click - open ticket details dialog"""
@@ -1213,7 +1774,7 @@ class JiraTicketViewer:
         editor_window = tk.Toplevel(self.root)
         editor_window.title("Company Knowledge Base Editor")
         editor_window.geometry("900x700")
-        editor_window.configure(bg='#1a1a1a')
+        editor_window.configure(bg=PALETTE.bg_primary)
 
         main_frame = ttk.Frame(editor_window, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -1276,7 +1837,7 @@ class JiraTicketViewer:
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Jira Settings")
         settings_window.geometry("500x450")
-        settings_window.configure(bg='#1a1a1a')
+        settings_window.configure(bg=PALETTE.bg_primary)
         settings_window.transient(self.root)
         settings_window.grab_set()
         
@@ -1291,7 +1852,7 @@ class JiraTicketViewer:
         jira_url_entry.pack(fill=tk.X, pady=(0, 5))
         jira_url_entry.insert(0, self.jira_url)
         ttk.Label(main_frame, text="Example: https://yourcompany.atlassian.net", 
-                 font=('Segoe UI', 8), foreground='#888888').pack(anchor=tk.W, pady=(0, 15))
+                 font=('Segoe UI', 8), foreground=PALETTE.text_hint).pack(anchor=tk.W, pady=(0, 15))
         
         # User Email
         ttk.Label(main_frame, text="Your Email Address:").pack(anchor=tk.W, pady=(0, 5))
@@ -1299,7 +1860,7 @@ class JiraTicketViewer:
         email_entry.pack(fill=tk.X, pady=(0, 5))
         email_entry.insert(0, self.user_email)
         ttk.Label(main_frame, text="Example: john.doe@yourcompany.com", 
-                 font=('Segoe UI', 8), foreground='#888888').pack(anchor=tk.W, pady=(0, 15))
+                 font=('Segoe UI', 8), foreground=PALETTE.text_hint).pack(anchor=tk.W, pady=(0, 15))
         
         # Project Key
         ttk.Label(main_frame, text="Project Key:").pack(anchor=tk.W, pady=(0, 5))
@@ -1307,7 +1868,7 @@ class JiraTicketViewer:
         project_entry.pack(anchor=tk.W, pady=(0, 5))
         project_entry.insert(0, self.project_key)
         ttk.Label(main_frame, text="Example: ITS, PROJ, DEV (usually 2-4 uppercase letters)", 
-                 font=('Segoe UI', 8), foreground='#888888').pack(anchor=tk.W, pady=(0, 15))
+                 font=('Segoe UI', 8), foreground=PALETTE.text_hint).pack(anchor=tk.W, pady=(0, 15))
         
         # API Token
         ttk.Label(main_frame, text="API Token:").pack(anchor=tk.W, pady=(0, 5))
@@ -1319,7 +1880,7 @@ class JiraTicketViewer:
         api_token_entry.insert(0, self.api_token)
         
         ttk.Label(main_frame, text="Example: ATATT3xFfGF0... (long string from Jira Account Settings)", 
-                 font=('Segoe UI', 8), foreground='#888888').pack(anchor=tk.W, pady=(0, 10))
+                 font=('Segoe UI', 8), foreground=PALETTE.text_hint).pack(anchor=tk.W, pady=(0, 10))
         
         # Security Notice
         security_frame = ttk.Frame(main_frame)
@@ -1330,7 +1891,7 @@ class JiraTicketViewer:
         
         # Help
         help_text = ttk.Label(main_frame, text="💡 Generate API token: Jira → Profile → Personal Access Tokens → Create Token", 
-                             font=('Segoe UI', 9), foreground='#cccccc')
+                             font=('Segoe UI', 9), foreground=PALETTE.text_secondary)
         help_text.pack(anchor=tk.W, pady=(0, 20))
         
         # Buttons
@@ -1382,9 +1943,14 @@ class JiraTicketViewer:
         
     def open_dashboard(self):
         """Open Jira dashboard"""
+        import webbrowser
         dashboard_url = f"{self.jira_url}/jira/servicedesk/projects/{self.project_key}/summary"
         webbrowser.open(dashboard_url)
         
+    def _pick_transition(self, transitions_data, pattern):
+        """Return the first available transition whose name matches pattern, or None"""
+        return next((t for t in transitions_data.get('transitions', []) if pattern.search(t['name'])), None)
+
     def resolve_ticket(self):
         """Resolve selected ticket"""
         if not self.current_ticket:
@@ -1397,21 +1963,20 @@ class JiraTicketViewer:
             messagebox.showerror("Error", "Could not get transitions")
             return
         
-        resolve_transitions = [t for t in transitions_data['transitions'] 
-                              if 'resolve' in t['name'].lower() or 'done' in t['name'].lower()]
+        resolve_transition = self._pick_transition(transitions_data, _RESOLVE_TRANSITION_RE)
         
-        if not resolve_transitions:
+        if not resolve_transition:
             # If no resolve transition, open the status change dialog
             messagebox.showinfo("No Resolve Transition", "No resolve transition available. Opening status change dialog...")
             self.change_ticket_status()
             return
         
-        transition_data = {"transition": {"id": resolve_transitions[0]['id']}}
+        transition_data = {"transition": {"id": resolve_transition['id']}}
         result = self.make_jira_request(f"issue/{ticket_key}/transitions", method="POST", data=transition_data)
         
         if result is not None:
             messagebox.showinfo("Success", f"Ticket {ticket_key} resolved!")
-            self.load_all_tickets_threaded()
+            self.refresh_single_ticket(ticket_key)
     
     def change_ticket_status(self):
         """Show dialog to manually change ticket status"""
@@ -1437,7 +2002,7 @@ class JiraTicketViewer:
         status_window = tk.Toplevel(self.root)
         status_window.title(f"Change Status - {ticket_key}")
         status_window.geometry("500x400")
-        status_window.configure(bg='#1a1a1a')
+        status_window.configure(bg=PALETTE.bg_primary)
         status_window.transient(self.root)
         status_window.grab_set()
         
@@ -1457,7 +2022,7 @@ class JiraTicketViewer:
         listbox_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
         listbox = tk.Listbox(listbox_frame, height=10, font=('Segoe UI', 10),
-                           bg='#2d2d2d', fg='#ffffff', selectbackground='#0078d4')
+                           bg=PALETTE.bg_input, fg=PALETTE.text, selectbackground=PALETTE.accent)
         scrollbar = ttk.Scrollbar(listbox_frame, orient="vertical", command=listbox.yview)
         listbox.configure(yscrollcommand=scrollbar.set)
         
@@ -1501,7 +2066,7 @@ class JiraTicketViewer:
             if result is not None:
                 messagebox.showinfo("Success", f"Ticket {ticket_key} status changed to '{to_status}'!")
                 status_window.destroy()
-                self.load_all_tickets_threaded()
+                self.refresh_single_ticket(ticket_key)
             else:
                 messagebox.showerror("Error", "Failed to change ticket status")
         
@@ -1533,6 +2098,19 @@ This will change the ticket status."""
         if transitions:
             listbox.selection_set(0)
         
+    def get_my_account(self):
+        """Return (accountId, displayName) for the configured user, asking Jira once per email"""
+        if self.user_email in self._account_by_user:
+            print(f"[DEBUG] Using cached account for {self.user_email}")
+            return self._account_by_user[self.user_email]
+        user_data = self.make_jira_request("myself")
+        if not user_data:
+            return None
+        account = (user_data.get('accountId'), user_data.get('displayName', 'You'))
+        if account[0]:
+            self._account_by_user[self.user_email] = account
+        return account
+
     def assign_to_me(self):
         """Assign ticket to current user"""
         if not self.current_ticket:
@@ -1548,14 +2126,13 @@ This will change the ticket status."""
         
         # Get current user info
         print("[DEBUG] Getting current user info...")
-        user_data = self.make_jira_request("myself")
+        user_data = self.get_my_account()
         
         if not user_data:
             messagebox.showerror("Error", "Failed to get user information")
             return
             
-        account_id = user_data.get('accountId')
-        display_name = user_data.get('displayName', 'You')
+        account_id, display_name = user_data
         
         print(f"[DEBUG] User account_id: {account_id}, display_name: {display_name}")
         
@@ -1608,19 +2185,12 @@ This will change the ticket status."""
                 }
                 # Refresh the ticket details display
                 self.load_ticket_details()
-                
-                # Update the tree view item immediately
-                for item in self.tree.get_children():
-                    values = self.tree.item(item)['values']
-                    if values and values[0] == ticket_key:
-                        new_values = list(values)
-                        new_values[4] = display_name  # Assignee is at index 4
-                        self.tree.item(item, values=new_values)
-                        break
-            
-            # Automatically refresh all tickets in background for data consistency
-            self.load_all_tickets_threaded()
+            
+            # Re-read just this ticket so its row and the filter indexes match Jira
+            self.refresh_single_ticket(ticket_key)
         else:
+            # The cached account may be the problem (e.g. expired access) - look it up again next time
+            self._account_by_user.pop(self.user_email, None)
             messagebox.showerror("Error", "Failed to assign ticket. Check the debug output for details.")
 
     def assign_to_will(self):
@@ -1637,20 +2207,24 @@ This will change the ticket status."""
         will_account_id = "712020:c8e4842e-f5d4-48ae-8f27-d4e84e61b62c"  # This is a placeholder
         will_display_name = "Will Sessions"
 
-        # Try to get Will's actual account ID by searching
-        try:
-            search_result = self.make_jira_request("user/search?query=Will Sessions")
-            if search_result and len(search_result) > 0:
-                # Find exact match
-                for user in search_result:
-                    if user.get('displayName') == 'Will Sessions':
-                        will_account_id = user.get('accountId')
-                        print(f"[DEBUG] Found Will Sessions with accountId: {will_account_id}")
-                        break
-        except Exception as e:
-            print(f"[DEBUG] Could not search for user: {e}")
-            messagebox.showerror("Error", "Could not find Will Sessions in Jira users")
-            return
+        # Try to get Will's actual account ID by searching (once per session)
+        if will_display_name in self._account_by_user:
+            will_account_id = self._account_by_user[will_display_name][0]
+        else:
+            try:
+                search_result = self.make_jira_request("user/search?query=Will Sessions")
+                if search_result and len(search_result) > 0:
+                    # Find exact match
+                    for user in search_result:
+                        if user.get('displayName') == 'Will Sessions':
+                            will_account_id = user.get('accountId')
+                            print(f"[DEBUG] Found Will Sessions with accountId: {will_account_id}")
+                            self._account_by_user[will_display_name] = (will_account_id, will_display_name)
+                            break
+            except Exception as e:
+                print(f"[DEBUG] Could not search for user: {e}")
+                messagebox.showerror("Error", "Could not find Will Sessions in Jira users")
+                return
 
         # Try assignment methods
         print(f"[DEBUG] Trying assignment methods for Will...")
@@ -1692,18 +2266,10 @@ This will change the ticket status."""
                 # Refresh the ticket details display
                 self.load_ticket_details()
 
-                # Update the tree view item immediately
-                for item in self.tree.get_children():
-                    values = self.tree.item(item)['values']
-                    if values and values[0] == ticket_key:
-                        new_values = list(values)
-                        new_values[4] = will_display_name  # Assignee is at index 4
-                        self.tree.item(item, values=new_values)
-                        break
-
-            # Automatically refresh all tickets in background for data consistency
-            self.load_all_tickets_threaded()
+            # Re-read just this ticket so its row and the filter indexes match Jira
+            self.refresh_single_ticket(ticket_key)
         else:
+            self._account_by_user.pop(will_display_name, None)
             messagebox.showerror("Error", "Failed to assign ticket to Will. Check the debug output for details.")
 
     def add_comment_to_ticket(self, ticket_key, comment_text):
@@ -1782,7 +2348,10 @@ This will change the ticket status."""
         if not self.current_ticket:
             return
 
-        comment_text = self.comment_entry.get(1.0, tk.END).strip()
+        # index('end-1c') is '1.0' for an empty widget - skip copying the text in that case
+        comment_text = ''
+        if self.comment_entry.index('end-1c') != '1.0':
+            comment_text = self.comment_entry.get(1.0, tk.END).strip()
         if not comment_text:
             messagebox.showwarning("Warning", "Please enter a comment")
             return
@@ -1808,16 +2377,15 @@ This will change the ticket status."""
         if not transitions_data:
             return
         
-        close_transitions = [t for t in transitions_data['transitions'] 
-                            if any(k in t['name'].lower() for k in ['close', 'done', 'complete'])]
+        close_transition = self._pick_transition(transitions_data, _CLOSE_TRANSITION_RE)
         
-        if close_transitions:
-            transition_data = {"transition": {"id": close_transitions[0]['id']}}
+        if close_transition:
+            transition_data = {"transition": {"id": close_transition['id']}}
             result = self.make_jira_request(f"issue/{ticket_key}/transitions", method="POST", data=transition_data)
             
             if result is not None:
                 messagebox.showinfo("Success", f"Ticket {ticket_key} closed!")
-                self.load_all_tickets_threaded()
+                self.refresh_single_ticket(ticket_key)
         
     def open_ticket(self):
         """Reopen selected ticket"""
@@ -1830,16 +2398,15 @@ This will change the ticket status."""
         if not transitions_data:
             return
         
-        open_transitions = [t for t in transitions_data['transitions'] 
-                           if any(k in t['name'].lower() for k in ['open', 'reopen', 'start'])]
+        open_transition = self._pick_transition(transitions_data, _OPEN_TRANSITION_RE)
         
-        if open_transitions:
-            transition_data = {"transition": {"id": open_transitions[0]['id']}}
+        if open_transition:
+            transition_data = {"transition": {"id": open_transition['id']}}
             result = self.make_jira_request(f"issue/{ticket_key}/transitions", method="POST", data=transition_data)
             
             if result is not None:
                 messagebox.showinfo("Success", f"Ticket {ticket_key} reopened!")
-                self.load_all_tickets_threaded()
+                self.refresh_single_ticket(ticket_key)
     
     def create_new_ticket(self):
         """Create a new Jira ticket with screenshot support"""
@@ -2049,21 +2616,31 @@ This will change the ticket status."""
                     messagebox.showwarning("No Image", "No image found in clipboard. Copy an image first.")
                     return
                 
-                # Save to temporary file
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                img.save(temp_file.name, 'PNG')
-                temp_file.close()
-                
-                # Add to attachments list
-                self.attachments.append(temp_file.name)
-                
-                # Update UI
-                update_attachment_list()
+                def on_saved(path):
+                    # Add to attachments list
+                    self.attachments.append(path)
+                    
+                    # Update UI
+                    update_attachment_list()
+                    
+                    # Automatically show preview of the pasted screenshot
+                    show_image_preview(path)
+                    
+                    messagebox.showinfo("Success", f"Screenshot added! ({len(self.attachments)} file(s) attached)")
                 
-                # Automatically show preview of the pasted screenshot
-                show_image_preview(temp_file.name)
+                def save_png():
+                    # PNG encoding is slow for big screens - do it off the Tk thread with fast zlib settings
+                    try:
+                        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
+                        with temp_file:
+                            compress_level = 0 if img.width * img.height <= SCREENSHOT_RAW_PNG_PIXELS else 1
+                            img.save(temp_file, format='PNG', compress_level=compress_level)
+                        self.root.after(0, on_saved, temp_file.name)
+                    except Exception as e:
+                        error_msg = f"Failed to paste screenshot: {str(e)}"
+                        self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
                 
-                messagebox.showinfo("Success", f"Screenshot added! ({len(self.attachments)} file(s) attached)")
+                threading.Thread(target=save_png, daemon=True).start()
                 
             except ImportError:
                 messagebox.showerror("Error", "PIL (Pillow) library required for screenshot support.\nInstall with: pip install Pillow")
@@ -2105,10 +2682,10 @@ This will change the ticket status."""
                 # Preview button for images
                 if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
                     ttk.Button(file_info_frame, text="👁️ Preview", 
-                              command=lambda fp=filepath: show_image_preview(fp)).pack(side=tk.LEFT, padx=(10, 0))
+                              command=partial(show_image_preview, filepath)).pack(side=tk.LEFT, padx=(10, 0))
                 
                 ttk.Button(info_frame, text="❌", width=3, 
-                          command=lambda idx=i: remove_attachment(idx)).pack(side=tk.RIGHT)
+                          command=partial(remove_attachment, i)).pack(side=tk.RIGHT)
         
         def show_image_preview(filepath):
             """Show image preview in a popup window"""
@@ -2174,7 +2751,7 @@ This will change the ticket status."""
         button_bottom_frame.pack(fill=tk.X, pady=(10, 0))
         
         def create_ticket():
-            """Create the ticket via API"""
+            """Create the ticket via API (network work runs off the Tk thread)"""
             summary = summary_entry.get().strip()
             description = description_text.get(1.0, tk.END).strip()
             
@@ -2182,18 +2759,44 @@ This will change the ticket status."""
                 messagebox.showwarning("Missing Summary", "Please enter a ticket summary")
                 return
             
-            # Get current user for assignment and default reporter
-            user_data = self.make_jira_request("myself")
+            # Read everything the worker needs from Tk now
+            custom_reporter_id = getattr(reporter_entry, 'account_id', None)
+            attachments = list(self.attachments)
+            create_btn.config(state='disabled')
+            threading.Thread(target=do_create, args=(summary, description, custom_reporter_id, attachments),
+                             daemon=True).start()
+        
+        def on_create_failed(message):
+            """Report a failed create and let the user try again"""
+            create_btn.config(state='normal')
+            messagebox.showerror("Error", message)
+        
+        def on_created(ticket_key, failed_uploads):
+            """Finish up on the Tk thread once the ticket exists"""
+            message = f"Ticket {ticket_key} created successfully!"
+            if failed_uploads:
+                message += f"\n\nThese attachments failed to upload: {', '.join(failed_uploads)}"
+            messagebox.showinfo("Success", message)
+            self.attachments = []
+            
+            # Close dialog and refresh tickets
+            ticket_window.destroy()
+            self.load_all_tickets_threaded()
+        
+        def do_create(summary, description, custom_reporter_id, attachments):
+            """Create the ticket and upload its attachments"""
+            # Get current user for assignment and default reporter (cached after the first time)
+            user_data = self.get_my_account()
             if not user_data:
-                messagebox.showerror("Error", "Failed to get user information")
+                self.root.after(0, on_create_failed, "Failed to get user information")
                 return
             
-            account_id = user_data.get('accountId')
+            account_id = user_data[0]
             
             # Determine reporter
             reporter_account_id = account_id  # Default to current user
-            if hasattr(reporter_entry, 'account_id') and reporter_entry.account_id:
-                reporter_account_id = reporter_entry.account_id
+            if custom_reporter_id:
+                reporter_account_id = custom_reporter_id
                 print(f"[DEBUG] Using custom reporter: {reporter_account_id}")
             else:
                 print(f"[DEBUG] Using current user as reporter: {account_id}")
@@ -2231,7 +2834,7 @@ This will change the ticket status."""
             }
             
             print(f"[DEBUG] Method 1 - ADF Ticket data: {ticket_data_1}")
-            result = self.make_jira_request("issue", method="POST", data=ticket_data_1)
+            result = self.make_jira_request("issue", method="POST", data=ticket_data_1, show_errors=False)
             
             if result is None:
                 print("[DEBUG] Method 1 (ADF) failed, trying Method 2 (plain text)...")
@@ -2249,7 +2852,7 @@ This will change the ticket status."""
                 }
                 
                 print(f"[DEBUG] Method 2 - Plain text Ticket data: {ticket_data_2}")
-                result = self.make_jira_request("issue", method="POST", data=ticket_data_2)
+                result = self.make_jira_request("issue", method="POST", data=ticket_data_2, show_errors=False)
             
             if result is None:
                 print("[DEBUG] Method 2 failed, trying Method 3...")
@@ -2293,43 +2896,40 @@ This will change the ticket status."""
             
             if result:
                 ticket_key = result.get('key')
-                messagebox.showinfo("Success", f"Ticket {ticket_key} created successfully!")
                 
-                # Upload attachments if any
-                if self.attachments:
-                    self.upload_attachments(ticket_key)
-                
-                # Close dialog and refresh tickets
-                ticket_window.destroy()
-                self.load_all_tickets_threaded()
+                # Upload attachments if any (in parallel)
+                failed_uploads = self.upload_attachments(ticket_key, attachments) if attachments else []
+                self.root.after(0, on_created, ticket_key, failed_uploads)
             else:
-                messagebox.showerror("Error", "Failed to create ticket")
+                self.root.after(0, on_create_failed, "Failed to create ticket")
         
-        ttk.Button(button_bottom_frame, text="✅ Create Ticket", command=create_ticket).pack(side=tk.RIGHT)
+        create_btn = ttk.Button(button_bottom_frame, text="✅ Create Ticket", command=create_ticket)
+        create_btn.pack(side=tk.RIGHT)
         ttk.Button(button_bottom_frame, text="❌ Cancel", command=ticket_window.destroy).pack(side=tk.RIGHT, padx=(0, 5))
     
-    def upload_attachments(self, ticket_key):
-        """Upload attachments to a ticket"""
-        for filepath in self.attachments:
-            try:
-                import os
-                if not os.path.exists(filepath):
-                    continue
-                    
-                with open(filepath, 'rb') as f:
-                    files = {'file': f}
-                    result = self.make_jira_request(f"issue/{ticket_key}/attachments", method="POST", files=files)
-                    
-                if result:
-                    print(f"[DEBUG] Uploaded attachment: {os.path.basename(filepath)}")
-                else:
-                    print(f"[DEBUG] Failed to upload: {os.path.basename(filepath)}")
-                    
-            except Exception as e:
-                print(f"[DEBUG] Error uploading {filepath}: {str(e)}")
-        
-        # Clear attachments list
-        self.attachments = []
+    def upload_attachments(self, ticket_key, filepaths):
+        """Upload files to a ticket side by side on the worker pool; returns names that failed"""
+        futures = [self.http_pool.submit(self.upload_attachment, ticket_key, filepath) for filepath in filepaths]
+        return [os.path.basename(filepath) for filepath, future in zip(filepaths, futures) if not future.result()]
+
+    def upload_attachment(self, ticket_key, filepath):
+        """Upload one file to a ticket, returning True on success"""
+        try:
+            if not os.path.exists(filepath):
+                return False
+                
+            with open(filepath, 'rb', buffering=UPLOAD_READ_BUFFER) as f:
+                files = {'file': f}
+                result = self.make_jira_request(f"issue/{ticket_key}/attachments", method="POST", files=files)
+                
+            if result:
+                print(f"[DEBUG] Uploaded attachment: {os.path.basename(filepath)}")
+                return True
+            print(f"[DEBUG] Failed to upload: {os.path.basename(filepath)}")
+                
+        except Exception as e:
+            print(f"[DEBUG] Error uploading {filepath}: {str(e)}")
+        return False
 
     def open_ticket_in_browser(self):
         """Open ticket in web browser"""
@@ -2337,6 +2937,7 @@ This will change the ticket status."""
             return
             
         ticket_key = self.current_ticket.get('key')
+        import webbrowser
         url = f"{self.jira_url}/browse/{ticket_key}"
         webbrowser.open(url)
         
@@ -2434,7 +3035,7 @@ This will change the ticket status."""
         # Machine ID display
         machine_id = self.license_manager.get_machine_id()
         ttk.Label(main_frame, text=f"Machine ID: {machine_id}", 
-                 font=('Courier', 9), foreground='#cccccc').pack(anchor=tk.W, pady=(0, 15))
+                 font=('Courier', 9), foreground=PALETTE.text_secondary).pack(anchor=tk.W, pady=(0, 15))
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
@@ -2492,7 +3093,7 @@ Premium: All features, unlimited users, priority support
 
 Contact: sales@example.com for license keys"""
         
-        ttk.Label(info_frame, text=info_text, justify=tk.LEFT, foreground='#cccccc').pack(anchor=tk.W)
+        ttk.Label(info_frame, text=info_text, justify=tk.LEFT, foreground=PALETTE.text_secondary).pack(anchor=tk.W)
     
     def show_license_expired_dialog(self):
         """Show license expired dialog"""
@@ -2515,8 +3116,6 @@ Contact: sales@example.com for license keys"""
         if not self.reminder_manager:
             return  # Reminder system disabled
             
-        from datetime import datetime, timedelta
-        
         if start_date is None:
             start_date = datetime.now() + timedelta(days=3)  # Default: starting in 3 days
         
@@ -2561,8 +3160,6 @@ Contact: sales@example.com for license keys"""
         if not self.reminder_manager:
             return  # Reminder system disabled
             
-        from datetime import datetime, timedelta
-        
         if last_day is None:
             last_day = datetime.now() + timedelta(days=3)  # Default: leaving in 3 days
         
@@ -2613,39 +3210,27 @@ Contact: sales@example.com for license keys"""
     
     def extract_dates_from_ticket(self, ticket_data):
         """Extract start/leave dates from ticket summary or description"""
-        import re
-        from datetime import datetime
-        
         # Get ticket text to search
         summary = ticket_data.get('fields', {}).get('summary', '').lower()
         description_content = ticket_data.get('fields', {}).get('description', {})
         
         # Extract description text from ADF format
-        description = ""
+        description_parts = []
         if isinstance(description_content, dict) and 'content' in description_content:
             for content_item in description_content.get('content', []):
                 if content_item.get('type') == 'paragraph':
                     for text_item in content_item.get('content', []):
                         if text_item.get('type') == 'text':
-                            description += text_item.get('text', '') + " "
+                            description_parts.append(text_item.get('text', ''))
+        description = " ".join(description_parts)
         
-        ticket_text = f"{summary} {description}".lower()
+        # summary is already lowercase - only the (possibly long) description still needs it
+        ticket_text = f"{summary} {description.lower()}"
         print(f"[DEBUG] Searching for dates in: {ticket_text[:100]}...")
         
-        # Common date patterns
-        date_patterns = [
-            r'starts?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',  # "starts on 15/09/2024"
-            r'start\s+date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',      # "start date: 15/09/2024"
-            r'begin[s]?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', # "begins on 15/09/2024"
-            r'leaves?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',   # "leaves on 20/09/2024"
-            r'last\s+day:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',        # "last day: 20/09/2024"
-            r'finish[es]?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', # "finishes on 20/09/2024"
-            r'end[s]?\s+(?:on\s+)?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',   # "ends on 20/09/2024"
-        ]
-        
         found_dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, ticket_text)
+        for pattern in _TICKET_DATE_PATTERNS:
+            matches = pattern.findall(ticket_text)
             for match in matches:
                 try:
                     # Try different date formats
@@ -2655,7 +3240,7 @@ Contact: sales@example.com for license keys"""
                             found_dates.append({
                                 'date': parsed_date,
                                 'original_text': match,
-                                'pattern': pattern
+                                'pattern': pattern.pattern
                             })
                             print(f"[DEBUG] Found date: {parsed_date.strftime('%Y-%m-%d')} from '{match}'")
                             break
@@ -2672,9 +3257,7 @@ Contact: sales@example.com for license keys"""
         ticket_key = ticket_data.get('key', 'Unknown')
         
         # Extract any email addresses from the ticket
-        import re
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, str(ticket_data))
+        emails = _EMAIL_RE.findall(str(ticket_data))
         user_email = emails[0] if emails else "user@company.com"
         
         # Extract dates from ticket
@@ -2865,7 +3448,7 @@ if __name__ == "__main__":
     root = tk.Tk()
     
     # Configure for full screen usage
-    root.configure(bg='#1a1a1a')
+    root.configure(bg=PALETTE.bg_primary)
     
     app = JiraTicketViewer(root)
     
@@ -11,6 +11,10 @@ from typing import Dict, List, Any, Optional
 from ai_config import get_openai_api_key, AI_PROVIDER, OPENAI_MODEL, MAX_TOKENS, TEMPERATURE
 from ai_settings import AISettings
 
+# Runs of anything that isn't printable, non-space ASCII
+_NON_PRINTABLE_RUN_RE = re.compile(r'[^\x21-\x7e]+')
+
+
 class AITicketSummarizer:
     def __init__(self):
         self.client = None
@@ -69,7 +73,10 @@ class AITicketSummarizer:
 
             # Format creation date
             created_readable = "Unknown"
-            if created:
+            if len(created) >= 16 and created[4] == '-' and created[10] == 'T':
+                # Jira timestamps start with YYYY-MM-DDTHH:MM - slice instead of parsing
+                created_readable = f"{created[:10]} at {created[11:16]}"
+            elif created:
                 try:
                     created_date = datetime.fromisoformat(created.replace('Z', '+00:00'))
                     created_readable = created_date.strftime('%Y-%m-%d at %H:%M')
@@ -442,38 +449,9 @@ Status: {'Ready to Process' if has_detail else 'Needs More Information'}
         if not isinstance(text, str):
             text = str(text)
 
-        # ULTRA AGGRESSIVE: Handle encoding errors immediately
-        try:
-            # Try to encode to see if there are issues
-            text.encode('cp1252')
-        except UnicodeEncodeError:
-            # If it fails, be super aggressive
-            safe_chars = []
-            for char in text:
-                try:
-                    char.encode('cp1252')
-                    safe_chars.append(char)
-                except UnicodeEncodeError:
-                    safe_chars.append(' ')  # Replace problematic chars with space
-            text = ''.join(safe_chars)
-
-        # SUPER AGGRESSIVE: Strip ALL non-printable ASCII
-        clean_text = ""
-        for char in text:
-            char_code = ord(char)
-            if 32 <= char_code <= 126:  # Only printable ASCII characters
-                clean_text += char
-            elif char_code in [9, 10, 13]:  # Tab, newline, carriage return
-                clean_text += char
-            else:
-                # Replace everything else with space
-                clean_text += " "
-
-        # Remove multiple spaces
-        import re
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-
-        return clean_text
+        # Only printable ASCII survives; every other run of characters (including
+        # whitespace and anything cp1252 can't encode) collapses to a single space
+        return _NON_PRINTABLE_RUN_RE.sub(' ', text).strip()
 
 
 def format_analysis_for_display(analysis: Dict[str, Any]) -> str:
@@ -5,6 +5,7 @@ Main GUI class for Jira Ticket Viewer - Complete refactored version with all fea
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+from functools import partial
 
 # Import our modules
 from config import (WINDOW_TITLE, WINDOW_GEOMETRY, THEME_COLORS, DEFAULT_EMAIL, 
@@ -17,7 +18,90 @@ from comment_system import CommentSystemManager
 from attachment_manager import AttachmentManager
 from user_management import UserManagementSystem
 from html_viewer import HTMLTicketViewer
-from utils import load_quick_mentions
+from utils import load_quick_mentions, TicketView
+
+# Delay before a filter change is applied, so rapid toggles only filter once (ms)
+FILTER_DEBOUNCE_MS = 150
+# Selection has to rest this long before full details/comments are fetched (ms)
+DETAILS_LOAD_DELAY_MS = 300
+
+# ttk style table applied by setup_dark_mode - built once from THEME_COLORS
+_C = THEME_COLORS
+_THEME = {
+    'TFrame': {'configure': {'background': _C['bg_primary']}},
+    'TLabel': {'configure': {'background': _C['bg_primary'], 'foreground': _C['text_primary']}},
+    'TButton': {
+        'configure': {'background': _C['bg_button'], 'foreground': _C['text_primary'],
+                      'borderwidth': 0, 'focuscolor': 'none', 'relief': 'flat', 'padding': (12, 8)},
+        'map': {'background': [('active', _C['bg_button_hover']), ('pressed', _C['bg_button_hover'])]},
+    },
+    'TEntry': {
+        'configure': {'background': _C['bg_input'], 'foreground': _C['text_primary'],
+                      'borderwidth': 1, 'insertcolor': _C['text_primary'], 'relief': 'flat',
+                      'bordercolor': _C['border'], 'fieldbackground': _C['bg_input']},
+        'map': {'bordercolor': [('focus', _C['accent'])],
+                'fieldbackground': [('focus', _C['bg_input'])],
+                'foreground': [('focus', _C['text_primary']), ('!focus', _C['text_primary'])]},
+    },
+    'TCombobox': {
+        'configure': {'background': _C['bg_input'], 'foreground': _C['text_primary'],
+                      'borderwidth': 1, 'arrowcolor': _C['text_primary'], 'relief': 'flat',
+                      'bordercolor': _C['border'], 'fieldbackground': _C['bg_input'],
+                      'selectbackground': _C['bg_input'], 'selectforeground': _C['text_primary']},
+        'map': {'background': [('readonly', _C['bg_input'])],
+                'fieldbackground': [('readonly', _C['bg_input'])],
+                'foreground': [('readonly', _C['text_primary'])],
+                'bordercolor': [('focus', _C['accent'])]},
+    },
+    'TLabelFrame': {'configure': {'background': _C['bg_primary'], 'foreground': _C['text_primary'],
+                                  'borderwidth': 1, 'relief': 'solid', 'bordercolor': _C['border']}},
+    'TLabelFrame.Label': {'configure': {'background': _C['bg_primary'], 'foreground': _C['text_primary']}},
+    'TCheckbutton': {'configure': {'background': _C['bg_primary'], 'foreground': _C['text_primary'],
+                                   'focuscolor': 'none'}},
+    'Treeview': {
+        'configure': {'background': _C['bg_surface'], 'foreground': _C['text_primary'],
+                      'fieldbackground': _C['bg_surface'], 'borderwidth': 0, 'relief': 'flat'},
+        'map': {'background': [('selected', _C['accent'])],
+                'foreground': [('selected', _C['text_primary'])]},
+    },
+    'Treeview.Heading': {
+        'configure': {'background': _C['bg_secondary'], 'foreground': _C['text_primary'],
+                      'borderwidth': 1, 'relief': 'flat', 'bordercolor': _C['border']},
+        'map': {'background': [('active', _C['bg_button'])]},
+    },
+    'Vertical.TScrollbar': {'configure': {'background': _C['bg_secondary'], 'troughcolor': _C['bg_primary'],
+                                          'borderwidth': 0, 'arrowcolor': _C['text_secondary']}},
+    'TNotebook': {'configure': {'background': _C['bg_primary'], 'borderwidth': 0}},
+    'TNotebook.Tab': {
+        'configure': {'background': _C['bg_secondary'], 'foreground': _C['text_primary'],
+                      'padding': [16, 10], 'borderwidth': 0},
+        'map': {'background': [('selected', _C['bg_button']), ('active', _C['bg_button_hover'])]},
+    },
+}
+
+
+def _key_number(key):
+    """Numeric part of a ticket key (ITS-123 -> 123) for sorting"""
+    number = key.rsplit('-', 1)[-1]
+    return int(number) if '-' in key and number.isdigit() else 0
+
+
+def _filter_fields(view):
+    """The TicketView values the ticket filters look at"""
+    return (view.status_lower, view.assignee_email, view.reporter_email, view.type_name)
+
+
+# Sort key per tree column, computed straight from a TicketView (no Tk round trip per row)
+_SORT_KEYS = {
+    'Key': lambda view: _key_number(view.key),
+    'Type': lambda view: view.type_name.lower(),
+    'Summary': lambda view: view.summary[:50].lower(),
+    'Status': lambda view: view.status_lower,
+    'Priority': lambda view: view.priority.lower(),
+    'Reporter': lambda view: view.reporter_name.lower(),
+    'Assignee': lambda view: view.assignee_name.lower(),
+    'Created': lambda view: view.created_str,
+}
 
 
 class JiraTicketViewer:
@@ -32,6 +116,15 @@ class JiraTicketViewer:
         self.html_viewer_window = None
         self.sort_reverse = {}
         
+        # Tree rows use the ticket key as item id; track which ones are attached
+        self._iid_by_key = {}
+        self._visible_keys = set()
+        self._views_by_key = {}
+        self._ticket_by_key = {}
+        self._filter_after_id = None
+        self._details_after_id = None
+        self._pending_details_key = None
+        
         # Configure dark mode
         self.setup_dark_mode()
         
@@ -40,6 +133,7 @@ class JiraTicketViewer:
             email_callback=self.get_user_email,
             status_callback=self.update_status
         )
+        self._executor = self.api_client.executor
         
         # Initialize specialized managers
         self.search_filter = SearchFilterManager(
@@ -84,111 +178,14 @@ class JiraTicketViewer:
         style = ttk.Style()
         style.theme_use('clam')
         
-        # Get colors from config
-        colors = THEME_COLORS
-        
-        # Configure main components
-        style.configure('TFrame', background=colors['bg_primary'])
-        style.configure('TLabel', background=colors['bg_primary'], foreground=colors['text_primary'])
-        
-        # Buttons
-        style.configure('TButton', 
-                       background=colors['bg_button'], 
-                       foreground=colors['text_primary'],
-                       borderwidth=0, 
-                       focuscolor='none', 
-                       relief='flat',
-                       padding=(12, 8))
-        style.map('TButton', 
-                 background=[('active', colors['bg_button_hover']), ('pressed', colors['bg_button_hover'])])
-        
-        # Entry fields
-        style.configure('TEntry', 
-                       background=colors['bg_input'], 
-                       foreground=colors['text_primary'],
-                       borderwidth=1, 
-                       insertcolor=colors['text_primary'], 
-                       relief='flat',
-                       bordercolor=colors['border'],
-                       fieldbackground=colors['bg_input'])
-        style.map('TEntry', 
-                 bordercolor=[('focus', colors['accent'])],
-                 fieldbackground=[('focus', colors['bg_input'])],
-                 foreground=[('focus', colors['text_primary']), ('!focus', colors['text_primary'])])
-        
-        # Combobox
-        style.configure('TCombobox', 
-                       background=colors['bg_input'], 
-                       foreground=colors['text_primary'],
-                       borderwidth=1, 
-                       arrowcolor=colors['text_primary'], 
-                       relief='flat',
-                       bordercolor=colors['border'],
-                       fieldbackground=colors['bg_input'],
-                       selectbackground=colors['bg_input'],
-                       selectforeground=colors['text_primary'])
-        style.map('TCombobox', 
-                 background=[('readonly', colors['bg_input'])],
-                 fieldbackground=[('readonly', colors['bg_input'])],
-                 foreground=[('readonly', colors['text_primary'])],
-                 bordercolor=[('focus', colors['accent'])])
-        
-        # Label frames
-        style.configure('TLabelFrame', 
-                       background=colors['bg_primary'], 
-                       foreground=colors['text_primary'],
-                       borderwidth=1, 
-                       relief='solid', 
-                       bordercolor=colors['border'])
-        style.configure('TLabelFrame.Label', 
-                       background=colors['bg_primary'], 
-                       foreground=colors['text_primary'])
-        
-        # Checkbuttons
-        style.configure('TCheckbutton', 
-                       background=colors['bg_primary'], 
-                       foreground=colors['text_primary'],
-                       focuscolor='none')
-        
-        # Treeview
-        style.configure('Treeview', 
-                       background=colors['bg_surface'], 
-                       foreground=colors['text_primary'],
-                       fieldbackground=colors['bg_surface'], 
-                       borderwidth=0, 
-                       relief='flat')
-        style.configure('Treeview.Heading', 
-                       background=colors['bg_secondary'], 
-                       foreground=colors['text_primary'],
-                       borderwidth=1, 
-                       relief='flat',
-                       bordercolor=colors['border'])
-        style.map('Treeview', 
-                 background=[('selected', colors['accent'])],
-                 foreground=[('selected', colors['text_primary'])])
-        style.map('Treeview.Heading',
-                 background=[('active', colors['bg_button'])])
-        
-        # Scrollbars
-        style.configure('Vertical.TScrollbar', 
-                       background=colors['bg_secondary'], 
-                       troughcolor=colors['bg_primary'], 
-                       borderwidth=0, 
-                       arrowcolor=colors['text_secondary'])
-        
-        # Notebook
-        style.configure('TNotebook', 
-                       background=colors['bg_primary'], 
-                       borderwidth=0)
-        style.configure('TNotebook.Tab', 
-                       background=colors['bg_secondary'], 
-                       foreground=colors['text_primary'],
-                       padding=[16, 10], 
-                       borderwidth=0)
-        style.map('TNotebook.Tab',
-                 background=[('selected', colors['bg_button']), ('active', colors['bg_button_hover'])])
-        
-        self.root.configure(bg=colors['bg_primary'])
+        # One pass over the theme table instead of a call per widget style
+        for style_name, spec in _THEME.items():
+            if 'configure' in spec:
+                style.configure(style_name, **spec['configure'])
+            if 'map' in spec:
+                style.map(style_name, **spec['map'])
+        
+        self.root.configure(bg=THEME_COLORS['bg_primary'])
     
     def setup_ui(self):
         """Setup the main user interface with all components"""
@@ -218,8 +215,11 @@ class JiraTicketViewer:
         config_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
         
         ttk.Label(config_frame, text="Email:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.email_entry = ttk.Entry(config_frame, width=30)
-        self.email_entry.insert(0, DEFAULT_EMAIL)
+        # Rebuild the cached credentials on every edit (on the Tk thread), so buttons that don't
+        # take focus never run with the previous email
+        self.email_var = tk.StringVar(value=DEFAULT_EMAIL)
+        self.email_var.trace_add('write', lambda *args: self.api_client.refresh_auth())
+        self.email_entry = ttk.Entry(config_frame, width=30, textvariable=self.email_var)
         self.email_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
         
         # Buttons frame
@@ -251,20 +251,20 @@ class JiraTicketViewer:
         self.ticket_filter_combo = ttk.Combobox(filter_frame, textvariable=self.ticket_filter_var, width=20,
                                                values=TICKET_FILTER_OPTIONS)
         self.ticket_filter_combo.grid(row=0, column=1, padx=(0, 10))
-        self.ticket_filter_combo.bind("<<ComboboxSelected>>", self.search_filter.filter_tickets)
+        self.ticket_filter_combo.bind("<<ComboboxSelected>>", self.schedule_filter)
         
         ttk.Label(filter_frame, text="Issue Type:").grid(row=0, column=2, sticky=tk.W, padx=(10, 5))
         self.issue_type_var = tk.StringVar(value="All")
         self.issue_type_combo = ttk.Combobox(filter_frame, textvariable=self.issue_type_var, width=25,
                                            values=ISSUE_TYPE_FILTER_OPTIONS)
         self.issue_type_combo.grid(row=0, column=3, padx=(0, 10))
-        self.issue_type_combo.bind("<<ComboboxSelected>>", self.search_filter.filter_tickets)
+        self.issue_type_combo.bind("<<ComboboxSelected>>", self.schedule_filter)
         
         # Hide completed tickets checkbox
         self.hide_completed_var = tk.BooleanVar(value=True)
         self.hide_completed_cb = ttk.Checkbutton(filter_frame, text="Hide Completed", 
                                                variable=self.hide_completed_var, 
-                                               command=self.search_filter.filter_tickets)
+                                               command=self.schedule_filter)
         self.hide_completed_cb.grid(row=0, column=4, padx=(10, 0))
         
         # Tickets treeview
@@ -276,7 +276,7 @@ class JiraTicketViewer:
         
         # Configure columns
         for col, config in TREE_COLUMNS.items():
-            self.tree.heading(col, text=col, command=lambda c=col: self.sort_treeview(c, False))
+            self.tree.heading(col, text=col, command=partial(self.sort_treeview, col, False))
             self.tree.column(col, width=config["width"], minwidth=config["minwidth"])
         
         # Scrollbar
@@ -400,6 +400,8 @@ class JiraTicketViewer:
         
         # Add right-click context menu for comments text
         self.comment_system.create_text_context_menu(self.comments_text)
+        # Looking at the comments pane loads them right away instead of waiting for the delay
+        self.comments_text.bind('<FocusIn>', self.load_pending_ticket_details)
         
         # Bind treeview events
         self.tree.bind("<<TreeviewSelect>>", self.on_ticket_select)
@@ -449,9 +451,15 @@ class JiraTicketViewer:
         
         # Set tree reference for search/filter
         self.search_filter.tree = self.tree
+        self.search_filter.set_display_callback(self.show_filtered_tickets)
+        
+        # Build API credentials from the pre-filled email
+        self.api_client.refresh_auth()
         
         # Set email callback for ticket operations
         self.ticket_ops.set_email_callback(self.get_user_email)
+        self.ticket_ops.set_root_window(self.root)
+        self.ticket_ops.set_refresh_ticket_callback(self.refresh_single_ticket)
         
         # Set UI references for comment system
         self.comment_system.set_ui_references(self.comment_text, self.comments_text)
@@ -487,6 +495,17 @@ class JiraTicketViewer:
         """Get user email for API client"""
         return self.email_entry.get()
     
+    def schedule_filter(self, event=None):
+        """Apply the filters once the widgets settle (coalesces rapid changes)"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(FILTER_DEBOUNCE_MS, self._run_scheduled_filter)
+    
+    def _run_scheduled_filter(self):
+        """Debounce timer callback for schedule_filter"""
+        self._filter_after_id = None
+        self.search_filter.filter_tickets()
+    
     def update_status(self, message):
         """Update status label"""
         self.status_label.config(text=message)
@@ -513,30 +532,84 @@ class JiraTicketViewer:
     
     def update_ticket_list(self, issues):
         """Update the treeview with ticket data"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items (attached and detached) in one call
+        self.tree.delete(*self._iid_by_key.values())
+        self.tree.delete(*self.tree.get_children())
+        self._iid_by_key = {}
         
         # Store tickets
         self.all_tickets = issues
+        self._ticket_by_key = {issue.get('key'): issue for issue in issues}
         self.search_filter.set_tickets(issues)
+        self.comment_system.clear_comment_cache()
+        
+        # Add tickets to treeview from the per-ticket views built by set_tickets
+        self._views_by_key = {}
+        for view in self.search_filter.ticket_views:
+            self._views_by_key[view.key] = view
+            self._iid_by_key[view.key] = self.tree.insert(
+                '', 'end', iid=view.key,
+                values=(view.key, view.type_name, view.summary[:50], view.status_name,
+                        view.priority, view.reporter_name, view.assignee_name, view.created_str))
+        self._visible_keys = set(self._iid_by_key)
+    
+    def show_filtered_tickets(self, tickets):
+        """Show only the given tickets, attaching/detaching just the rows that changed"""
+        new_keys = [issue.get('key', '') for issue in tickets]
+        new_key_set = set(new_keys)
+        
+        # Rows we don't know about yet mean the ticket list itself changed
+        if not new_key_set.issubset(self._iid_by_key):
+            self.update_ticket_list(tickets)
+            return
         
-        # Add tickets to treeview
-        for issue in issues:
-            fields = issue.get('fields', {})
-            
-            # Extract data safely
-            key = issue.get('key', '')
-            issue_type = fields.get('issuetype', {}).get('name', '')
-            summary = fields.get('summary', '')
-            status = fields.get('status', {}).get('name', '')
-            priority = fields.get('priority', {}).get('name', '') if fields.get('priority') else ''
-            reporter = fields.get('reporter', {}).get('displayName', '') if fields.get('reporter') else ''
-            assignee = fields.get('assignee', {}).get('displayName', '') if fields.get('assignee') else 'Unassigned'
-            created = fields.get('created', '')[:10] if fields.get('created') else ''
-            
-            self.tree.insert('', 'end', values=(key, issue_type, summary[:50], status, 
-                                              priority, reporter, assignee, created))
+        removed = [self._iid_by_key[key] for key in self._visible_keys - new_key_set]
+        if removed:
+            self.tree.detach(*removed)
+        
+        # Re-attach rows that came back, at their position in the filtered order
+        added = new_key_set - self._visible_keys
+        if added:
+            for index, key in enumerate(new_keys):
+                if key in added:
+                    self.tree.move(self._iid_by_key[key], '', index)
+        
+        self._visible_keys = new_key_set
+        
+        # Warm the comment cache for everything now on screen
+        self.comment_system.prefetch_comments(new_keys)
+    
+    def refresh_single_ticket(self, ticket_key):
+        """Re-fetch one ticket after an edit and update its row in place (safe from any thread)"""
+        def do_fetch():
+            updated = self.api_client.get_ticket_details(
+                ticket_key, fields="status,assignee,priority,summary,issuetype,reporter,created,attachment")
+            if updated:
+                self.root.after(0, self.apply_single_ticket, updated)
+        
+        self._executor.submit(do_fetch)
+    
+    def apply_single_ticket(self, updated):
+        """Merge a re-fetched ticket into the stored data and its treeview row"""
+        ticket_key = updated.get('key')
+        issue = self._ticket_by_key.get(ticket_key)
+        iid = self._iid_by_key.get(ticket_key)
+        if issue is None or iid is None:
+            return
+        
+        old_view = self._views_by_key.get(ticket_key)
+        issue.setdefault('fields', {}).update(updated.get('fields', {}))
+        view = TicketView(issue)
+        self._views_by_key[ticket_key] = view
+        self.search_filter.replace_ticket_view(view)
+        
+        self.tree.item(iid,
+                       values=(view.key, view.type_name, view.summary[:50], view.status_name,
+                               view.priority, view.reporter_name, view.assignee_name, view.created_str))
+        
+        # Status, assignee, reporter or type changes can move the ticket in or out of the current filter
+        if old_view is None or _filter_fields(view) != _filter_fields(old_view):
+            self.search_filter.filter_tickets()
     
     def on_ticket_select(self, event):
         """Handle ticket selection"""
@@ -544,48 +617,63 @@ class JiraTicketViewer:
         if not selection:
             return
         
-        item = selection[0]
-        ticket_key = self.tree.item(item)['values'][0]
+        # Row ids are the ticket keys, so no need to read the row back from Tk
+        ticket_key = selection[0]
         
         # Find the ticket in our stored data
-        for issue in self.all_tickets:
-            if issue.get('key') == ticket_key:
-                self.current_ticket = issue
-                self.show_ticket_details_fast(issue)
-                
-                # Update all managers with current ticket
-                self.ticket_ops.set_current_ticket(issue)
-                self.comment_system.set_current_ticket(issue)
-                self.attachment_manager.set_current_ticket(issue)
-                
-                # Enable buttons
-                self.enable_ticket_actions()
-                
-                # Load full details and comments in background
-                self.load_full_ticket_details(ticket_key)
-                break
+        issue = self._ticket_by_key.get(ticket_key)
+        if issue is None:
+            return
+        
+        self.current_ticket = issue
+        self.show_ticket_details_fast(issue)
+        
+        # Update all managers with current ticket
+        self.ticket_ops.set_current_ticket(issue)
+        self.comment_system.set_current_ticket(issue)
+        self.attachment_manager.set_current_ticket(issue)
+        
+        # Enable buttons
+        self.enable_ticket_actions()
+        
+        # Load full details and comments once the user stops moving through rows
+        self.comments_text.delete(1.0, tk.END)
+        self.schedule_full_ticket_details(ticket_key)
+    
+    def schedule_full_ticket_details(self, ticket_key):
+        """Fetch full details after DETAILS_LOAD_DELAY_MS unless another row is selected first"""
+        if self._details_after_id is not None:
+            self.root.after_cancel(self._details_after_id)
+        self._pending_details_key = ticket_key
+        self._details_after_id = self.root.after(DETAILS_LOAD_DELAY_MS, self.load_pending_ticket_details)
+    
+    def load_pending_ticket_details(self, event=None):
+        """Load details for the settled selection now (delay timer or comments pane focus)"""
+        if self._details_after_id is not None:
+            self.root.after_cancel(self._details_after_id)
+            self._details_after_id = None
+        ticket_key, self._pending_details_key = self._pending_details_key, None
+        if ticket_key:
+            self.load_full_ticket_details(ticket_key)
     
     def show_ticket_details_fast(self, issue):
         """Show basic ticket details immediately (fast display)"""
-        fields = issue.get('fields', {})
+        view = self._views_by_key.get(issue.get('key'))
+        if view is None or view.issue is not issue:
+            view = TicketView(issue)
         
         details = []
-        details.append(f"Key: {issue.get('key', 'Unknown')}")
-        details.append(f"Summary: {fields.get('summary', 'No summary')}")
-        details.append(f"Status: {fields.get('status', {}).get('name', 'Unknown')}")
-        details.append(f"Type: {fields.get('issuetype', {}).get('name', 'Unknown')}")
-        
-        priority = fields.get('priority')
-        if priority:
-            details.append(f"Priority: {priority.get('name', 'Not set')}")
-        
-        assignee = fields.get('assignee')
-        if assignee:
-            details.append(f"Assignee: {assignee.get('displayName', 'Unknown')}")
-        else:
-            details.append("Assignee: Unassigned")
+        details.append(f"Key: {view.key or 'Unknown'}")
+        details.append(f"Summary: {view.summary or 'No summary'}")
+        details.append(f"Status: {view.status_name or 'Unknown'}")
+        details.append(f"Type: {view.type_name or 'Unknown'}")
         
-        description = fields.get('description', '')
+        if view.priority:
+            details.append(f"Priority: {view.priority}")
+        
+        details.append(f"Assignee: {view.assignee_name or 'Unknown'}")
+        
+        description = (issue.get('fields') or {}).get('description', '')
         if description:
             details.append(f"\nDescription:\n{description}")
         
@@ -609,12 +697,12 @@ class JiraTicketViewer:
                 
                 # Update HTML viewer if open
                 if self.html_viewer and self.html_viewer.is_open():
-                    self.root.after(0, lambda: self.html_viewer.update_html_viewer(full_ticket))
+                    self.root.after(0, lambda: self.html_viewer.schedule_viewer_update(full_ticket))
             
             # Load comments
             self.comment_system.load_comments(ticket_key)
         
-        threading.Thread(target=do_load, daemon=True).start()
+        self._executor.submit(do_load)
     
     def enable_ticket_actions(self):
         """Enable ticket action buttons"""
@@ -666,24 +754,13 @@ class JiraTicketViewer:
         reverse = not current_reverse
         self.sort_reverse[col] = reverse
         
-        # Get all items
-        items = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
-        
-        # Sort based on column type
-        if col in ['Key', 'Created']:
-            if col == 'Key':
-                # Sort by ticket number
-                items.sort(key=lambda x: int(x[0].split('-')[-1]) if '-' in x[0] else 0, reverse=reverse)
-            else:
-                # Sort by date
-                items.sort(key=lambda x: x[0], reverse=reverse)
-        else:
-            # Sort alphabetically
-            items.sort(key=lambda x: x[0].lower(), reverse=reverse)
+        # Decorate each visible row with its sort key once, from the views built at load time
+        sort_key = _SORT_KEYS[col]
+        items = [(sort_key(self._views_by_key[child]), child) for child in self.tree.get_children('')]
+        items.sort(key=lambda item: item[0], reverse=reverse)
         
-        # Rearrange items
-        for index, (val, child) in enumerate(items):
-            self.tree.move(child, '', index)
+        # Rearrange items in one Tk call (rows hidden by the filter stay detached)
+        self.tree.set_children('', *(child for val, child in items))
         
         # Update column heading to show sort direction
         for column in TREE_COLUMNS:
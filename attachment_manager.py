@@ -5,12 +5,41 @@ Attachment management module for handling file attachments and drag-drop functio
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
-import requests
-from PIL import Image, ImageTk
 import io
+from collections import deque
 from config import ATTACHMENT_FILE_TYPES
 from utils import format_file_size
 
+# Thumbnail bounding box for image attachments
+THUMBNAIL_SIZE = (200, 200)
+# Thumbnails allowed on the shared pool at once, leaving workers free for API calls
+MAX_THUMBNAIL_JOBS = 4
+# Delay before recomputing the images canvas scrollregion; resizes and thumbnail loads coalesce into one bbox
+SCROLLREGION_DELAY_MS = 50
+
+# PIL is only needed once attachments are viewed - imported on first use
+_pil = None
+
+
+def _get_pil():
+    """Import PIL lazily and return (Image, ImageTk)"""
+    global _pil
+    if _pil is None:
+        from PIL import Image, ImageTk
+        _pil = (Image, ImageTk)
+    return _pil
+
+
+def _decode_thumbnail(data, size=THUMBNAIL_SIZE):
+    """Decode image bytes straight to a thumbnail (runs off the Tk thread)"""
+    Image, _ = _get_pil()
+    image = Image.open(io.BytesIO(data))
+    # Let JPEG decode at a reduced scale (kept at 2x so the final shrink still looks clean)
+    image.draft('RGB', (size[0] * 2, size[1] * 2))
+    # BILINEAR is plenty for a small preview and far cheaper than LANCZOS
+    image.thumbnail(size, Image.Resampling.BILINEAR)
+    return image
+
 
 class AttachmentManager:
     def __init__(self, api_client, status_callback):
@@ -27,6 +56,11 @@ class AttachmentManager:
         # Current ticket reference
         self.current_ticket = None
         self.root_window = None
+        
+        # Pending thumbnail downloads, fed to the shared pool a few at a time
+        self._thumbnail_jobs = deque()
+        self._thumbnails_running = 0
+        self._thumbnail_lock = threading.Lock()
     
     def set_root_window(self, root):
         """Set reference to root window for drag-drop"""
@@ -86,6 +120,9 @@ class AttachmentManager:
             result = self.api_client.add_attachment(ticket_key, file_path)
             
             if result:
+                # Our copy of the attachment list is now stale - view_attachments will refetch it
+                if self.current_ticket and self.current_ticket.get('key') == ticket_key:
+                    self.current_ticket.get('fields', {}).pop('attachment', None)
                 import os
                 filename = os.path.basename(file_path)
                 self.update_status(f"File '{filename}' attached to {ticket_key}")
@@ -103,16 +140,18 @@ class AttachmentManager:
             return
         
         ticket_key = self.current_ticket.get('key')
+        # The selected ticket usually already carries its attachment list (possibly empty)
+        known_attachments = self.current_ticket.get('fields', {}).get('attachment')
         
         def do_load():
-            # Get fresh ticket data to ensure we have latest attachments
-            ticket_data = self.api_client.get_ticket_details(ticket_key)
-            if not ticket_data:
-                messagebox.showerror("Error", "Failed to load ticket data")
-                return
-            
-            fields = ticket_data.get('fields', {})
-            attachments = fields.get('attachment', [])
+            attachments = known_attachments
+            if attachments is None:
+                # Only the attachment field is needed, not the whole issue
+                ticket_data = self.api_client.get_ticket_details(ticket_key, fields='attachment')
+                if not ticket_data:
+                    messagebox.showerror("Error", "Failed to load ticket data")
+                    return
+                attachments = ticket_data.get('fields', {}).get('attachment', [])
             
             def update_ui():
                 if not attachments:
@@ -168,10 +207,18 @@ class AttachmentManager:
             images_scrollbar = ttk.Scrollbar(images_frame, orient="vertical", command=images_canvas.yview)
             images_scrollable_frame = ttk.Frame(images_canvas)
             
-            images_scrollable_frame.bind(
-                "<Configure>",
-                lambda e: images_canvas.configure(scrollregion=images_canvas.bbox("all"))
-            )
+            pending_scrollregion = [None]
+            
+            def update_scrollregion():
+                pending_scrollregion[0] = None
+                images_canvas.configure(scrollregion=images_canvas.bbox("all"))
+            
+            def schedule_scrollregion(event):
+                if pending_scrollregion[0]:
+                    images_canvas.after_cancel(pending_scrollregion[0])
+                pending_scrollregion[0] = images_canvas.after(SCROLLREGION_DELAY_MS, update_scrollregion)
+            
+            images_scrollable_frame.bind("<Configure>", schedule_scrollregion)
             
             images_canvas.create_window((0, 0), window=images_scrollable_frame, anchor="nw")
             images_canvas.configure(yscrollcommand=images_scrollbar.set)
@@ -250,33 +297,29 @@ class AttachmentManager:
         # Load and display thumbnail
         content_url = attachment.get('content')
         if content_url:
-            self.load_image_thumbnail(image_frame, content_url, attachment.get('filename', 'image'))
+            self.load_image_thumbnail(image_frame, content_url, attachment.get('filename', 'image'),
+                                      thumbnail_url=attachment.get('thumbnail'))
         
         # Open button
         open_btn = ttk.Button(image_frame, text="View Full Size", 
                              command=lambda: self.open_attachment_url(content_url))
         open_btn.pack(pady=5)
     
-    def load_image_thumbnail(self, parent, url, filename):
+    def load_image_thumbnail(self, parent, url, filename, thumbnail_url=None):
         """Load and display image thumbnail"""
         def do_load():
             try:
-                # Download image
-                response = requests.get(url, auth=(
-                    self.api_client.email_callback() if self.api_client.email_callback else "",
-                    self.api_client.api_token
-                ))
+                # Prefer Jira's server-side thumbnail; the full image is only downloaded when there is none
+                response = self.api_client.session.get(thumbnail_url or url, timeout=10)
                 response.raise_for_status()
                 
-                # Process image
-                image = Image.open(io.BytesIO(response.content))
-                
-                # Create thumbnail
-                image.thumbnail((200, 200), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
+                # Decode and shrink here; PhotoImage has to be created on the Tk thread
+                image = _decode_thumbnail(response.content)
                 
                 def update_thumbnail():
                     try:
+                        _, ImageTk = _get_pil()
+                        photo = ImageTk.PhotoImage(image)
                         thumb_label = tk.Label(parent, image=photo, bg='#2d2d2d')
                         thumb_label.image = photo  # Keep a reference
                         thumb_label.pack(pady=5)
@@ -298,8 +341,25 @@ class AttachmentManager:
                 
                 parent.after(0, show_error)
         
-        # Load image in background thread
-        threading.Thread(target=do_load, daemon=True).start()
+        # Download and decode on the shared worker pool
+        self._thumbnail_jobs.append(do_load)
+        self._start_thumbnail_jobs()
+    
+    def _start_thumbnail_jobs(self):
+        """Submit queued thumbnail jobs while fewer than MAX_THUMBNAIL_JOBS are running"""
+        with self._thumbnail_lock:
+            while self._thumbnail_jobs and self._thumbnails_running < MAX_THUMBNAIL_JOBS:
+                self._thumbnails_running += 1
+                self.api_client.executor.submit(self._run_thumbnail_job, self._thumbnail_jobs.popleft())
+    
+    def _run_thumbnail_job(self, job):
+        """Run one thumbnail job, then start the next queued one"""
+        try:
+            job()
+        finally:
+            with self._thumbnail_lock:
+                self._thumbnails_running -= 1
+            self._start_thumbnail_jobs()
     
     def open_attachment_url(self, url):
         """Open attachment URL in browser or default application"""
@@ -183,14 +183,12 @@ class CommentMonitor:
         comment = comment_info['comment']
 
         # Find and select the ticket in the main app
-        if hasattr(self.parent_app, 'tree'):
-            for item in self.parent_app.tree.get_children():
-                if self.parent_app.tree.item(item)['values'][0] == ticket_key:
-                    self.parent_app.tree.selection_set(item)
-                    self.parent_app.tree.see(item)
-                    # Trigger selection event
-                    self.parent_app.on_ticket_select(None)
-                    break
+        # Tree rows use the ticket key as their id, so look it up directly
+        if hasattr(self.parent_app, 'tree') and self.parent_app.tree.exists(ticket_key):
+            self.parent_app.tree.selection_set(ticket_key)
+            self.parent_app.tree.see(ticket_key)
+            # Trigger selection event
+            self.parent_app.on_ticket_select(None)
 
         # Remove this comment from the new comments list
         if comment_info in self.new_comments:
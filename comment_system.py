@@ -2,11 +2,28 @@
 Comment system module for handling ticket comments and @mentions
 """
 
+import re
+import bisect
+import time
 import tkinter as tk
 import threading
 from tkinter import messagebox
 from datetime import datetime
-from utils import format_datetime
+from utils import format_datetime, text_has_content
+
+# @mention being typed at the end of the current line (no trailing space yet)
+_MENTION_RE = re.compile(r'@([^@\n]*)$')
+# Completed @email mentions inside a comment
+_MENTION_EMAIL_RE = re.compile(r'@([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+# Delay before autocomplete runs, so it only fires once typing pauses (ms)
+_MENTION_DEBOUNCE_MS = 50
+# Keys that never change the text, so releasing them can't start or end a mention
+_NON_EDIT_KEYS = frozenset({'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+                            'Meta_L', 'Meta_R', 'Super_L', 'Super_R', 'Caps_Lock', 'Num_Lock'})
+# Most suggestions shown in the autocomplete list
+_MAX_SUGGESTIONS = 10
+# How long fetched comments are reused before asking Jira again (seconds)
+COMMENTS_TTL_SECONDS = 120
 
 
 class CommentSystemManager:
@@ -32,6 +49,25 @@ class CommentSystemManager:
         self.autocomplete_listbox = None
         self.autocomplete_active = False
         self.mention_start_pos = None
+        self._mention_after_id = None
+        # (cursor index, line text before it) from the last mention check, to skip repeats
+        self._last_mention_check = None
+        # Sorted (lowercase term, user position) pairs for prefix lookups, built with available_users
+        self._user_index = []
+        # Lowercased (displayName, emailAddress) per user, parallel to available_users
+        self._user_lower = []
+        
+        # ticket key -> (fetched_at, comments payload), filled by prefetch_comments and load_comments
+        self._comments_cache = {}
+        # Bumped whenever cached comments are dropped, so fetches started before that are discarded
+        self._comments_generation = 0
+        # ticket key -> generation of the prefetch currently fetching it
+        self._comments_inflight = {}
+        self._comments_lock = threading.Lock()
+        
+        # One right-click menu shared by every text widget; acts on the widget it was opened over
+        self._text_context_menu = None
+        self._context_widget = None
     
     def set_ui_references(self, comment_text, comments_text):
         """Set references to UI components"""
@@ -47,13 +83,69 @@ class CommentSystemManager:
         """Set the current ticket for comment operations"""
         self.current_ticket = ticket
     
+    def _cached_comments(self, ticket_key):
+        """Return cached comments for a ticket, or None if missing or expired"""
+        entry = self._comments_cache.get(ticket_key)
+        if entry and time.time() - entry[0] < COMMENTS_TTL_SECONDS:
+            return entry[1]
+        return None
+    
+    def _store_comments(self, comments_by_key, generation):
+        """Cache fetched comments unless the cache was cleared since the fetch started"""
+        now = time.time()
+        with self._comments_lock:
+            if generation != self._comments_generation:
+                return
+            for key, comments_data in comments_by_key.items():
+                self._comments_cache[key] = (now, comments_data)
+    
+    def prefetch_comments(self, ticket_keys):
+        """Fetch comments for the given tickets in the background so selecting them is instant"""
+        with self._comments_lock:
+            generation = self._comments_generation
+            missing = [key for key in ticket_keys
+                       if key and self._comments_inflight.get(key) != generation
+                       and self._cached_comments(key) is None]
+            if not missing:
+                return
+            for key in missing:
+                self._comments_inflight[key] = generation
+        
+        def do_prefetch():
+            try:
+                self._store_comments(self.api_client.batch_fetch_comments(missing), generation)
+            finally:
+                with self._comments_lock:
+                    for key in missing:
+                        if self._comments_inflight.get(key) == generation:
+                            del self._comments_inflight[key]
+        
+        self.api_client.executor.submit(do_prefetch)
+    
+    def invalidate_comments(self, ticket_key):
+        """Forget one ticket's comments (and any fetch still running) after it changed"""
+        with self._comments_lock:
+            self._comments_generation += 1
+            self._comments_cache.pop(ticket_key, None)
+    
+    def clear_comment_cache(self):
+        """Drop prefetched comments, e.g. after the ticket list was reloaded"""
+        with self._comments_lock:
+            self._comments_generation += 1
+            self._comments_cache.clear()
+    
     def load_comments(self, ticket_key, limit=5):
         """Load comments for the specified ticket"""
         if not ticket_key:
             return
         
         def do_load():
-            comments_data = self.api_client.get_ticket_comments(ticket_key)
+            comments_data = self._cached_comments(ticket_key)
+            if comments_data is None:
+                generation = self._comments_generation
+                comments_data = self.api_client.get_ticket_comments(ticket_key)
+                if comments_data and 'comments' in comments_data:
+                    self._store_comments({ticket_key: comments_data}, generation)
             
             def update_ui():
                 if not self.comments_text:
@@ -61,24 +153,24 @@ class CommentSystemManager:
                 
                 self.comments_text.delete(1.0, tk.END)
                 
+                comments = []
                 if comments_data and 'comments' in comments_data:
                     comments = comments_data['comments'][-limit:] if limit else comments_data['comments']
-                    
-                    if comments:
-                        for comment in comments:
-                            author = comment.get('author', {})
-                            author_name = author.get('displayName', 'Unknown') if author else 'Unknown'
-                            created = comment.get('created', '')
-                            body = comment.get('body', 'No content')
-                            
-                            # Format timestamp
-                            created_str = format_datetime(created)
-                            
-                            self.comments_text.insert(tk.END, f"[{created_str}] {author_name}:\n{body}\n\n")
-                    else:
-                        self.comments_text.insert(tk.END, "No comments yet.")
-                else:
+                
+                if not comments:
                     self.comments_text.insert(tk.END, "No comments yet.")
+                    return
+                
+                # Build the whole thread once and hand it to Tk in a single insert
+                parts = []
+                for comment in comments:
+                    author = comment.get('author', {})
+                    author_name = author.get('displayName', 'Unknown') if author else 'Unknown'
+                    created_str = format_datetime(comment.get('created', ''))
+                    body = comment.get('body', 'No content')
+                    parts.append(f"[{created_str}] {author_name}:\n{body}\n\n")
+                
+                self.comments_text.insert(tk.END, ''.join(parts))
             
             # Update UI in main thread
             if self.comments_text:
@@ -92,7 +184,9 @@ class CommentSystemManager:
         if not self.current_ticket or not self.comment_text:
             return
         
-        comment_text = self.comment_text.get(1.0, tk.END).strip()
+        comment_text = ''
+        if text_has_content(self.comment_text):
+            comment_text = self.comment_text.get(1.0, tk.END).strip()
         
         if not comment_text:
             messagebox.showwarning("Warning", "Please enter a comment")
@@ -105,6 +199,7 @@ class CommentSystemManager:
             
             if result:
                 # Clear comment box and reload comments
+                self.invalidate_comments(ticket_key)
                 self.comment_text.after(0, lambda: self.comment_text.delete(1.0, tk.END))
                 self.load_comments(ticket_key)
                 messagebox.showinfo("Success", "Comment added successfully!")
@@ -118,22 +213,34 @@ class CommentSystemManager:
         """Handle key release in comment box for @mention autocomplete"""
         if not self.comment_text:
             return
+        if event is not None and getattr(event, 'keysym', None) in _NON_EDIT_KEYS:
+            return
         
+        # Debounce - only check once the user pauses typing
+        if self._mention_after_id:
+            self.comment_text.after_cancel(self._mention_after_id)
+        self._mention_after_id = self.comment_text.after(_MENTION_DEBOUNCE_MS, self.check_for_mention)
+    
+    def check_for_mention(self):
+        """Show or hide autocomplete based on the text just before the cursor"""
+        self._mention_after_id = None
+        if not self.comment_text:
+            return
+        
+        # Only look at the current line up to the cursor, not the whole buffer
         current_pos = self.comment_text.index(tk.INSERT)
-        current_text = self.comment_text.get("1.0", current_pos)
+        line = current_pos.split('.', 1)[0]
+        line_prefix = self.comment_text.get(f"{line}.0", current_pos)
+        if (current_pos, line_prefix) == self._last_mention_check:
+            return  # nothing near the cursor changed since the last check
+        self._last_mention_check = (current_pos, line_prefix)
+        match = _MENTION_RE.search(line_prefix)
         
-        # Check if we're typing an @mention
-        if '@' in current_text:
-            # Find the last @ symbol
-            last_at = current_text.rfind('@')
-            text_after_at = current_text[last_at + 1:]
-            
-            # Check if we're in the middle of typing a mention
-            if last_at >= 0 and (not text_after_at or not text_after_at.endswith(' ')):
-                self.mention_start_pos = f"1.0 + {last_at} chars"
-                self.show_autocomplete(text_after_at)
-            else:
-                self.hide_autocomplete()
+        # Check if we're in the middle of typing a mention
+        if match and not match.group(1).endswith(' '):
+            # Tk columns count characters, so the '@' position is just line.offset
+            self.mention_start_pos = f"{line}.{match.start()}"
+            self.show_autocomplete(match.group(1))
         else:
             self.hide_autocomplete()
     
@@ -147,21 +254,11 @@ class CommentSystemManager:
         if not self.autocomplete_frame or not self.autocomplete_listbox:
             return
         
-        # Filter users based on search text
-        filtered_users = []
-        search_lower = search_text.lower()
-        
-        for user in self.available_users:
-            display_name = user.get('displayName', '')
-            email = user.get('emailAddress', '')
-            
-            if (search_lower in display_name.lower() or 
-                search_lower in email.lower()):
-                filtered_users.append(user)
+        filtered_users = self.find_users(search_text.lower())
         
         # Update listbox
         self.autocomplete_listbox.delete(0, tk.END)
-        for user in filtered_users[:10]:  # Limit to 10 results
+        for user in filtered_users:
             display_name = user.get('displayName', '')
             email = user.get('emailAddress', '')
             self.autocomplete_listbox.insert(tk.END, f"{display_name} ({email})")
@@ -189,9 +286,10 @@ class CommentSystemManager:
         if selection and self.comment_text and self.mention_start_pos:
             selected_text = self.autocomplete_listbox.get(selection[0])
             
-            # Extract email from "Name (email)" format
-            if '(' in selected_text and selected_text.endswith(')'):
-                email = selected_text.split('(')[1][:-1]
+            # Extract email from "Name (email)" format - last '(' so names with parentheses work
+            open_paren = selected_text.rfind('(')
+            if open_paren != -1 and selected_text.endswith(')'):
+                email = selected_text[open_paren + 1:-1]
             else:
                 email = selected_text
             
@@ -202,12 +300,61 @@ class CommentSystemManager:
             
             self.hide_autocomplete()
     
+    def find_users(self, search_lower):
+        """Users whose name, any name word or email starts with search_lower (substring match as a fallback)"""
+        users = self.available_users
+        index = self._user_index
+        positions = []
+        i = bisect.bisect_left(index, (search_lower,))
+        while i < len(index) and index[i][0].startswith(search_lower) and len(positions) < _MAX_SUGGESTIONS:
+            if index[i][1] not in positions:
+                positions.append(index[i][1])
+            i += 1
+        if positions:
+            return [users[pos] for pos in positions]
+        
+        # Nothing starts with the text - look for it anywhere in the name or email
+        matches = []
+        for user, (name_lower, email_lower) in zip(users, self._user_lower):
+            if search_lower in name_lower or search_lower in email_lower:
+                matches.append(user)
+                if len(matches) == _MAX_SUGGESTIONS:
+                    break
+        return matches
+    
+    def build_user_index(self, user_lower):
+        """Sorted (term, position) pairs covering each user's full name, name words and email"""
+        index = []
+        for pos, (display_name, email) in enumerate(user_lower):
+            terms = {display_name, email, *display_name.split()}
+            index.extend((term, pos) for term in terms if term)
+        index.sort()
+        return index
+    
+    def lowercase_users(self, users):
+        """Lowercased (displayName, emailAddress) for each user"""
+        return [((user.get('displayName') or '').lower(), (user.get('emailAddress') or '').lower())
+                for user in users]
+    
+    def _set_user_lists(self, users, user_lower, user_index):
+        """Install a freshly loaded user list with its lowercase copy and search index"""
+        self.available_users = users
+        self._user_lower = user_lower
+        self._user_index = user_index
+    
     def load_available_users(self):
         """Load available users for autocomplete"""
         def do_load():
             users = self.api_client.get_project_users()
             if users:
-                self.available_users = users
+                # Build everything here, then swap all three in together on the Tk thread,
+                # so autocomplete never pairs a new list with an old index
+                user_lower = self.lowercase_users(users)
+                user_index = self.build_user_index(user_lower)
+                if self.comment_text:
+                    self.comment_text.after(0, self._set_user_lists, users, user_lower, user_index)
+                else:
+                    self._set_user_lists(users, user_lower, user_index)
         
         # Load users in background thread
         threading.Thread(target=do_load, daemon=True).start()
@@ -215,10 +362,10 @@ class CommentSystemManager:
     def add_mention(self, email):
         """Add a mention to the current comment"""
         if self.comment_text:
-            current_text = self.comment_text.get(1.0, tk.END)
-            if current_text.strip():
+            # Only the last character matters here, so don't copy the whole comment
+            if text_has_content(self.comment_text):
                 # Add space if text doesn't end with space or newline
-                if not current_text.rstrip().endswith((' ', '\n')):
+                if self.comment_text.get('end-2c') not in (' ', '\n', '\t'):
                     self.comment_text.insert(tk.END, ' ')
             
             self.comment_text.insert(tk.END, f"@{email} ")
@@ -226,9 +373,7 @@ class CommentSystemManager:
     
     def get_comment_mentions(self, comment_text):
         """Extract @mentions from comment text"""
-        import re
-        mention_pattern = r'@([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        matches = re.findall(mention_pattern, comment_text)
+        matches = _MENTION_EMAIL_RE.findall(comment_text)
         return list(set(matches))  # Remove duplicates
     
     def format_comment_for_display(self, comment_data):
@@ -244,10 +389,18 @@ class CommentSystemManager:
         return f"[{created_str}] {author_name}:\n{body}"
     
     def create_text_context_menu(self, text_widget):
-        """Create context menu for text widgets"""
-        context_menu = tk.Menu(text_widget, tearoff=0)
+        """Attach the shared right-click menu to a text widget"""
+        if self._text_context_menu is None:
+            self._text_context_menu = self._build_text_context_menu(text_widget.winfo_toplevel())
+        text_widget.bind("<Button-3>", self._show_text_context_menu)
+        return self._text_context_menu
+    
+    def _build_text_context_menu(self, parent):
+        """Build the text context menu once; its commands use the widget it was last opened over"""
+        context_menu = tk.Menu(parent, tearoff=0)
         
         def copy_text():
+            text_widget = self._context_widget
             try:
                 selected_text = text_widget.selection_get()
                 text_widget.clipboard_clear()
@@ -256,10 +409,12 @@ class CommentSystemManager:
                 pass
         
         def copy_all():
+            text_widget = self._context_widget
             text_widget.clipboard_clear()
             text_widget.clipboard_append(text_widget.get(1.0, tk.END))
         
         def paste_text():
+            text_widget = self._context_widget
             try:
                 clipboard_text = text_widget.clipboard_get()
                 text_widget.insert(tk.INSERT, clipboard_text)
@@ -267,6 +422,7 @@ class CommentSystemManager:
                 pass
         
         def select_all():
+            text_widget = self._context_widget
             text_widget.tag_add(tk.SEL, "1.0", tk.END)
             text_widget.mark_set(tk.INSERT, "1.0")
             text_widget.see(tk.INSERT)
@@ -277,12 +433,12 @@ class CommentSystemManager:
         context_menu.add_command(label="Paste", command=paste_text)
         context_menu.add_separator()
         context_menu.add_command(label="Select All", command=select_all)
-        
-        def show_context_menu(event):
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
-        
-        text_widget.bind("<Button-3>", show_context_menu)
-        return context_menu
\ No newline at end of file
+        return context_menu
+    
+    def _show_text_context_menu(self, event):
+        """Pop up the shared menu for the text widget that was right-clicked"""
+        self._context_widget = event.widget
+        try:
+            self._text_context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self._text_context_menu.grab_release()
\ No newline at end of file
@@ -6,7 +6,10 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
 from datetime import datetime
-from utils import format_datetime
+from utils import format_datetime, text_has_content
+
+# Quiet period before redrawing the viewer, so arrowing through the list doesn't redraw every row
+VIEWER_UPDATE_DELAY_MS = 150
 
 
 class HTMLTicketViewer:
@@ -29,6 +32,11 @@ class HTMLTicketViewer:
         self.html_viewer_window = None
         self.current_ticket = None
         
+        # Comment fetches share the client's worker pool; only the latest one matters
+        self._comments_future = None
+        # Pending debounced redraw (root.after id)
+        self._viewer_after_id = None
+        
         # UI components
         self.html_title_label = None
         self.html_content = None
@@ -137,6 +145,20 @@ Use the Close Ticket and Resolve buttons for quick status changes.
                                      font=('Segoe UI', 9), foreground='#cccccc')
         instructions_label.pack(fill=tk.X, padx=5, pady=10)
     
+    def schedule_viewer_update(self, issue):
+        """Redraw the viewer for issue once selection has settled"""
+        if not self.is_open():
+            return
+        if self._viewer_after_id:
+            self.html_viewer_window.after_cancel(self._viewer_after_id)
+        self._viewer_after_id = self.html_viewer_window.after(
+            VIEWER_UPDATE_DELAY_MS, self._run_scheduled_viewer_update, issue)
+    
+    def _run_scheduled_viewer_update(self, issue):
+        """Fire the debounced viewer redraw"""
+        self._viewer_after_id = None
+        self.update_html_viewer(issue)
+    
     def update_html_viewer(self, issue):
         """Update the HTML viewer with ticket content"""
         if not self.html_viewer_window or not self.html_viewer_window.winfo_exists():
@@ -151,10 +173,16 @@ Use the Close Ticket and Resolve buttons for quick status changes.
         self.html_title_label.config(text=f"{ticket_key}: {summary}")
         
         # Update view tab
-        content = self.build_ticket_html_content(issue)
+        head, description, tail = self.build_ticket_html_parts(issue)
         self.html_content.config(state='normal')
         self.html_content.delete(1.0, tk.END)
-        self.html_content.insert(1.0, content)
+        # Tag the description so a description edit can replace just that range
+        self.html_content.insert(1.0, head, (), description, ('description',), tail, ())
+        # Remember where the comments go so they can be filled in without redrawing the rest
+        comments_index = self.html_content.search("Loading comments...", tk.END, backwards=True)
+        if comments_index:
+            self.html_content.mark_set('comments_anchor', comments_index)
+            self.html_content.mark_gravity('comments_anchor', tk.LEFT)
         self.html_content.config(state='disabled')
         
         # Update edit tab
@@ -168,11 +196,19 @@ Use the Close Ticket and Resolve buttons for quick status changes.
         self.html_close_btn.config(state="normal")
         self.html_resolve_btn.config(state="normal")
         
-        # Load comments in background
-        self.load_comments_for_html_viewer(ticket_key)
+        # Use comments that came with the ticket when the thread is complete; fetch otherwise
+        comment_field = fields.get('comment')
+        if comment_field and len(comment_field.get('comments', [])) >= comment_field.get('total', 0):
+            self.show_html_comments(ticket_key, comment_field)
+        else:
+            self.load_comments_for_html_viewer(ticket_key)
     
     def build_ticket_html_content(self, issue):
         """Build formatted text content for the ticket"""
+        return ''.join(self.build_ticket_html_parts(issue))
+    
+    def build_ticket_html_parts(self, issue):
+        """Build the ticket text as (before description, description, after description)"""
         fields = issue.get('fields', {})
         
         content = []
@@ -219,9 +255,9 @@ Use the Close Ticket and Resolve buttons for quick status changes.
         # Description
         content.append("DESCRIPTION:")
         content.append("-" * 20)
-        description = fields.get('description', 'No description provided')
-        content.append(description)
-        content.append("")
+        head = "\n".join(content) + "\n"
+        description = fields.get('description') or 'No description provided'
+        content = ["", ""]
         
         # Attachments
         attachments = fields.get('attachment', [])
@@ -240,74 +276,62 @@ Use the Close Ticket and Resolve buttons for quick status changes.
         content.append("Loading comments...")
         content.append("")
         
-        return "\n".join(content)
+        return head, description, "\n".join(content)
     
     def format_file_size(self, size_bytes):
         """Format file size in human readable format"""
         from utils import format_file_size
         return format_file_size(size_bytes)
     
+    def show_html_comments(self, ticket_key, comments_data):
+        """Fill in the comments section of the HTML viewer (main thread only)"""
+        if (not self.html_viewer_window or not self.html_viewer_window.winfo_exists() or
+            not self.current_ticket or self.current_ticket.get('key') != ticket_key):
+            return
+        
+        # Build comments content
+        comments_content = []
+        
+        if comments_data and 'comments' in comments_data:
+            comments = comments_data['comments']
+            
+            if comments:
+                for comment in comments:
+                    author = comment.get('author', {})
+                    author_name = author.get('displayName', 'Unknown') if author else 'Unknown'
+                    created = comment.get('created', '')
+                    body = comment.get('body', 'No content')
+                    
+                    created_str = format_datetime(created)
+                    comments_content.append(f"[{created_str}] {author_name}:")
+                    comments_content.append(body)
+                    comments_content.append("")
+            else:
+                comments_content.append("No comments yet.")
+        else:
+            comments_content.append("No comments yet.")
+        
+        # Replace only the placeholder after the COMMENTS: header
+        if 'comments_anchor' not in self.html_content.mark_names():
+            return
+        
+        self.html_content.config(state='normal')
+        self.html_content.delete('comments_anchor', tk.END)
+        self.html_content.insert('comments_anchor', '\n'.join(comments_content))
+        self.html_content.config(state='disabled')
+    
     def load_comments_for_html_viewer(self, ticket_key):
         """Load comments for the HTML viewer"""
         def do_load():
             comments_data = self.api_client.get_ticket_comments(ticket_key)
             
-            def update_comments():
-                if (not self.html_viewer_window or not self.html_viewer_window.winfo_exists() or
-                    not self.current_ticket or self.current_ticket.get('key') != ticket_key):
-                    return
-                
-                # Build comments content
-                comments_content = []
-                
-                if comments_data and 'comments' in comments_data:
-                    comments = comments_data['comments']
-                    
-                    if comments:
-                        for comment in comments:
-                            author = comment.get('author', {})
-                            author_name = author.get('displayName', 'Unknown') if author else 'Unknown'
-                            created = comment.get('created', '')
-                            body = comment.get('body', 'No content')
-                            
-                            created_str = format_datetime(created)
-                            comments_content.append(f"[{created_str}] {author_name}:")
-                            comments_content.append(body)
-                            comments_content.append("")
-                    else:
-                        comments_content.append("No comments yet.")
-                else:
-                    comments_content.append("No comments yet.")
-                
-                # Update the view content by replacing the comments section
-                current_content = self.html_content.get(1.0, tk.END)
-                lines = current_content.split('\n')
-                
-                # Find and replace comments section
-                comments_start = -1
-                for i, line in enumerate(lines):
-                    if line == "COMMENTS:":
-                        comments_start = i
-                        break
-                
-                if comments_start >= 0:
-                    # Replace from "COMMENTS:" to end
-                    new_lines = lines[:comments_start]
-                    new_lines.extend(["COMMENTS:", "-" * 20])
-                    new_lines.extend(comments_content)
-                    
-                    new_content = '\n'.join(new_lines)
-                    
-                    self.html_content.config(state='normal')
-                    self.html_content.delete(1.0, tk.END)
-                    self.html_content.insert(1.0, new_content)
-                    self.html_content.config(state='disabled')
-            
             # Update UI in main thread
-            self.html_viewer_window.after(0, update_comments)
+            self.html_viewer_window.after(0, self.show_html_comments, ticket_key, comments_data)
         
-        # Load comments in background thread
-        threading.Thread(target=do_load, daemon=True).start()
+        # Drop a fetch that hasn't started yet when the user has already moved on
+        if self._comments_future is not None:
+            self._comments_future.cancel()
+        self._comments_future = self.api_client.executor.submit(do_load)
     
     def save_description(self):
         """Save edited description"""
@@ -328,21 +352,41 @@ Use the Close Ticket and Resolve buttons for quick status changes.
             result = self.api_client.make_jira_request(f"issue/{ticket_key}", method="PUT", data=update_data)
             
             if result is not None:
+                # Only the description changed - patch it in place rather than reloading the ticket and list
+                self.html_viewer_window.after(0, self.show_saved_description, ticket_key, new_description)
                 messagebox.showinfo("Success", "Description updated successfully!")
-                # Refresh the current ticket
-                self.ticket_ops_manager.refresh_current_ticket()
             else:
                 messagebox.showerror("Error", "Failed to update description")
         
         # Save in background thread
         threading.Thread(target=do_save, daemon=True).start()
     
+    def show_saved_description(self, ticket_key, new_description):
+        """Swap the description shown in the view tab after a save (main thread only)"""
+        if not self.current_ticket or self.current_ticket.get('key') != ticket_key:
+            return
+        self.current_ticket.setdefault('fields', {})['description'] = new_description
+        
+        if not self.is_open():
+            return
+        ranges = self.html_content.tag_ranges('description')
+        if not ranges:
+            self.update_html_viewer(self.current_ticket)
+            return
+        self.html_content.config(state='normal')
+        self.html_content.delete(ranges[0], ranges[1])
+        self.html_content.insert(ranges[0], new_description or 'No description provided', ('description',))
+        self.html_content.config(state='disabled')
+    
     def add_comment_from_html(self):
         """Add comment from HTML viewer"""
         if not self.current_ticket:
             return
         
-        comment_text = self.html_comment_editor.get(1.0, tk.END).strip()
+        # Cheap emptiness check first; only serialize the editor when there is something in it
+        comment_text = ''
+        if text_has_content(self.html_comment_editor):
+            comment_text = self.html_comment_editor.get(1.0, tk.END).strip()
         
         if not comment_text:
             messagebox.showwarning("Warning", "Please enter a comment")
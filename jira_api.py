@@ -5,11 +5,15 @@ Jira API communication module for ticket operations
 import requests
 import json
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tkinter import messagebox
-import webbrowser
 import logging
 import datetime
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from config import JIRA_URL, API_TOKEN, PROJECT_KEY, ISSUE_TYPES
 
 # Setup logging
@@ -28,6 +32,24 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# One worker pool shared by every manager instead of a new thread per click
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Tickets asked for per search request; Jira may cap this lower and reports the cap it used
+SEARCH_PAGE_SIZE = 500
+# Upper bound on tickets pulled into the list across all pages
+MAX_TICKETS = 1000
+
+# Read buffer for attachment uploads - big reads keep syscalls per MB low
+UPLOAD_READ_BUFFER = 1024 * 1024
+
+# Available transitions rarely change; reuse them briefly between close/resolve clicks
+TRANSITIONS_TTL_SECONDS = 60
+# Assignable users for the project change rarely; reopening user dialogs reuses them
+PROJECT_USERS_TTL_SECONDS = 600
+# Assignable users are also kept on disk so the first user dialog after a restart is instant
+PROJECT_USERS_CACHE_FILE = os.path.join(log_dir, 'jira_users_cache.json')
+
 
 class JiraAPIClient:
     def __init__(self, email_callback=None, status_callback=None):
@@ -44,13 +66,77 @@ class JiraAPIClient:
         self.issue_types = ISSUE_TYPES
         self.email_callback = email_callback
         self.status_callback = status_callback
+        
+        # Auth is built on the UI thread (see refresh_auth) so worker threads never read Tk widgets
+        self._auth = None
+        self._auth_email = ""
+        
+        # One keep-alive session for API calls and attachment downloads; retries cover transient drops
+        # and Jira's occasional gateway errors (raise_on_status=False leaves the error response to raise_for_status)
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                              max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=(500, 502, 503, 504), raise_on_status=False))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        self.executor = EXECUTOR
+        
+        # (ticket_key, status_name) -> (fetched_at, transitions response)
+        self._transitions_cache = {}
+        self._transitions_lock = threading.Lock()
+        
+        # (project_key, maxResults) -> (fetched_at wall-clock time, assignable users)
+        self._project_users_cache = self._load_project_users_cache()
+        # Guards the users cache dict and its file - workers update and save it concurrently
+        self._project_users_lock = threading.Lock()
+    
+    def _load_project_users_cache(self):
+        """Read the on-disk assignable users cache (empty if missing or unreadable)"""
+        try:
+            with open(PROJECT_USERS_CACHE_FILE, 'r') as f:
+                entries = json.load(f)
+            return {(project_key, max_results): (fetched_at, users)
+                    for project_key, max_results, fetched_at, users in entries}
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"No usable project users cache on disk: {e}")
+            return {}
+    
+    def _save_project_users_cache(self):
+        """Write the assignable users cache to disk (temp file + rename so it is never half written)"""
+        with self._project_users_lock:
+            entries = [[project_key, max_results, fetched_at, users]
+                       for (project_key, max_results), (fetched_at, users) in self._project_users_cache.items()]
+            try:
+                tmp_path = PROJECT_USERS_CACHE_FILE + '.tmp'
+                with open(tmp_path, 'w') as f:
+                    json.dump(entries, f, separators=(',', ':'))
+                os.replace(tmp_path, PROJECT_USERS_CACHE_FILE)
+            except OSError as e:
+                logger.warning(f"Could not save project users cache: {e}")
     
     def get_user_email(self):
         """Get user email from callback or return empty string"""
+        if self._auth_email:
+            return self._auth_email
         if self.email_callback:
             return self.email_callback()
         return ""
     
+    def refresh_auth(self, event=None):
+        """Rebuild cached credentials from the email field - call on the UI thread"""
+        user_email = self.email_callback().strip() if self.email_callback else ""
+        if user_email != self._auth_email or self._auth is None:
+            self._auth_email = user_email
+            self._auth = HTTPBasicAuth(user_email, self.api_token) if user_email else None
+            self.session.auth = self._auth
+        return self._auth
+    
+    def get_auth(self):
+        """Return the cached auth object (None until an email has been entered)"""
+        return self._auth
+    
     def update_status(self, message):
         """Update status message via callback"""
         if self.status_callback:
@@ -61,44 +147,33 @@ class JiraAPIClient:
         logger.info(f"Making Jira request: {method} {endpoint}")
         logger.debug(f"Params: {params}")
 
-        user_email = self.get_user_email()
-        logger.debug(f"User email: {user_email}")
+        auth = self._auth
+        logger.debug(f"User email: {self._auth_email}")
 
-        if not user_email.strip():
+        if auth is None:
             logger.error("No user email provided")
             messagebox.showerror("Error", "Please enter your email address")
             return None
 
+        if method not in ("GET", "POST", "PUT"):
+            logger.error(f"Unsupported HTTP method: {method}")
+            messagebox.showerror("Error", f"Unsupported HTTP method: {method}")
+            return None
+
         url = f"{self.jira_url}/rest/api/2/{endpoint}"
         logger.debug(f"Full URL: {url}")
-
-        auth = HTTPBasicAuth(user_email.strip(), self.api_token)
-        headers = {"Accept": "application/json"}
         
-        if method in ["POST", "PUT"] and not files:
-            headers["Content-Type"] = "application/json"
+        # Uploads go as multipart form data, everything else as a JSON body (requests sets Content-Type)
+        if files:
+            body = {"files": files, "data": data}
+        elif method != "GET":
+            body = {"json": data}
+        else:
+            body = {}
         
         try:
-            logger.debug(f"Request headers: {headers}")
-
-            # Make the request based on method
-            if method == "GET":
-                logger.debug("Making GET request")
-                response = requests.get(url, auth=auth, headers=headers, params=params, timeout=30)
-            elif method == "POST":
-                if files:
-                    logger.debug("Making POST request with files")
-                    response = requests.post(url, auth=auth, files=files, data=data, timeout=30)
-                else:
-                    logger.debug("Making POST request with JSON")
-                    response = requests.post(url, auth=auth, headers=headers, json=data, timeout=30)
-            elif method == "PUT":
-                logger.debug("Making PUT request")
-                response = requests.put(url, auth=auth, headers=headers, json=data, timeout=30)
-            else:
-                logger.error(f"Unsupported HTTP method: {method}")
-                messagebox.showerror("Error", f"Unsupported HTTP method: {method}")
-                return None
+            logger.debug(f"Making {method} request{' with files' if files else ''}")
+            response = self.session.request(method, url, params=params, timeout=30, **body)
 
             logger.info(f"Response status: {response.status_code}")
             logger.debug(f"Response headers: {dict(response.headers)}")
@@ -149,12 +224,35 @@ class JiraAPIClient:
         
         params = {
             'jql': jql,
-            'maxResults': 100,
+            'maxResults': SEARCH_PAGE_SIZE,
             'startAt': 0
             # NO fields parameter - get everything by default
         }
         
-        return self.make_jira_request("search", params=params)
+        data = self.make_jira_request("search", params=params)
+        if not data or 'issues' not in data:
+            return data
+        
+        page_size = data.get('maxResults') or len(data['issues']) or SEARCH_PAGE_SIZE
+        if page_size < SEARCH_PAGE_SIZE:
+            logger.warning(f"Jira capped search page size at {page_size} (asked for {SEARCH_PAGE_SIZE})")
+        
+        # total is known after the first page, so fetch the rest concurrently on the shared pool
+        offsets = range(page_size, min(data.get('total', 0), MAX_TICKETS), page_size)
+        futures = [
+            self.executor.submit(self.make_jira_request, "search",
+                                 params={**params, 'startAt': offset, 'maxResults': page_size})
+            for offset in offsets
+        ]
+        for future in futures:  # submission order keeps the pages in offset order
+            page = future.result()
+            if page and 'issues' in page:
+                data['issues'].extend(page['issues'])
+        if futures:
+            # Concurrent pages can repeat an issue if the results shift between requests; rows are keyed by ticket key
+            data['issues'] = list({issue.get('key'): issue for issue in data['issues']}.values())
+            logger.info(f"Loaded {len(data['issues'])} of {data.get('total')} tickets in {len(futures) + 1} pages")
+        return data
     
     def search_tickets(self, search_query):
         """Search tickets using JQL or text search"""
@@ -177,14 +275,46 @@ class JiraAPIClient:
         
         return self.make_jira_request("search", params=params)
     
-    def get_ticket_details(self, ticket_key):
-        """Get detailed information for a specific ticket"""
-        return self.make_jira_request(f"issue/{ticket_key}")
+    def get_ticket_details(self, ticket_key, fields=None):
+        """Get detailed information for a specific ticket, optionally only the given fields"""
+        params = {'fields': fields} if fields else None
+        return self.make_jira_request(f"issue/{ticket_key}", params=params)
     
     def get_ticket_comments(self, ticket_key):
         """Get comments for a specific ticket"""
         return self.make_jira_request(f"issue/{ticket_key}/comment")
     
+    def batch_fetch_comments(self, ticket_keys, chunk_size=50):
+        """Fetch comments for many tickets with one search per chunk of keys"""
+        comments_by_key = {}
+        truncated = []
+        for start in range(0, len(ticket_keys), chunk_size):
+            chunk = ticket_keys[start:start + chunk_size]
+            search_data = {
+                "jql": f"key in ({','.join(chunk)})",
+                "fields": ["comment"],
+                "maxResults": chunk_size
+            }
+            data = self.make_jira_request("search", method="POST", data=search_data)
+            if not data or 'issues' not in data:
+                break
+            
+            for issue in data['issues']:
+                comment_data = (issue.get('fields') or {}).get('comment')
+                # Search results can truncate long comment threads - those get a per-issue GET below
+                if comment_data and comment_data.get('total', 0) <= len(comment_data.get('comments', [])):
+                    comments_by_key[issue.get('key')] = comment_data
+                elif comment_data:
+                    truncated.append(issue.get('key'))
+        
+        for key in truncated:
+            comment_data = self.get_ticket_comments(key)
+            if comment_data and 'comments' in comment_data:
+                comments_by_key[key] = comment_data
+        
+        logger.info(f"Prefetched comments for {len(comments_by_key)} of {len(ticket_keys)} tickets")
+        return comments_by_key
+    
     def add_comment_to_ticket(self, ticket_key, comment_body):
         """Add a comment to a ticket"""
         comment_data = {
@@ -214,11 +344,31 @@ class JiraAPIClient:
                 "comment": [{"add": {"body": comment}}]
             }
         
-        return self.make_jira_request(f"issue/{ticket_key}/transitions", method="POST", data=transition_data)
+        result = self.make_jira_request(f"issue/{ticket_key}/transitions", method="POST", data=transition_data)
+        if result is not None:
+            self.invalidate_transitions(ticket_key)
+        return result
+    
+    def get_available_transitions(self, ticket_key, status_name=None):
+        """Get available transitions for a ticket, cached for a short time"""
+        cache_key = (ticket_key, status_name)
+        with self._transitions_lock:
+            cached = self._transitions_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < TRANSITIONS_TTL_SECONDS:
+            logger.debug(f"Using cached transitions for {ticket_key}")
+            return cached[1]
+        
+        transitions_data = self.make_jira_request(f"issue/{ticket_key}/transitions")
+        if transitions_data is not None:
+            with self._transitions_lock:
+                self._transitions_cache[cache_key] = (time.monotonic(), transitions_data)
+        return transitions_data
     
-    def get_available_transitions(self, ticket_key):
-        """Get available transitions for a ticket"""
-        return self.make_jira_request(f"issue/{ticket_key}/transitions")
+    def invalidate_transitions(self, ticket_key):
+        """Forget cached transitions for a ticket after its status changed"""
+        with self._transitions_lock:
+            for cache_key in [k for k in self._transitions_cache if k[0] == ticket_key]:
+                del self._transitions_cache[cache_key]
     
     def create_ticket(self, summary, description, issue_type_id, assignee=None):
         """Create a new ticket"""
@@ -241,7 +391,7 @@ class JiraAPIClient:
     def add_attachment(self, ticket_key, file_path):
         """Add an attachment to a ticket"""
         try:
-            with open(file_path, 'rb') as file:
+            with open(file_path, 'rb', buffering=UPLOAD_READ_BUFFER) as file:
                 files = {'file': file}
                 return self.make_jira_request(f"issue/{ticket_key}/attachments", 
                                             method="POST", files=files)
@@ -249,19 +399,28 @@ class JiraAPIClient:
             messagebox.showerror("Error", f"Failed to attach file: {str(e)}")
             return None
     
-    def get_project_users(self):
-        """Get users who can be assigned to tickets in the project"""
+    def get_project_users(self, max_results=50):
+        """Get users who can be assigned to tickets in the project (cached for a few minutes)"""
         logger.info(f"Getting project users for project: {self.project_key}")
 
+        cache_key = (self.project_key, max_results)
+        cached = self._project_users_cache.get(cache_key)
+        if cached and time.time() - cached[0] < PROJECT_USERS_TTL_SECONDS:
+            logger.debug(f"Using cached project users ({len(cached[1])})")
+            return cached[1]
+
         params = {
             'project': self.project_key,
-            'maxResults': 50
+            'maxResults': max_results
         }
         logger.debug(f"Project users params: {params}")
 
         result = self.make_jira_request("user/assignable/search", params=params)
 
         if result:
+            with self._project_users_lock:
+                self._project_users_cache[cache_key] = (time.time(), result)
+            self._save_project_users_cache()
             logger.info(f"Found {len(result)} project users")
             for i, user in enumerate(result[:3]):  # Log first 3 users
                 logger.debug(f"User {i+1}: {user.get('displayName', 'Unknown')} - {user.get('emailAddress', 'No email')}")
@@ -293,6 +452,7 @@ class JiraAPIClient:
     
     def open_dashboard(self):
         """Open the Jira Service Desk dashboard in browser"""
+        import webbrowser
         dashboard_url = f"{self.jira_url}/jira/servicedesk/projects/{self.project_key}/summary"
         webbrowser.open(dashboard_url)
         self.update_status(f"Opened dashboard for project {self.project_key}")
@@ -303,6 +463,7 @@ class JiraAPIClient:
     
     def open_ticket_in_browser(self, ticket_key):
         """Open a ticket in the browser"""
+        import webbrowser
         ticket_url = self.get_ticket_url(ticket_key)
         webbrowser.open(ticket_url)
         return ticket_url
\ No newline at end of file
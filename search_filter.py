@@ -2,12 +2,17 @@
 Search and filtering functionality for Jira tickets
 """
 
+import re
 import threading
 from tkinter import messagebox
 from config import TICKET_FILTER_OPTIONS, ISSUE_TYPE_FILTER_OPTIONS
+from utils import TicketView
 
 
 class SearchFilterManager:
+    # Completed status names, matched case-insensitively as whole words (e.g. "Closed - Won't Do")
+    _COMPLETED_RE = re.compile(r'\b(done|closed|resolved|complete|completed|finished)\b', re.IGNORECASE)
+    
     def __init__(self, api_client, tree_widget, status_callback, update_tickets_callback):
         """
         Initialize search and filter manager
@@ -22,9 +27,14 @@ class SearchFilterManager:
         self.tree = tree_widget
         self.update_status = status_callback
         self.update_tickets_callback = update_tickets_callback
+        # Optional callback that only changes which rows are visible (set by the main window)
+        self.display_tickets_callback = None
         
         # Filter state
         self.all_tickets = []
+        # Derived per-ticket values, parallel to all_tickets, and the list they were built from
+        self.ticket_views = []
+        self._views_source = self.all_tickets
         self.search_entry = None
         self.ticket_filter_var = None
         self.issue_type_var = None
@@ -40,9 +50,24 @@ class SearchFilterManager:
         self.hide_completed_var = hide_completed_var
         self.email_callback = email_callback
     
+    def set_display_callback(self, display_tickets_callback):
+        """Set the callback used to show filter results without replacing the ticket list"""
+        self.display_tickets_callback = display_tickets_callback
+    
     def set_tickets(self, tickets):
         """Update the stored tickets list for filtering"""
         self.all_tickets = tickets
+        # Ticket lists are replaced, never changed in place, so the same list needs no rebuild
+        if tickets is not self._views_source:
+            self.ticket_views = [TicketView(issue) for issue in tickets]
+            self._views_source = tickets
+    
+    def replace_ticket_view(self, view):
+        """Swap in a rebuilt view for one ticket after it was re-fetched"""
+        for i, old_view in enumerate(self.ticket_views):
+            if old_view.key == view.key:
+                self.ticket_views[i] = view
+                break
     
     def search_tickets(self, event=None):
         """Search tickets based on text content"""
@@ -59,17 +84,21 @@ class SearchFilterManager:
         
         def do_search():
             data = self.api_client.search_tickets(search_text)
-            
-            if data and 'issues' in data:
-                self.all_tickets = data['issues']
-                self.update_tickets_callback(data['issues'])
-                self.update_status(f"Found {len(data['issues'])} tickets matching '{search_text}'")
-            else:
-                self.update_status(f"No tickets found matching '{search_text}'")
+            # One hop back to the Tk thread for the list and the status together
+            self.tree.after(0, self._apply_search_results, data, search_text)
         
         # Run search in background thread
         threading.Thread(target=do_search, daemon=True).start()
     
+    def _apply_search_results(self, data, search_text):
+        """Show search results and their status message (main thread only)"""
+        if data and 'issues' in data:
+            self.set_tickets(data['issues'])
+            self.update_tickets_callback(data['issues'])
+            self.update_status(f"Found {len(data['issues'])} tickets matching '{search_text}'")
+        else:
+            self.update_status(f"No tickets found matching '{search_text}'")
+    
     def clear_search(self):
         """Clear search and reload all tickets"""
         if self.search_entry:
@@ -80,69 +109,63 @@ class SearchFilterManager:
         
         def do_reload():
             data = self.api_client.load_all_tickets()
-            if data and 'issues' in data:
-                self.all_tickets = data['issues']
-                self.update_tickets_callback(data['issues'])
-                self.update_status(f"Loaded {len(data['issues'])} tickets")
-            else:
-                self.update_status("Failed to reload tickets")
+            self.tree.after(0, self._apply_reloaded_tickets, data)
         
         threading.Thread(target=do_reload, daemon=True).start()
     
+    def _apply_reloaded_tickets(self, data):
+        """Show the reloaded ticket list and its status message (main thread only)"""
+        if data and 'issues' in data:
+            self.set_tickets(data['issues'])
+            self.update_tickets_callback(data['issues'])
+            self.update_status(f"Loaded {len(data['issues'])} tickets")
+        else:
+            self.update_status("Failed to reload tickets")
+    
     def filter_tickets(self, event=None):
         """Filter tickets based on selected criteria"""
         if not self.all_tickets:
             return
         
-        # Clear current display
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         # Get filter criteria
         ticket_filter = self.ticket_filter_var.get() if self.ticket_filter_var else "All Tickets"
         issue_type_filter = self.issue_type_var.get() if self.issue_type_var else "All"
         hide_completed = self.hide_completed_var.get() if self.hide_completed_var else False
         user_email = self.email_callback() if self.email_callback else ""
         
-        # Define completed status names
-        completed_statuses = ['done', 'closed', 'resolved', 'complete', 'completed', 'finished']
+        is_completed = self._COMPLETED_RE.search
         
-        tickets_to_show = []
-        for issue in self.all_tickets:
-            fields = issue.get('fields', {})
-            
-            # Filter by ticket ownership
-            if ticket_filter == "My Tickets":
-                # Check if user is reporter OR assignee
-                reporter = fields.get('reporter')
-                reporter_email = reporter.get('emailAddress', '') if reporter else ''
-                
-                assignee = fields.get('assignee')
-                assignee_email = assignee.get('emailAddress', '') if assignee else ''
-                
-                if user_email not in [reporter_email, assignee_email]:
-                    continue
-            elif ticket_filter == "Unassigned":
-                assignee = fields.get('assignee')
-                if assignee:  # Has assignee, skip
-                    continue
-            
-            # Filter by issue type
-            if issue_type_filter != "All":
-                issue_type = fields.get('issuetype', {}).get('name', '')
-                if issue_type != issue_type_filter:
-                    continue
-            
-            # Filter by completion status
-            if hide_completed:
-                status = fields.get('status', {}).get('name', '').lower()
-                if status in completed_statuses:
-                    continue
-            
-            tickets_to_show.append(issue)
+        # all_tickets may have been reassigned directly - compare identity, not length
+        if self._views_source is not self.all_tickets:
+            self.set_tickets(self.all_tickets)
+        
+        my_tickets = ticket_filter == "My Tickets"
+        unassigned_only = ticket_filter == "Unassigned"
+        filter_type = issue_type_filter != "All"
+        
+        if not (my_tickets or unassigned_only or filter_type or hide_completed):
+            # Nothing to filter on - show everything without looking at each ticket
+            tickets_to_show = list(self.all_tickets)
+        else:
+            # One comprehension over the views with every setting already in a local;
+            # checks run cheapest first so most tickets are rejected by a plain comparison
+            tickets_to_show = [
+                view.issue for view in self.ticket_views
+                # Issue type
+                if (not filter_type or view.type_name == issue_type_filter)
+                # Unassigned means no assignee at all
+                and (not unassigned_only or view.assignee_email is None)
+                # Ticket ownership - reporter OR assignee
+                and (not my_tickets or user_email == view.reporter_email or user_email == (view.assignee_email or ''))
+                # Completion status (regex search, so last)
+                and not (hide_completed and is_completed(view.status_name))
+            ]
         
         # Update display with filtered tickets
-        self.update_tickets_callback(tickets_to_show)
+        if self.display_tickets_callback:
+            self.display_tickets_callback(tickets_to_show)
+        else:
+            self.update_tickets_callback(tickets_to_show)
         
         # Update status
         total = len(self.all_tickets)
@@ -163,8 +186,7 @@ class SearchFilterManager:
         """Copy selected ticket URL to clipboard"""
         selection = self.tree.selection()
         if selection:
-            item = selection[0]
-            ticket_key = self.tree.item(item)['values'][0]
+            ticket_key = selection[0]  # row ids are ticket keys
             url = self.api_client.get_ticket_url(ticket_key)
             
             # Copy to clipboard (using tree's root widget)
@@ -177,8 +199,7 @@ class SearchFilterManager:
         """Open selected ticket in browser"""
         selection = self.tree.selection()
         if selection:
-            item = selection[0]
-            ticket_key = self.tree.item(item)['values'][0]
+            ticket_key = selection[0]  # row ids are ticket keys
             self.api_client.open_ticket_in_browser(ticket_key)
             self.update_status(f"Opened {ticket_key} in browser")
     
@@ -186,8 +207,7 @@ class SearchFilterManager:
         """Copy selected ticket key to clipboard"""
         selection = self.tree.selection()
         if selection:
-            item = selection[0]
-            ticket_key = self.tree.item(item)['values'][0]
+            ticket_key = selection[0]  # row ids are ticket keys
             
             # Copy to clipboard
             root = self.tree.winfo_toplevel()
@@ -23,6 +23,9 @@ def test_user_search():
         
     print(f"SUCCESS: Found API token for {user_email}")
     auth = HTTPBasicAuth(user_email, api_token)
+    # One session so every endpoint below reuses the same TLS connection
+    session = requests.Session()
+    session.auth = auth
     
     # Test different user search endpoints
     endpoints_to_test = [
@@ -38,7 +41,7 @@ def test_user_search():
         print(f"   URL: {url}")
         
         try:
-            response = requests.get(url, auth=auth, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"   Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -2,14 +2,25 @@
 Ticket operations module for creating, updating, and managing Jira tickets
 """
 
+import os
+import re
+import logging
 import threading
 import tempfile
-import io
 from tkinter import messagebox
-from PIL import ImageGrab
+
+logger = logging.getLogger(__name__)
+
+# Screenshots up to this many pixels are stored uncompressed (fastest encode, upload stays small);
+# bigger ones still get light compression so the upload doesn't balloon
+SCREENSHOT_RAW_PNG_PIXELS = 1_000_000
 
 
 class TicketOperationsManager:
+    # Transition names offered by the close/resolve actions
+    _CLOSE_RE = re.compile(r'close|done|complete|resolve', re.IGNORECASE)
+    _RESOLVE_RE = re.compile(r'resolve', re.IGNORECASE)
+    
     def __init__(self, api_client, status_callback, refresh_callback):
         """
         Initialize ticket operations manager
@@ -26,11 +37,55 @@ class TicketOperationsManager:
         # Current ticket reference
         self.current_ticket = None
         self.email_callback = None
+        self.refresh_ticket_callback = None
+        # Tk root, used to hand results from worker threads back to the UI thread
+        self.root_window = None
+        
+        # Account IDs never change for an email - look each one up once (None = not found)
+        self._accountid_by_email = {}
     
     def set_email_callback(self, email_callback):
         """Set callback to get user email"""
         self.email_callback = email_callback
     
+    def _submit(self, job):
+        """Run a job on the shared worker pool, logging any exception it raises"""
+        self.api_client.executor.submit(job).add_done_callback(self._log_job_failure)
+    
+    @staticmethod
+    def _log_job_failure(future):
+        """Done-callback: surface exceptions that would otherwise vanish with the future"""
+        error = future.exception()
+        if error is not None:
+            logger.error("Background ticket operation failed", exc_info=error)
+    
+    def set_root_window(self, root_window):
+        """Set the Tk root used to run UI updates from background work"""
+        self.root_window = root_window
+    
+    def set_refresh_ticket_callback(self, refresh_ticket_callback):
+        """Set callback that re-reads a single ticket after it was changed"""
+        self.refresh_ticket_callback = refresh_ticket_callback
+    
+    def refresh_ticket(self, ticket_key):
+        """Refresh one changed ticket, falling back to a full reload"""
+        if self.refresh_ticket_callback:
+            self.refresh_ticket_callback(ticket_key)
+        else:
+            self.refresh_callback()
+    
+    def _resolve_account_id(self, email):
+        """Return the account ID for an email, or None if Jira has no such user"""
+        if email in self._accountid_by_email:
+            return self._accountid_by_email[email]
+        
+        user_search = self.api_client.search_users(email)
+        if user_search is None:
+            return None  # Request failed - don't remember that as "not found"
+        account_id = user_search[0].get('accountId') if user_search else None
+        self._accountid_by_email[email] = account_id
+        return account_id
+    
     def set_current_ticket(self, ticket):
         """Set the current ticket for operations"""
         self.current_ticket = ticket
@@ -54,24 +109,28 @@ class TicketOperationsManager:
         
         def assign_ticket():
             # Get account ID for the user - REQUIRED for Jira Cloud
-            user_search = self.api_client.search_users(my_email)
+            account_id = self._resolve_account_id(my_email)
+            if not account_id:
+                messagebox.showerror("Error", f"User not found: {my_email}\nMake sure the email is correct and has Jira access.")
+                return
             
-            if user_search and len(user_search) > 0:
-                account_id = user_search[0].get('accountId')
-                
-                # Use accountId for assignment
-                result = self.api_client.assign_ticket(ticket_key, account_id)
-                
-                if result is not None:
-                    messagebox.showinfo("Success", f"Ticket {ticket_key} assigned to you!")
-                    self.refresh_callback()
-                else:
-                    messagebox.showerror("Error", f"Failed to assign ticket {ticket_key}")
+            # Use accountId for assignment
+            result = self.api_client.assign_ticket(ticket_key, account_id)
+            
+            if result is not None:
+                messagebox.showinfo("Success", f"Ticket {ticket_key} assigned to you!")
+                self.refresh_ticket(ticket_key)
             else:
-                messagebox.showerror("Error", f"User not found: {my_email}\nMake sure the email is correct and has Jira access.")
+                # Don't keep reusing an account ID that Jira rejected
+                self._accountid_by_email.pop(my_email, None)
+                messagebox.showerror("Error", f"Failed to assign ticket {ticket_key}")
         
-        # Run assignment in background thread
-        threading.Thread(target=assign_ticket, daemon=True).start()
+        # Run assignment on the shared worker pool
+        self._submit(assign_ticket)
+    
+    def _pick_transition(self, transitions, pattern):
+        """Return the first transition whose name matches pattern, or None"""
+        return next((t for t in transitions if pattern.search(t['name'])), None)
     
     def close_ticket(self):
         """Close the selected ticket"""
@@ -80,21 +139,18 @@ class TicketOperationsManager:
             return
         
         ticket_key = self.current_ticket.get('key')
+        status_name = (self.current_ticket.get('fields', {}).get('status') or {}).get('name')
         
         def do_close():
             # Get available transitions
-            transitions_data = self.api_client.get_available_transitions(ticket_key)
+            transitions_data = self.api_client.get_available_transitions(ticket_key, status_name)
             
             if not transitions_data or 'transitions' not in transitions_data:
                 messagebox.showerror("Error", "Could not get available transitions for this ticket")
                 return
             
             # Look for close/done transitions
-            close_transitions = []
-            for transition in transitions_data['transitions']:
-                trans_name = transition['name'].lower()
-                if any(keyword in trans_name for keyword in ['close', 'done', 'complete', 'resolve']):
-                    close_transitions.append(transition)
+            close_transitions = [t for t in transitions_data['transitions'] if self._CLOSE_RE.search(t['name'])]
             
             if not close_transitions:
                 available = [t['name'] for t in transitions_data['transitions']]
@@ -116,12 +172,12 @@ class TicketOperationsManager:
             
             if result is not None:
                 messagebox.showinfo("Success", f"Ticket {ticket_key} closed successfully!")
-                self.refresh_callback()
+                self.refresh_ticket(ticket_key)
             else:
                 messagebox.showerror("Error", "Failed to close ticket")
         
-        # Run in background thread
-        threading.Thread(target=do_close, daemon=True).start()
+        # Run on the shared worker pool
+        self._submit(do_close)
     
     def resolve_ticket(self):
         """Resolve the selected ticket"""
@@ -130,40 +186,35 @@ class TicketOperationsManager:
             return
         
         ticket_key = self.current_ticket.get('key')
+        status_name = (self.current_ticket.get('fields', {}).get('status') or {}).get('name')
         
         def do_resolve():
             # Get available transitions
-            transitions_data = self.api_client.get_available_transitions(ticket_key)
+            transitions_data = self.api_client.get_available_transitions(ticket_key, status_name)
             
             if not transitions_data or 'transitions' not in transitions_data:
                 messagebox.showerror("Error", "Could not get available transitions for this ticket")
                 return
             
-            # Look for resolve transitions
-            resolve_transitions = []
-            for transition in transitions_data['transitions']:
-                trans_name = transition['name'].lower()
-                if 'resolve' in trans_name:
-                    resolve_transitions.append(transition)
+            # Look for a resolve transition
+            selected_transition = self._pick_transition(transitions_data['transitions'], self._RESOLVE_RE)
             
-            if not resolve_transitions:
+            if not selected_transition:
                 available = [t['name'] for t in transitions_data['transitions']]
                 messagebox.showwarning("Warning", f"No resolve transition available. Available transitions: {', '.join(available)}")
                 return
             
-            selected_transition = resolve_transitions[0]
-            
             # Perform the transition
             result = self.api_client.transition_ticket(ticket_key, selected_transition['id'])
             
             if result is not None:
                 messagebox.showinfo("Success", f"Ticket {ticket_key} resolved successfully!")
-                self.refresh_callback()
+                self.refresh_ticket(ticket_key)
             else:
                 messagebox.showerror("Error", "Failed to resolve ticket")
         
-        # Run in background thread
-        threading.Thread(target=do_resolve, daemon=True).start()
+        # Run on the shared worker pool
+        self._submit(do_resolve)
     
     def create_ticket(self, summary, description, issue_type_name, reporter_email=None, assignee_email=None):
         """Create a new ticket"""
@@ -180,28 +231,21 @@ class TicketOperationsManager:
             return False
         
         def do_create():
-            # Get account IDs if needed
-            reporter_account_id = None
-            assignee_account_id = None
+            # Look up each distinct email once (reporter and assignee are often the same person), side by side
+            emails = {email for email in (reporter_email, assignee_email) if email}
+            lookups = {email: self.api_client.executor.submit(self._resolve_account_id, email) for email in emails}
+            account_ids = {email: lookup.result() for email, lookup in lookups.items()}
+            reporter_account_id = account_ids.get(reporter_email)
+            assignee_account_id = account_ids.get(assignee_email)
             
-            # Get reporter account ID
-            if reporter_email:
-                user_search = self.api_client.search_users(reporter_email)
-                if user_search and len(user_search) > 0:
-                    reporter_account_id = user_search[0].get('accountId')
-                else:
-                    messagebox.showwarning("Warning", f"Reporter '{reporter_email}' not found. Using current user.")
+            if reporter_email and not reporter_account_id:
+                messagebox.showwarning("Warning", f"Reporter '{reporter_email}' not found. Using current user.")
             
-            # Get assignee account ID if specified
-            if assignee_email:
-                user_search = self.api_client.search_users(assignee_email)
-                if user_search and len(user_search) > 0:
-                    assignee_account_id = user_search[0].get('accountId')
-                else:
-                    response = messagebox.askyesno("User Not Found", 
-                        f"Assignee '{assignee_email}' not found.\nCreate ticket unassigned?")
-                    if not response:
-                        return
+            if assignee_email and not assignee_account_id:
+                response = messagebox.askyesno("User Not Found", 
+                    f"Assignee '{assignee_email}' not found.\nCreate ticket unassigned?")
+                if not response:
+                    return
             
             # Create the ticket
             result = self.api_client.create_ticket(summary, description, issue_type_id, assignee_account_id)
@@ -229,41 +273,46 @@ class TicketOperationsManager:
             ticket_key = self.current_ticket.get('key')
             
             # Get image from clipboard
+            from PIL import ImageGrab
             img = ImageGrab.grabclipboard()
             
             if img is not None:
-                # Convert to bytes
-                img_bytes = io.BytesIO()
-                img.save(img_bytes, format='PNG')
-                img_bytes.seek(0)
-                
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                    temp_file.write(img_bytes.getvalue())
-                    temp_path = temp_file.name
-                
-                # Upload to Jira
-                result = self.api_client.add_attachment(ticket_key, temp_path)
-                
-                if result:
-                    messagebox.showinfo("Success", f"Screenshot attached to {ticket_key}")
-                    self.update_status(f"Screenshot attached to {ticket_key}")
-                else:
-                    messagebox.showerror("Error", "Failed to attach screenshot")
-                
-                # Clean up temp file
-                import os
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
-                    
+                # Encoding and upload run on the worker pool so the window stays responsive
+                self.api_client.executor.submit(self._upload_screenshot, img, ticket_key)
             else:
                 messagebox.showwarning("Warning", "No image found in clipboard. Copy an image first.")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to paste screenshot: {str(e)}")
     
+    def _upload_screenshot(self, img, ticket_key):
+        """Encode a clipboard image as PNG and attach it to a ticket (runs on a worker thread)"""
+        # Tk isn't thread-safe - every dialog and status update goes through the UI thread
+        ui = self.root_window.after
+        try:
+            # Low compress levels encode several times faster than the default for a somewhat larger file
+            compress_level = 0 if img.width * img.height <= SCREENSHOT_RAW_PNG_PIXELS else 1
+            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
+                img.save(temp_file, format='PNG', compress_level=compress_level)
+                temp_path = temp_file.name
+            
+            # Upload to Jira
+            result = self.api_client.add_attachment(ticket_key, temp_path)
+            
+            if result:
+                ui(0, messagebox.showinfo, "Success", f"Screenshot attached to {ticket_key}")
+                ui(0, self.update_status, f"Screenshot attached to {ticket_key}")
+            else:
+                ui(0, messagebox.showerror, "Error", "Failed to attach screenshot")
+            
+            # Clean up temp file
+            try:
+                os.unlink(temp_path)
+            except:
+                pass
+        except Exception as e:
+            ui(0, messagebox.showerror, "Error", f"Failed to paste screenshot: {str(e)}")
+    
     def attach_file(self, file_path):
         """Attach a file to the current ticket"""
         if not self.current_ticket:
@@ -82,9 +82,13 @@ class JiraTicketViewer:
         config_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
         
         ttk.Label(config_frame, text="Email:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.email_entry = ttk.Entry(config_frame, width=30)
-        self.email_entry.insert(0, DEFAULT_EMAIL)
+        # Rebuild the cached credentials on every edit (on the Tk thread), so buttons that don't
+        # take focus never run with the previous email
+        self.email_var = tk.StringVar(value=DEFAULT_EMAIL)
+        self.email_var.trace_add('write', lambda *args: self.api_client.refresh_auth())
+        self.email_entry = ttk.Entry(config_frame, width=30, textvariable=self.email_var)
         self.email_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
+        self.api_client.refresh_auth()
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
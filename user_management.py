@@ -6,11 +6,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import logging
+import atexit
+from functools import partial
 from utils import load_quick_mentions, save_quick_mentions, validate_email
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Quick mention edits made within this window are written to disk together (ms)
+QUICK_MENTIONS_SAVE_DELAY_MS = 500
+
 
 class UserManagementSystem:
     def __init__(self, api_client, status_callback):
@@ -28,6 +33,15 @@ class UserManagementSystem:
         self.quick_mentions = load_quick_mentions()
         self.quick_mentions_frame = None
         self.root_window = None
+        # Unsaved quick mention edits and the pending after() that will write them
+        self._quick_mentions_dirty = False
+        self._quick_mentions_save_id = None
+        # One button frame per quick mention, in the same order as quick_mentions,
+        # plus the mentions those buttons were built for (to spot edits made elsewhere)
+        self._quick_mention_frames = []
+        self._quick_mention_shown = []
+        # Don't lose an edit made just before the app closes
+        atexit.register(self.flush_quick_mentions)
     
     def set_root_window(self, root):
         """Set reference to root window"""
@@ -118,19 +132,20 @@ class UserManagementSystem:
                     parent_window.users_listbox.delete(0, tk.END)
 
                     if users:
-                        valid_users = 0
+                        rows = []
                         for user in users:
                             display_name = user.get('displayName', 'Unknown')
                             email = user.get('emailAddress', '')
                             logger.debug(f"Processing user: {display_name} - {email}")
 
                             if email:
-                                parent_window.users_listbox.insert(tk.END, f"{display_name} - {email}")
-                                valid_users += 1
+                                rows.append(f"{display_name} - {email}")
                             else:
                                 logger.warning(f"User {display_name} has no email address")
 
-                        logger.info(f"Added {valid_users} valid users to listbox")
+                        # One Tk call for the whole list instead of one per user
+                        parent_window.users_listbox.insert(tk.END, *rows)
+                        logger.info(f"Added {len(rows)} valid users to listbox")
 
                         if status_label:
                             status_label.config(text=f"Loaded {len(users)} project users")
@@ -195,19 +210,19 @@ class UserManagementSystem:
                         parent_window.users_listbox.delete(0, tk.END)
 
                         if users:
-                            valid_users = 0
+                            rows = []
                             for user in users:
                                 display_name = user.get('displayName', 'Unknown')
                                 email = user.get('emailAddress', '')
                                 logger.debug(f"Processing search result: {display_name} - {email}")
 
                                 if email:
-                                    parent_window.users_listbox.insert(tk.END, f"{display_name} - {email}")
-                                    valid_users += 1
+                                    rows.append(f"{display_name} - {email}")
                                 else:
                                     logger.warning(f"Search result {display_name} has no email address")
 
-                            logger.info(f"Added {valid_users} valid users to search results")
+                            parent_window.users_listbox.insert(tk.END, *rows)
+                            logger.info(f"Added {len(rows)} valid users to search results")
 
                             if status_label:
                                 status_label.config(text=f"Found {len(users)} users matching '{search_query}'")
@@ -242,6 +257,8 @@ class UserManagementSystem:
             return
         
         added_count = 0
+        # Keyed on email - mentions loaded from JSON are lists, so the pairs themselves aren't hashable
+        existing = {email for _, email in self.quick_mentions}
         for index in selection:
             user_text = listbox.get(index)
             
@@ -250,13 +267,14 @@ class UserManagementSystem:
                 name, email = user_text.split(' - ', 1)
                 
                 # Check if already exists
-                if (name, email) not in self.quick_mentions:
+                if email not in existing:
                     self.quick_mentions.append((name, email))
+                    existing.add(email)
                     added_count += 1
         
         if added_count > 0:
-            self.save_quick_mentions()
-            self.refresh_quick_mention_buttons()
+            self.schedule_save_quick_mentions()
+            self.add_quick_mention_buttons()
             messagebox.showinfo("Success", f"Added {added_count} users to quick mentions")
             window.destroy()
         else:
@@ -392,21 +410,45 @@ class UserManagementSystem:
         # Clear existing buttons
         for widget in self.quick_mentions_frame.winfo_children():
             widget.destroy()
+        self._quick_mention_frames = []
+        self._quick_mention_shown = []
         
         # Create buttons for quick mentions
-        for i, (name, email) in enumerate(self.quick_mentions):
+        self.add_quick_mention_buttons()
+    
+    def add_quick_mention_buttons(self):
+        """Create buttons only for quick mentions that don't have one yet (appended at the end)"""
+        if not self.quick_mentions_frame:
+            return
+        if self.quick_mentions[:len(self._quick_mention_shown)] != self._quick_mention_shown:
+            # The list was edited somewhere else (e.g. the manage dialog) - rebuild from scratch
+            self.refresh_quick_mention_buttons()
+            return
+        
+        for i in range(len(self._quick_mention_frames), len(self.quick_mentions)):
+            name, email = self.quick_mentions[i]
             btn_frame = ttk.Frame(self.quick_mentions_frame)
             btn_frame.grid(row=i // 3, column=i % 3, padx=(0, 5), pady=(0, 5), sticky=tk.W)
             
             # Mention button
             btn = ttk.Button(btn_frame, text=name[:15] + ("..." if len(name) > 15 else ""),
-                           command=lambda e=email: self.add_mention_callback(e))
+                           command=partial(self.on_quick_mention_click, email))
             btn.pack(side=tk.LEFT)
             
-            # Remove button (small)
+            # Remove button (small) - looks its position up on click since earlier removals shift it
             remove_btn = ttk.Button(btn_frame, text="✕", width=3,
-                                   command=lambda idx=i: self.remove_quick_mention(idx))
+                                   command=partial(self.remove_quick_mention_frame, btn_frame))
             remove_btn.pack(side=tk.LEFT, padx=(2, 0))
+            self._quick_mention_frames.append(btn_frame)
+            self._quick_mention_shown.append(self.quick_mentions[i])
+    
+    def on_quick_mention_click(self, email):
+        """Quick mention button handler (goes through add_mention_callback, which is set after the buttons exist)"""
+        self.add_mention_callback(email)
+    
+    def remove_quick_mention_frame(self, btn_frame):
+        """Remove the quick mention shown by btn_frame (its position shifts as others are removed)"""
+        self.remove_quick_mention(self._quick_mention_frames.index(btn_frame))
     
     def remove_quick_mention(self, index):
         """Remove a quick mention by index"""
@@ -415,13 +457,40 @@ class UserManagementSystem:
             result = messagebox.askyesno("Confirm", f"Remove {name} from quick mentions?")
             if result:
                 del self.quick_mentions[index]
-                self.save_quick_mentions()
-                self.refresh_quick_mention_buttons()
+                self.schedule_save_quick_mentions()
+                if self._quick_mention_shown[:index] + self._quick_mention_shown[index + 1:] != self.quick_mentions:
+                    self.refresh_quick_mention_buttons()
+                    return
+                # Drop just this button and shift the ones after it back a grid cell
+                del self._quick_mention_shown[index]
+                self._quick_mention_frames.pop(index).destroy()
+                for i in range(index, len(self._quick_mention_frames)):
+                    self._quick_mention_frames[i].grid(row=i // 3, column=i % 3)
     
     def save_quick_mentions(self):
         """Save quick mentions to file"""
+        if self._quick_mentions_save_id and self.root_window:
+            self.root_window.after_cancel(self._quick_mentions_save_id)
+        self._quick_mentions_save_id = None
+        self._quick_mentions_dirty = False
         save_quick_mentions(self.quick_mentions)
     
+    def schedule_save_quick_mentions(self):
+        """Mark quick mentions as changed and write them once edits settle"""
+        self._quick_mentions_dirty = True
+        if not self.root_window:
+            self.save_quick_mentions()
+        elif not self._quick_mentions_save_id:
+            self._quick_mentions_save_id = self.root_window.after(QUICK_MENTIONS_SAVE_DELAY_MS,
+                                                                  self.flush_quick_mentions)
+    
+    def flush_quick_mentions(self):
+        """Write quick mentions if there are unsaved edits"""
+        self._quick_mentions_save_id = None
+        if self._quick_mentions_dirty:
+            self._quick_mentions_dirty = False
+            save_quick_mentions(self.quick_mentions)
+    
     def load_quick_mentions(self):
         """Load quick mentions from file"""
         self.quick_mentions = load_quick_mentions()
@@ -21,20 +21,31 @@ def format_file_size(size_bytes):
     return f"{size_bytes:.1f} TB"
 
 
+# Parsed quick mentions per file, keyed by path -> (mtime, mentions)
+_quick_mentions_cache = {}
+
+
 def load_quick_mentions(file_path=None):
-    """Load quick mentions from file"""
+    """Load quick mentions from file (re-read only when the file changes)"""
     if not file_path:
         file_path = QUICK_MENTIONS_FILE
     
     try:
         if os.path.exists(file_path):
+            mtime = os.stat(file_path).st_mtime
+            cached = _quick_mentions_cache.get(file_path)
+            if cached and cached[0] == mtime:
+                return list(cached[1])
+            
             with open(file_path, 'r') as f:
-                return json.load(f)
+                mentions = json.load(f)
+            _quick_mentions_cache[file_path] = (mtime, mentions)
+            return list(mentions)
         else:
-            return DEFAULT_QUICK_MENTIONS
+            return list(DEFAULT_QUICK_MENTIONS)
     except Exception as e:
         print(f"Could not load quick mentions: {e}")
-        return DEFAULT_QUICK_MENTIONS
+        return list(DEFAULT_QUICK_MENTIONS)
 
 
 def save_quick_mentions(mentions, file_path=None):
@@ -43,8 +54,13 @@ def save_quick_mentions(mentions, file_path=None):
         file_path = QUICK_MENTIONS_FILE
     
     try:
-        with open(file_path, 'w') as f:
-            json.dump(mentions, f)
+        # Write a temp file and swap it in so a crash mid-write never leaves a truncated file
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(mentions, f, separators=(',', ':'))
+        os.replace(tmp_path, file_path)
+        # Keep the cache in step so the next load doesn't re-read what we just wrote
+        _quick_mentions_cache[file_path] = (os.stat(file_path).st_mtime, json.loads(json.dumps(mentions)))
         return True
     except Exception as e:
         print(f"Could not save quick mentions: {e}")
@@ -56,6 +72,10 @@ def format_datetime(datetime_str):
     if not datetime_str:
         return ""
     
+    # Jira timestamps start with YYYY-MM-DDTHH:MM - slicing avoids a full parse
+    if len(datetime_str) >= 16 and datetime_str[4] == '-' and datetime_str[10] == 'T':
+        return f"{datetime_str[:10]} {datetime_str[11:16]}"
+    
     try:
         # Parse ISO format datetime
         dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
@@ -101,6 +121,11 @@ def format_jira_text(text):
     return text
 
 
+def text_has_content(text_widget):
+    """Check whether a Text widget holds any characters without copying its contents"""
+    return text_widget.index('end-1c') != '1.0'
+
+
 def validate_email(email):
     """Validate email format"""
     if not email:
@@ -196,4 +221,30 @@ def extract_priority_order(priority_name):
         'lowest': 5
     }
     
-    return priority_map.get(priority_lower, 999)
\ No newline at end of file
+    return priority_map.get(priority_lower, 999)
+
+
+class TicketView:
+    """Display/filter values derived once from a raw Jira issue dict"""
+    __slots__ = ('key', 'type_name', 'summary', 'status_name', 'status_lower', 'priority',
+                 'reporter_email', 'reporter_name', 'assignee_email', 'assignee_name',
+                 'created_str', 'issue')
+    
+    def __init__(self, issue):
+        fields = issue.get('fields') or {}
+        reporter = fields.get('reporter') or {}
+        assignee = fields.get('assignee')
+        
+        self.key = issue.get('key', '')
+        self.type_name = (fields.get('issuetype') or {}).get('name', '')
+        self.summary = fields.get('summary') or ''
+        self.status_name = (fields.get('status') or {}).get('name', '')
+        self.status_lower = self.status_name.lower()
+        self.priority = (fields.get('priority') or {}).get('name', '')
+        self.reporter_email = reporter.get('emailAddress', '')
+        self.reporter_name = reporter.get('displayName', '')
+        # None means the ticket is unassigned
+        self.assignee_email = assignee.get('emailAddress', '') if assignee else None
+        self.assignee_name = assignee.get('displayName', '') if assignee else 'Unassigned'
+        self.created_str = (fields.get('created') or '')[:10]
+        self.issue = issue